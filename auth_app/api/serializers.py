@@ -9,7 +9,7 @@ from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 
 from auth_app.models import CustomUser
-from users_app.models import UserProfile
+from users_app.signals import ensure_profile
 
 
 class RegistrationSerializer(serializers.ModelSerializer):
@@ -53,14 +53,18 @@ class RegistrationSerializer(serializers.ModelSerializer):
     # ------------------------------------------------------------------ #
     @transaction.atomic
     def create(self, validated_data):
-        # 1) user
+        """
+        One INSERT each for user, profile and token.
+
+        The new token is cached as ``user.auth_token``, so callers can read
+        it without another query.
+        """
+        # 1) user (+ profile through the post_save signal)
         user = CustomUser.objects.create_user(**validated_data)
 
-        # 2) profile – keep type in sync with role
-        UserProfile.objects.update_or_create(
-            user=user, defaults={"type": user.role}
-        )
+        # 2) profile – no‑op unless the signal was bypassed
+        ensure_profile(user)
 
-        # 3) token
-        Token.objects.get_or_create(user=user)
+        # 3) token – the user is brand new, no lookup needed
+        Token.objects.create(user=user)
         return user
\ No newline at end of file
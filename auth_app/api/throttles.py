@@ -0,0 +1,63 @@
+"""
+Rate limits for the login endpoint.
+
+Both throttles run in ``APIView.initial`` – i.e. *before* ``authenticate()``
+hashes the submitted password – and use Django's default (local memory)
+cache.  Demo logins never hash a password and are not counted; they are
+recognised with exactly the conditions ``LoginView.post`` uses (no
+username and no password, with no role or a demo role – or a ``demo_*``
+username without a password).  Anything else reaches ``authenticate()``.  The shared guest
+accounts (``LoginView.GUEST_MAP``) are used by every visitor of the
+front‑end, so they are only limited per IP, not per username.
+
+Rates are configured via ``REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]``
+under the scopes ``login_ip`` and ``login_username``.
+"""
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+def _submitted(request, field: str, strip: bool = True) -> str:
+    data = request.data
+    if not hasattr(data, "get"):
+        return ""
+    value = str(data.get(field) or "")
+    return value.strip() if strip else value
+
+
+def _submitted_username(request) -> str:
+    return _submitted(request, "username").lower()
+
+
+def _is_demo_login(request, view) -> bool:
+    username = _submitted(request, "username")
+    if _submitted(request, "password", strip=False):  # the view does not strip it
+        return False
+    if not username:
+        role = (_submitted(request, "role") or _submitted(request, "type")).lower()
+        return not role or role in getattr(view, "DEMO_ROLES", ())
+    return username in getattr(view, "DEMO_USERNAMES", {})
+
+
+def _is_guest_login(request, view) -> bool:
+    return _submitted(request, "username") in getattr(view, "GUEST_MAP", {})
+
+
+class LoginIPThrottle(SimpleRateThrottle):
+    """Limit credential logins per client IP."""
+    scope = "login_ip"
+
+    def get_cache_key(self, request, view):
+        if _is_demo_login(request, view):
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginUsernameThrottle(SimpleRateThrottle):
+    """Limit credential logins per target username (from any IP)."""
+    scope = "login_username"
+
+    def get_cache_key(self, request, view):
+        if _is_demo_login(request, view) or _is_guest_login(request, view):
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": _submitted_username(request)}
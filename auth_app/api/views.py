@@ -7,13 +7,16 @@ POST /api/registration/   – create a new account, return auth token
 POST /api/login/          – unified login (regular + demo + guest)
 """
 from django.contrib.auth import get_user_model, authenticate
+from django.utils.crypto import constant_time_compare
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, parsers
 from rest_framework.authtoken.models import Token
 
-from users_app.models import UserProfile
+from auth_app.demo import demo_payload, demo_payloads
+from core.db_router import pin_token
 from .serializers import RegistrationSerializer
+from .throttles import LoginIPThrottle, LoginUsernameThrottle
 
 User = get_user_model()
 
@@ -30,43 +33,6 @@ class LenientJSONParser(parsers.JSONParser):
             return {}  # silently swallow parse errors
 
 
-def _ensure_profile(user: User, role: str) -> None:
-    """
-    Guarantee that exactly one `UserProfile` exists and its `type`
-    matches the user’s role (`customer` / `business`).
-    """
-    UserProfile.objects.update_or_create(
-        user=user,
-        defaults={"type": role},
-    )
-
-
-def _demo_payload(role: str) -> dict:
-    """
-    Return a ready‑to‑use demo token payload for the given `role`.
-    A demo user + profile are created on first use.
-    """
-    username = f"demo_{role}"
-    defaults = {"email": f"{username}@example.com"}
-    if hasattr(User, "role"):
-        defaults["role"] = role
-
-    user, created = User.objects.get_or_create(username=username, defaults=defaults)
-    if created:
-        user.set_password("demo123")
-        user.save()
-    _ensure_profile(user, role)
-
-    token, _ = Token.objects.get_or_create(user=user)
-    return {
-        "token": token.key,
-        "username": user.username,
-        "email": user.email,
-        "user_id": user.id,
-        "role": role,
-    }
-
-
 # -------------------------------------------------------------------------
 # Views
 # -------------------------------------------------------------------------
@@ -79,13 +45,11 @@ class RegistrationView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        user = serializer.save()
-        _ensure_profile(user, getattr(user, "role", "customer"))
-
-        token, _ = Token.objects.get_or_create(user=user)
+        user = serializer.save()  # user, profile and token in one transaction
+        pin_token(user.auth_token.key)  # follow‑up GETs read the new rows
         return Response(
             {
-                "token": token.key,
+                "token": user.auth_token.key,
                 "username": user.username,
                 "email": user.email,
                 "user_id": user.id,
@@ -105,13 +69,18 @@ class LoginView(APIView):
     2. **Only `role`/`type` field** → single demo token for that role
     3. **Username `demo_*`**        → demo token (no password)
     4. **Guest creds `kevin/andrey`**
-       – default password is used when omitted
-       – user & profile are created/updated as needed
+       – only the fixed guest password (or none) is accepted
+       – user is created/repaired with that password (profile via signal)
     5. **Regular username+password**
+
+    Credential logins are rate‑limited per IP and per username (HTTP 429)
+    before any password is hashed; demo logins are exempt and the shared
+    guest accounts are limited per IP only (see ``.throttles``).
     """
     parser_classes = [LenientJSONParser, parsers.FormParser]
     authentication_classes = []
     permission_classes = []
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
 
     # (front‑end) guest users
     GUEST_MAP = {
@@ -124,6 +93,7 @@ class LoginView(APIView):
     # ---------------------------------------------------------------------
     def _token_response(self, user: User) -> Response:
         token, _ = Token.objects.get_or_create(user=user)
+        pin_token(token.key)
         return Response(
             {
                 "token": token.key,
@@ -135,16 +105,17 @@ class LoginView(APIView):
             status=status.HTTP_200_OK,
         )
 
-    def _ensure_guest_user(self, username: str, password: str, role: str) -> User:
+    def _ensure_guest_user(self, username: str, role: str) -> User:
+        _, password = self.GUEST_MAP[username]
         defaults = {"email": f"{username}@example.com"}
         if hasattr(User, "role"):
             defaults["role"] = role
 
-        user, created = User.objects.get_or_create(username=username, defaults=defaults)
-        if created or not user.check_password(password):
-            user.set_password(password)
-            user.save()
-        _ensure_profile(user, role)
+        # only called after authenticate() with the guest password failed
+        # → missing user or a drifted hash; reset it to the fixed password
+        user, _ = User.objects.get_or_create(username=username, defaults=defaults)
+        user.set_password(password)
+        user.save()
         return user
 
     # ---------------------------------------------------------------------
@@ -158,37 +129,39 @@ class LoginView(APIView):
         # 1) completely empty body  ---------------------------------------
         if not username and not password and not role:
             return Response(
-                {
-                    "business": _demo_payload("business"),
-                    "customer": _demo_payload("customer"),
-                },
+                demo_payloads("business", "customer"),
                 status=status.HTTP_200_OK,
             )
 
         # 2) only role/type  ----------------------------------------------
         if role in self.DEMO_ROLES and not username and not password:
-            return Response(_demo_payload(role), status=status.HTTP_200_OK)
+            return Response(demo_payload(role), status=status.HTTP_200_OK)
 
         # 3) demo username without pwd  -----------------------------------
         if username in self.DEMO_USERNAMES and not password:
             return Response(
-                _demo_payload(self.DEMO_USERNAMES[username]),
+                demo_payload(self.DEMO_USERNAMES[username]),
                 status=status.HTTP_200_OK,
             )
 
         # 4) guest credentials  -------------------------------------------
         if username in self.GUEST_MAP:
-            expected_role, default_pw = self.GUEST_MAP[username]
-            pwd = password or default_pw
-            user = authenticate(username=username, password=pwd)
+            expected_role, guest_pw = self.GUEST_MAP[username]
+            # never hash or store a caller‑supplied password for the shared accounts
+            if password and not constant_time_compare(password, guest_pw):
+                return Response(
+                    {"error": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST
+                )
+            user = authenticate(username=username, password=guest_pw)
             if not user:
-                user = self._ensure_guest_user(username, pwd, expected_role)
+                user = self._ensure_guest_user(username, expected_role)
             return self._token_response(user)
 
         # 5) regular login  -----------------------------------------------
+        # no profile reconciliation here – the profile is guaranteed at
+        # registration / by the post_save signal, so logins stay read‑only
         user = authenticate(username=username, password=password)
         if user:
-            _ensure_profile(user, getattr(user, "role", "customer"))
             return self._token_response(user)
 
         return Response(
@@ -0,0 +1,170 @@
+"""
+Token authentication with a per‑process snapshot cache.
+
+DRF's ``TokenAuthentication`` runs ``Token.objects.select_related("user")``
+on every API call.  :class:`CachedTokenAuthentication` keeps a snapshot
+of the user row – every concrete field except ``password`` – per token key
+in a bounded LRU with TTL and rebuilds ``request.user`` from it without
+touching the DB.
+
+Only ``password`` stays deferred (loaded on first access); views and
+serializers read everything else from the snapshot.
+
+Entries are dropped when the token is deleted or the user is saved or
+deleted (see ``auth_app.signals``).  Other processes notice such changes
+after at most ``TTL`` seconds.
+
+Settings (all optional)::
+
+    TOKEN_AUTH_CACHE = {"MAX_SIZE": 1024, "TTL": 60}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+
+UNCACHED_FIELDS = {"password"}
+
+
+@cache
+def snapshot_fields() -> tuple[str, ...]:
+    """Concrete user fields kept in the snapshot."""
+    return tuple(
+        f.attname for f in get_user_model()._meta.concrete_fields
+        if f.attname not in UNCACHED_FIELDS
+    )
+
+
+class TokenSnapshotCache:
+    """Thread‑safe LRU mapping ``token key → user snapshot`` with TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, snapshot = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return snapshot
+
+    def set(self, key: str, snapshot: dict) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, snapshot)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def invalidate_key(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_user(self, user_id) -> None:
+        with self._lock:
+            stale = [k for k, (_, s) in self._data.items() if s["id"] == user_id]
+            for key in stale:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _build_cache() -> TokenSnapshotCache:
+    options = getattr(settings, "TOKEN_AUTH_CACHE", {})
+    return TokenSnapshotCache(
+        max_size=options.get("MAX_SIZE", 1024),
+        ttl=options.get("TTL", 60),
+    )
+
+
+token_cache = _build_cache()
+
+
+def _deferred_instance(model, data: dict):
+    """
+    Build a *model* instance from *data*; all other fields stay deferred.
+
+    ``Model.from_db`` expects the values in concrete‑field order.  The
+    instance is bound to the alias the router reads *model* from, so
+    deferred loads go to the same database as a regular query would.
+    """
+    names = [f.attname for f in model._meta.concrete_fields if f.attname in data]
+    return model.from_db(router.db_for_read(model), names, [data[n] for n in names])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Drop‑in replacement for ``TokenAuthentication`` backed by ``token_cache``."""
+
+    def authenticate_credentials(self, key):
+        snapshot = token_cache.get(key)
+        if snapshot is None:
+            snapshot = self._load_snapshot(key)
+            token_cache.set(key, snapshot)
+        return self._from_snapshot(key, snapshot)
+
+    async def aauthenticate(self, request):
+        """
+        Async counterpart of ``authenticate`` for plain Django async views
+        (DRF's ``APIView`` is sync only).  Returns ``(user, token)`` or
+        ``None`` when no token header is present.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed(_("Invalid token header."))
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(_("Invalid token header."))
+
+        snapshot = token_cache.get(key)
+        if snapshot is None:
+            snapshot = await self._aload_snapshot(key)
+            token_cache.set(key, snapshot)
+        return self._from_snapshot(key, snapshot)
+
+    @staticmethod
+    def _from_snapshot(key: str, snapshot: dict):
+        if not snapshot["is_active"]:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        user = _deferred_instance(get_user_model(), snapshot)
+        token = _deferred_instance(Token, {"key": key, "user_id": snapshot["id"]})
+        return user, token
+
+    @staticmethod
+    def _snapshot_query(key: str):
+        return Token.objects.filter(key=key).values(*(f"user__{f}" for f in snapshot_fields()))
+
+    @staticmethod
+    def _to_snapshot(row) -> dict:
+        if row is None:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        return {f: row[f"user__{f}"] for f in snapshot_fields()}
+
+    @classmethod
+    def _load_snapshot(cls, key: str) -> dict:
+        return cls._to_snapshot(cls._snapshot_query(key).first())
+
+    @classmethod
+    async def _aload_snapshot(cls, key: str) -> dict:
+        return cls._to_snapshot(await cls._snapshot_query(key).afirst())
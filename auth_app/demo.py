@@ -0,0 +1,86 @@
+"""
+Demo accounts (``demo_business`` / ``demo_customer``) for the login page.
+
+The accounts are provisioned once by ``manage.py create_demo_accounts``;
+the login endpoint only reads their token payloads, which are cached in
+Django's cache afterwards.  If an account is missing (fresh database), it
+is created on first use as before.
+
+The cached payloads are dropped by ``auth_app.signals`` whenever a demo
+user is saved or one of its tokens is deleted.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+DEMO_ROLES = ("business", "customer")
+DEMO_PASSWORD = "demo123"
+CACHE_KEY = "auth_app:demo_payload:{role}"
+CACHE_TIMEOUT = 60 * 60
+
+User = get_user_model()
+
+
+def demo_username(role: str) -> str:
+    return f"demo_{role}"
+
+
+def is_demo_username(username: str) -> bool:
+    return username in {demo_username(r) for r in DEMO_ROLES}
+
+
+@transaction.atomic
+def ensure_demo_account(role: str) -> Token:
+    """Create the demo user (+ profile via signal) and its token if missing."""
+    username = demo_username(role)
+    user, created = User.objects.get_or_create(
+        username=username,
+        defaults={"email": f"{username}@example.com", "role": role},
+    )
+    if created:
+        user.set_password(DEMO_PASSWORD)
+        user.save(update_fields=["password"])
+    token, _ = Token.objects.get_or_create(user=user)
+    return token
+
+
+def _load_payload(role: str) -> dict:
+    """Read the payload with one query; provision the account if needed."""
+    token = (
+        Token.objects.select_related("user")
+        .filter(user__username=demo_username(role))
+        .first()
+    )
+    if token is None:
+        token = ensure_demo_account(role)
+    return {
+        "token": token.key,
+        "username": token.user.username,
+        "email": token.user.email,
+        "user_id": token.user.id,
+        "role": role,
+    }
+
+
+def demo_payloads(*roles: str) -> dict[str, dict]:
+    """Return ``{role: payload}``; a warm cache answers with one lookup."""
+    keys = {role: CACHE_KEY.format(role=role) for role in roles}
+    cached = cache.get_many(keys.values())
+    payloads = {}
+    for role, key in keys.items():
+        payload = cached.get(key)
+        if payload is None:
+            payload = _load_payload(role)
+            cache.set(key, payload, CACHE_TIMEOUT)
+        payloads[role] = payload
+    return payloads
+
+
+def demo_payload(role: str) -> dict:
+    return demo_payloads(role)[role]
+
+
+def invalidate_demo_payloads() -> None:
+    cache.delete_many([CACHE_KEY.format(role=role) for role in DEMO_ROLES])
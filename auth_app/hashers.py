@@ -0,0 +1,27 @@
+"""
+Password hasher with a configurable PBKDF2 work factor.
+
+Django's default PBKDF2 iteration count dominates the CPU cost of every
+login.  ``TunedPBKDF2PasswordHasher`` keeps the same algorithm name
+(``pbkdf2_sha256``) but reads its iteration count from
+``settings.PASSWORD_HASHER_ITERATIONS``.  Because the count is stored in
+each hash, existing passwords keep verifying.  Hashes are only re‑encoded
+on login when they use *fewer* rounds than configured – stronger hashes
+(e.g. Django's 1 000 000 rounds) are never weakened.
+
+Enable it with ``PASSWORD_HASHER_PROFILE = "tuned"`` (see ``core.settings``).
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2‑SHA256 with ``PASSWORD_HASHER_ITERATIONS`` rounds."""
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_HASHER_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+    def must_update(self, encoded):
+        return self.decode(encoded)["iterations"] < self.iterations
@@ -0,0 +1,20 @@
+"""
+Provision the demo accounts used by the empty‑body / role‑only login.
+
+Run once per deployment (idempotent) so that demo logins are pure reads.
+"""
+
+from django.core.management.base import BaseCommand
+
+from auth_app.demo import DEMO_ROLES, ensure_demo_account, invalidate_demo_payloads
+
+
+class Command(BaseCommand):
+    help = "Create demo_business / demo_customer users with profile and token."
+
+    def handle(self, *args, **options):
+        for role in DEMO_ROLES:
+            token = ensure_demo_account(role)
+            self.stdout.write(f"{token.user.username}: token {token.key}")
+        invalidate_demo_payloads()
+        self.stdout.write(self.style.SUCCESS("Demo accounts ready."))
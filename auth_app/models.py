@@ -2,6 +2,8 @@ from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core_utils.models import TracksLoadedValues
+
 
 class CustomUserManager(BaseUserManager):
     """User‑Manager, der sowohl normale User als auch Super‑User erstellt."""
@@ -32,7 +34,7 @@ class CustomUserManager(BaseUserManager):
         return self.create_user(username, email, password, **extra)
 
 
-class CustomUser(AbstractUser):
+class CustomUser(TracksLoadedValues, AbstractUser):
     """Erweitertes User‑Modell mit Rollenfeld."""
 
     class Roles(models.TextChoices):
@@ -48,5 +50,13 @@ class CustomUser(AbstractUser):
     # Unser eigener Manager
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Profil‑Listen & ‑Lookups filtern fast immer auf `role`;
+            # deckt als Präfix auch reine `role`‑Filter ab.  `username`‑Refs
+            # sind exakt (case‑sensitiv) → der Unique‑Index genügt
+            models.Index(fields=["role", "id"], name="user_role_id_idx"),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
\ No newline at end of file
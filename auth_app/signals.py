@@ -0,0 +1,28 @@
+"""
+Keep the token snapshot cache of ``auth_app.authentication`` and the demo
+login payloads of ``auth_app.demo`` consistent.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import token_cache
+from auth_app.demo import invalidate_demo_payloads, is_demo_username
+from auth_app.models import CustomUser
+
+
+@receiver(post_delete, sender=Token)
+def drop_cached_token(sender, instance: Token, **kwargs):
+    """Forget a deleted token immediately."""
+    token_cache.invalidate_key(instance.key)
+    invalidate_demo_payloads()  # cheap; the token may have been a demo one
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def drop_cached_user(sender, instance: CustomUser, **kwargs):
+    """Role, staff or active flag may have changed – drop all its tokens."""
+    token_cache.invalidate_user(instance.pk)
+    if is_demo_username(instance.username):
+        invalidate_demo_payloads()
@@ -0,0 +1,383 @@
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.authentication import TokenSnapshotCache, token_cache
+from auth_app.models import CustomUser
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    """
+    Tests for the token → user snapshot cache used for every API call.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Create a business user with a token and an authenticated client.
+        """
+        token_cache.clear()
+        self.user = CustomUser.objects.create_user(
+            username="cache_biz", password="testpass123", role="business"
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.url = reverse("user-profile-universal-detail", kwargs={"ref": "cache_biz"})
+
+    def test_second_request_skips_token_query(self, django_assert_num_queries):
+        """
+        Only the first request looks up the token; then it is a cache hit.
+        """
+        with django_assert_num_queries(2):
+            assert self.client.get(self.url).status_code == 200
+        with django_assert_num_queries(1):
+            assert self.client.get(self.url).status_code == 200
+
+    def test_deleted_token_is_rejected(self):
+        """
+        Deleting the token invalidates the cache entry immediately.
+        """
+        self.client.get(self.url)
+        self.token.delete()
+        assert self.client.get(self.url).status_code == 401
+
+    def test_deactivated_user_is_rejected(self):
+        """
+        Saving the user drops its cached snapshot.
+        """
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        assert self.client.get(self.url).status_code == 401
+
+    def test_role_change_is_picked_up(self):
+        """
+        Permission checks see the new role after the user is saved.
+        """
+        self.client.get(self.url)
+        self.user.role = "customer"
+        self.user.save()
+        response = self.client.post(reverse("offer-list-create"), {}, format="json")
+        assert response.status_code == 403
+
+    def test_snapshot_user_has_all_fields_but_password(self, django_assert_num_queries):
+        """
+        Fields read by views come from the snapshot; only the password is deferred.
+        """
+        from auth_app.authentication import CachedTokenAuthentication
+
+        user, token = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        assert user.get_deferred_fields() == {"password"}
+        with django_assert_num_queries(0):
+            assert user == self.user and user.role == "business"
+            assert (user.username, user.email, user.is_superuser) == ("cache_biz", "", False)
+        assert user.check_password("testpass123")
+        assert token.key == self.token.key
+
+
+class TestTokenSnapshotCache:
+    """
+    Unit tests for the bounded LRU with TTL.
+    """
+
+    def test_lru_eviction(self):
+        """
+        The least recently used key is evicted first.
+        """
+        cache = TokenSnapshotCache(max_size=2, ttl=60)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2})
+        cache.get("a")
+        cache.set("c", {"id": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": 1}
+
+    def test_ttl_expiry(self, monkeypatch):
+        """
+        Entries older than the TTL are treated as missing.
+        """
+        import auth_app.authentication as authentication
+
+        now = [1000.0]
+        monkeypatch.setattr(authentication.time, "monotonic", lambda: now[0])
+        cache = TokenSnapshotCache(max_size=2, ttl=5)
+        cache.set("a", {"id": 1})
+        now[0] += 6
+        assert cache.get("a") is None
+
+    def test_invalidate_user(self):
+        """
+        All keys of one user are dropped together.
+        """
+        cache = TokenSnapshotCache()
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 1})
+        cache.set("c", {"id": 2})
+        cache.invalidate_user(1)
+        assert cache.get("a") is None and cache.get("b") is None
+        assert cache.get("c") == {"id": 2}
+
+
+@pytest.mark.django_db
+class TestDemoLogin:
+    """
+    Tests for the cached demo payloads of the login endpoint.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Start every test with a cold demo cache.
+        """
+        from auth_app.demo import invalidate_demo_payloads
+
+        invalidate_demo_payloads()
+        self.client = APIClient()
+        self.url = reverse("login")
+
+    def test_empty_body_returns_both_demo_tokens(self):
+        """
+        Accounts are provisioned lazily on a fresh database.
+        """
+        response = self.client.post(self.url, {}, format="json")
+        assert response.status_code == 200
+        assert set(response.data) == {"business", "customer"}
+        assert response.data["business"]["username"] == "demo_business"
+        assert CustomUser.objects.get(username="demo_customer").role == "customer"
+
+    def test_provisioned_demo_login_is_read_only(self, django_assert_num_queries):
+        """
+        After `create_demo_accounts` a cold login reads, a warm one is free.
+        """
+        from django.core.management import call_command
+
+        call_command("create_demo_accounts")
+        with django_assert_num_queries(2):
+            self.client.post(self.url, {}, format="json")
+        with django_assert_num_queries(0):
+            response = self.client.post(self.url, {"role": "business"}, format="json")
+        assert response.data["token"] == Token.objects.get(user__username="demo_business").key
+
+    def test_deleted_demo_token_is_not_served_from_cache(self):
+        """
+        Deleting a demo token drops the cached payloads.
+        """
+        old = self.client.post(self.url, {"username": "demo_customer"}, format="json")
+        Token.objects.filter(key=old.data["token"]).delete()
+        new = self.client.post(self.url, {"username": "demo_customer"}, format="json")
+        assert new.data["token"] != old.data["token"]
+        assert Token.objects.filter(key=new.data["token"]).exists()
+
+
+@pytest.mark.django_db
+class TestLoginThrottle:
+    """
+    Tests for the per‑IP / per‑username login rate limits.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """
+        Use tiny rates so the limits are reached quickly.
+        """
+        from rest_framework.throttling import SimpleRateThrottle
+
+        rates = {"login_ip": "5/min", "login_username": "2/min"}
+        monkeypatch.setattr(SimpleRateThrottle, "THROTTLE_RATES", rates)
+
+    def _login(self, username, password="wrong", ip="10.0.0.1"):
+        client = APIClient(REMOTE_ADDR=ip)
+        return client.post(reverse("login"), {"username": username, "password": password}, format="json")
+
+    def test_username_limit_rejects_before_hashing(self, monkeypatch):
+        """
+        The third attempt for one username is rejected without authenticate().
+        """
+        import auth_app.api.views as views
+
+        assert self._login("victim").status_code == 400
+        assert self._login("victim", ip="10.0.0.2").status_code == 400
+
+        monkeypatch.setattr(views, "authenticate", lambda **kw: pytest.fail("hashed"))
+        assert self._login("victim", ip="10.0.0.3").status_code == 429
+
+    def test_ip_limit(self):
+        """
+        One IP may not spray many usernames.
+        """
+        codes = [self._login(f"user{i}").status_code for i in range(6)]
+        assert codes[:5] == [400] * 5
+        assert codes[5] == 429
+
+    def test_demo_login_is_not_throttled(self):
+        """
+        Empty‑body demo logins carry no username and are never counted.
+        """
+        client = APIClient(REMOTE_ADDR="10.0.0.9")
+        codes = {client.post(reverse("login"), {}, format="json").status_code for _ in range(7)}
+        assert codes == {200}
+
+    def test_demo_username_login_is_not_throttled(self):
+        """
+        ``demo_*`` logins without a password never hash and are not counted.
+        """
+        codes = {self._login("demo_customer", password="").status_code for _ in range(7)}
+        assert codes == {200}
+
+    @pytest.mark.parametrize("body", [{"password": "x"}, {"password": "x", "role": "business"}, {"role": "admin"}])
+    def test_bodies_without_username_are_throttled(self, body):
+        """
+        Only the view's demo branches are exempt; these reach authenticate().
+        """
+        client = APIClient(REMOTE_ADDR="10.0.0.7")
+        codes = [client.post(reverse("login"), body, format="json").status_code for _ in range(6)]
+        assert codes[0] == 400
+        assert codes[-1] == 429
+
+    def test_guest_login_is_only_limited_per_ip(self, settings):
+        """
+        The shared guest account keeps working for many visitors.
+        """
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        codes = [self._login("kevin", password="", ip=f"10.0.1.{i}").status_code for i in range(4)]
+        assert codes == [200] * 4
+
+
+@pytest.mark.django_db
+class TestGuestLogin:
+    """
+    Tests for the shared guest accounts.
+    """
+
+    @pytest.fixture(autouse=True)
+    def fast_hasher(self, settings):
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    def _login(self, **body):
+        return APIClient().post(reverse("login"), body, format="json")
+
+    def test_guest_is_created_with_the_fixed_password(self):
+        assert self._login(username="kevin").status_code == 200
+        assert CustomUser.objects.get(username="kevin").check_password("asdasd24")
+
+    def test_wrong_password_is_rejected_without_hashing_or_writing(self, monkeypatch, django_assert_num_queries):
+        import auth_app.api.views as views
+
+        self._login(username="kevin")
+        monkeypatch.setattr(views, "authenticate", lambda **kw: pytest.fail("hashed"))
+        with django_assert_num_queries(0):
+            response = self._login(username="kevin", password="hijack")
+        assert response.status_code == 400
+        assert CustomUser.objects.get(username="kevin").check_password("asdasd24")
+
+    def test_drifted_guest_password_is_repaired(self):
+        CustomUser.objects.create_user(username="andrey", password="changed", role="customer")
+        assert self._login(username="andrey", password="asdasd").status_code == 200
+        assert CustomUser.objects.get(username="andrey").check_password("asdasd")
+
+
+class TestTunedHasher:
+    """
+    Tests for the configurable PBKDF2 work factor.
+    """
+
+    def test_iterations_follow_setting(self, settings):
+        """
+        The tuned hasher encodes PASSWORD_HASHER_ITERATIONS and verifies
+        hashes created with the default work factor.
+        """
+        from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password, make_password
+
+        legacy = PBKDF2PasswordHasher().encode("secret", "salt1234salt")
+        settings.PASSWORD_HASHER_ITERATIONS = 1000
+        settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES["tuned"]
+
+        encoded = make_password("secret")
+        assert encoded.startswith("pbkdf2_sha256$1000$")
+        assert check_password("secret", encoded)
+        assert check_password("secret", legacy)
+
+    def test_stronger_hashes_are_not_reencoded(self, settings):
+        """
+        Only hashes with fewer rounds than configured are upgraded.
+        """
+        from django.contrib.auth.hashers import PBKDF2PasswordHasher
+        from auth_app.hashers import TunedPBKDF2PasswordHasher
+
+        settings.PASSWORD_HASHER_ITERATIONS = 2000
+        hasher = TunedPBKDF2PasswordHasher()
+        assert not hasher.must_update(PBKDF2PasswordHasher().encode("secret", "salt1234salt"))
+        assert hasher.must_update(hasher.encode("secret", "salt1234salt", iterations=1000))
+
+
+@pytest.mark.django_db
+class TestLoginIsReadOnly:
+    """
+    A regular login of a consistent user must not write to the database.
+    """
+
+    def test_regular_login_only_selects(self, settings):
+        """
+        No profile reconciliation (UPDATE) on login.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        user = CustomUser.objects.create_user(username="ro_user", password="pw-123456")
+        Token.objects.create(user=user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = APIClient().post(
+                reverse("login"), {"username": "ro_user", "password": "pw-123456"}, format="json"
+            )
+        assert response.status_code == 200
+        assert all(q["sql"].startswith("SELECT") for q in ctx.captured_queries)
+
+    def test_registration_creates_single_profile(self):
+        """
+        Registration still leaves exactly one profile behind.
+        """
+        from users_app.models import UserProfile
+
+        response = APIClient().post(
+            reverse("registration"),
+            {
+                "username": "new_biz",
+                "email": "new_biz@example.com",
+                "password": "pw-123456",
+                "repeated_password": "pw-123456",
+                "type": "business",
+            },
+            format="json",
+        )
+        assert response.status_code == 201
+        assert UserProfile.objects.filter(user__username="new_biz").count() == 1
+
+    def test_registration_inserts_each_row_once(self):
+        """
+        User, profile and token are inserted exactly once, the token is
+        never looked up again.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = APIClient().post(
+                reverse("registration"),
+                {
+                    "username": "pipeline",
+                    "email": "pipeline@example.com",
+                    "password": "pw-123456",
+                    "repeated_password": "pw-123456",
+                },
+                format="json",
+            )
+        assert response.data["token"] == Token.objects.get(user__username="pipeline").key
+        sql = [q["sql"] for q in ctx.captured_queries]
+        for table in ("auth_app_customuser", "users_app_userprofile", "authtoken_token"):
+            assert sum(s.startswith(f'INSERT INTO "{table}"') for s in sql) == 1
+        assert not any(s.startswith("SELECT") and "authtoken_token" in s for s in sql)
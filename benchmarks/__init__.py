@@ -0,0 +1,6 @@
+"""
+Micro‑benchmarks for hot API paths.
+
+Run from the project root, e.g. ``python -m benchmarks.bench_login``.
+Every script boots Django against a throw‑away test database.
+"""
@@ -0,0 +1,58 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import logging
+import os
+import time
+
+
+def setup_django(test_db: bool = True):
+    """Configure Django and (optionally) create a throw‑away test database."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    import django
+
+    django.setup()
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    logging.getLogger("django.request").setLevel(logging.ERROR)  # 4xx noise
+    if test_db:
+        from django.db import connection
+
+        connection.creation.create_test_db(verbosity=0)
+
+
+def use_database_file(path, **overrides):
+    """
+    Point the ``default`` alias at a fresh SQLite file and migrate it.
+
+    Unlike the in‑memory test DB, a file survives connections being closed
+    and can be shared by several threads.  *overrides* are applied to the
+    connection settings (e.g. ``OPTIONS``, ``CONN_MAX_AGE``).
+    """
+    from django.core.management import call_command
+    from django.db import connections
+
+    connections.close_all()
+    db = connections.settings["default"]
+    db.update(NAME=str(path), **overrides)
+    call_command("migrate", verbosity=0)
+
+
+def measure(fn, repeat: int) -> float:
+    """Run *fn* *repeat* times and return calls per second."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    return repeat / elapsed if elapsed else float("inf")
+
+
+def report(title: str, rows: list[tuple[str, float, str]]) -> None:
+    """Print ``(label, value, unit)`` rows as a small aligned table."""
+    print(f"\n{title}")
+    print("-" * len(title))
+    width = max(len(label) for label, _, _ in rows)
+    for label, value, unit in rows:
+        print(f"{label:<{width}}  {value:>12,.1f} {unit}")
@@ -0,0 +1,125 @@
+"""
+Concurrent throughput of the read endpoints: WSGI (sync views, one thread
+per in‑flight request) vs. ASGI (native async views from
+``core.asgi_urls``, one event loop).
+
+    python -m benchmarks.bench_asgi [--requests 400] [--concurrency 16]
+
+Both handlers are driven in‑process – no server, no sockets – so the
+numbers compare Django's request paths, not a particular server.  With
+SQLite every ORM call still runs in a worker thread under ASGI, and the
+async views come out well behind the sync ones – which is why
+``core.asgi_urls`` is opt‑in (``ASYNC_VIEWS=1``).
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._django import report, setup_django
+
+
+def _seed():
+    from rest_framework.authtoken.models import Token
+
+    from auth_app.models import CustomUser
+    from stats_app.models import PlatformStats
+
+    biz = [
+        CustomUser.objects.create_user(username=f"bench_asgi_biz{i}", password="pw", role="business")
+        for i in range(20)
+    ]
+    cust = CustomUser.objects.create_user(username="bench_asgi_cust", password="pw", role="customer")
+    PlatformStats.refresh()
+    return biz[0].id, Token.objects.create(user=cust).key
+
+
+def _wsgi_rate(paths, headers, requests, concurrency) -> float:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.test import RequestFactory
+
+    app = WSGIHandler()
+    factory = RequestFactory()
+
+    def call(i):
+        environ = factory._base_environ(
+            PATH_INFO=paths[i % len(paths)], REQUEST_METHOD="GET", **headers
+        )
+        statuses = []
+        body = app(environ, lambda status, response_headers: statuses.append(status))
+        b"".join(body)
+        assert statuses[0].startswith("200"), statuses
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(call, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def _asgi_rate(paths, token, requests, concurrency) -> float:
+    from django.core.handlers.asgi import ASGIHandler
+
+    app = ASGIHandler()
+    headers = [(b"authorization", f"Token {token}".encode())]
+
+    async def call(i, gate):
+        async with gate:
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+                "method": "GET", "scheme": "http", "path": paths[i % len(paths)],
+                "raw_path": b"", "query_string": b"", "root_path": "",
+                "headers": headers, "server": ("testserver", 80), "client": ("127.0.0.1", 0),
+            }
+
+            messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await asyncio.Event().wait()  # no disconnect; cancelled by Django
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    assert message["status"] == 200, message
+
+            await app(scope, receive, send)
+
+    async def run():
+        gate = asyncio.Semaphore(concurrency)
+        start = time.perf_counter()
+        await asyncio.gather(*(call(i, gate) for i in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import override_settings
+
+    biz_id, token = _seed()
+    endpoints = {
+        "base-info": ["/api/base-info/"],
+        "order-count": [f"/api/order-count/{biz_id}/"],
+        "business profiles": ["/api/profiles/business/"],
+    }
+
+    rows = []
+    for name, paths in endpoints.items():
+        rate = _wsgi_rate(paths, {"HTTP_AUTHORIZATION": f"Token {token}"}, args.requests, args.concurrency)
+        rows.append((f"WSGI: {name}", rate, "req/s"))
+        with override_settings(ROOT_URLCONF="core.asgi_urls"):
+            rate = _asgi_rate(paths, token, args.requests, args.concurrency)
+        rows.append((f"ASGI: {name}", rate, "req/s"))
+
+    report(f"Concurrent reads ({args.concurrency} in flight)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Requests per second with and without database connection reuse.
+
+    python -m benchmarks.bench_connections [--requests 1000]
+
+Requests go through Django's ``WSGIHandler`` – unlike the test client it
+fires ``request_finished``, which closes connections older than
+``CONN_MAX_AGE``.  ``CONN_MAX_AGE=0`` therefore opens a new connection
+(and runs the SQLite pragmas) per request; ``60`` reuses one.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from benchmarks._django import measure, report, setup_django, use_database_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django(test_db=False)
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+    from django.test import RequestFactory
+    from rest_framework.authtoken.models import Token
+
+    from auth_app.authentication import token_cache
+    from auth_app.models import CustomUser
+    from stats_app.models import PlatformStats
+
+    app = WSGIHandler()
+    factory = RequestFactory()
+
+    def hitting(path, **headers):
+        def run():
+            environ = factory._base_environ(PATH_INFO=path, REQUEST_METHOD="GET", **headers)
+            statuses = []
+            b"".join(app(environ, lambda status, _: statuses.append(status)))
+            assert statuses[0].startswith("200"), statuses
+        return run
+
+    options = settings.DATABASES["default"]["OPTIONS"]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for max_age in (0, 60):
+            use_database_file(Path(tmp) / f"age{max_age}.sqlite3", OPTIONS=options, CONN_MAX_AGE=max_age)
+            user = CustomUser.objects.create_user(username="bench_conn", password="pw", role="customer")
+            auth = {"HTTP_AUTHORIZATION": f"Token {Token.objects.create(user=user).key}"}
+            PlatformStats.refresh()
+            token_cache.clear()
+            connections.close_all()
+
+            label = f"CONN_MAX_AGE={max_age}"
+            rows.append((f"{label}: base-info", measure(hitting("/api/base-info/"), args.requests), "req/s"))
+            rows.append((f"{label}: token orders", measure(hitting("/api/orders/", **auth), args.requests), "req/s"))
+
+    report("Connection reuse", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Login throughput: default vs. tuned password hashing, with and without
+the login throttles.
+
+    python -m benchmarks.bench_login [--logins 5]
+"""
+
+import argparse
+
+from benchmarks._django import measure, report, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=5, help="logins per profile")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test import override_settings
+    from rest_framework.test import APIClient
+    from rest_framework.throttling import SimpleRateThrottle
+
+    from auth_app.models import CustomUser
+
+    unlimited = {"login_ip": None, "login_username": None}
+    rows = []
+
+    for profile, hashers in settings.PASSWORD_HASHER_PROFILES.items():
+        with override_settings(PASSWORD_HASHERS=hashers):
+            SimpleRateThrottle.THROTTLE_RATES = unlimited
+            username = f"bench_{profile}"
+            CustomUser.objects.create_user(username=username, password="pw-123456")
+            client = APIClient()
+            payload = {"username": username, "password": "pw-123456"}
+            rate = measure(lambda: client.post("/api/login/", payload, format="json"), args.logins)
+            rows.append((f"{profile}: successful logins", rate, "req/s"))
+
+    # credential stuffing against one account: 10/min per username
+    SimpleRateThrottle.THROTTLE_RATES = settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+    client = APIClient()
+    payload = {"username": "bench_default", "password": "wrong"}
+
+    def attempt():
+        return client.post("/api/login/", payload, format="json").status_code
+
+    allowed = int(SimpleRateThrottle.THROTTLE_RATES["login_username"].split("/")[0])
+    rows.append(("stuffing: attempts within limit (hashed)", measure(attempt, allowed), "req/s"))
+    assert attempt() == 429
+    rows.append(("stuffing: attempts over limit (429)", measure(attempt, 500), "req/s"))
+
+    report("Login throughput", rows)
+
+
+if __name__ == "__main__":
+    main()
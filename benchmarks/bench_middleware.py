@@ -0,0 +1,79 @@
+"""
+Per‑request cost of ``BrowserOnlyMiddleware`` for API traffic.
+
+Both profiles use the current ``MIDDLEWARE``; they differ only in that
+``flat`` replaces ``BrowserOnlyMiddleware`` by the ``BROWSER_MIDDLEWARE``
+classes themselves (Session/CSRF/Auth/Messages on every request), while
+``browser-only`` runs them for ``BROWSER_PATH_PREFIXES`` only.
+
+    python -m benchmarks.bench_middleware [--requests 1000] [--rounds 5]
+
+Requests go through Django's test ``Client`` (full handler, no network).
+The median of several interleaved rounds is reported; the differences are
+small against the run‑to‑run noise, so compare several runs.
+"""
+
+import argparse
+from statistics import median
+
+from benchmarks._django import measure, report, setup_django
+
+BROWSER_ONLY = "core.middleware.BrowserOnlyMiddleware"
+
+
+def flat_middleware(middleware, browser_middleware) -> list[str]:
+    """*middleware* with ``BrowserOnlyMiddleware`` expanded in place."""
+    flat = []
+    for path in middleware:
+        flat.extend(browser_middleware if path == BROWSER_ONLY else [path])
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test import Client, override_settings
+    from rest_framework.authtoken.models import Token
+
+    from auth_app.models import CustomUser
+    from stats_app.models import PlatformStats
+
+    PlatformStats.refresh()
+    user = CustomUser.objects.create_user(username="bench_mw", password="pw", role="customer")
+    auth = {"HTTP_AUTHORIZATION": f"Token {Token.objects.create(user=user).key}"}
+
+    def hitting(client, url, **extra):
+        def run():
+            assert client.get(url, **extra).status_code in (200, 404)
+        return run
+
+    profiles = {
+        "flat": flat_middleware(settings.MIDDLEWARE, settings.BROWSER_MIDDLEWARE),
+        "browser-only": list(settings.MIDDLEWARE),
+    }
+    endpoints = (
+        ("anonymous base-info", "/api/base-info/", {}),
+        ("token orders", "/api/orders/", auth),
+        ("404", "/api/nope/", {}),
+    )
+    # median of several interleaved rounds – evens out warm‑up effects
+    rates = {}
+    for _ in range(args.rounds):
+        for label, middleware in profiles.items():
+            with override_settings(MIDDLEWARE=middleware):
+                client = Client()
+                for name, url, extra in endpoints:
+                    rate = measure(hitting(client, url, **extra), args.requests)
+                    rates.setdefault(f"{label}: {name}", []).append(rate)
+
+    rows = [(key, median(values), "req/s") for key, values in sorted(rates.items())]
+    report("Middleware stack throughput", rows)
+
+
+if __name__ == "__main__":
+    main()
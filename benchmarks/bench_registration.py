@@ -0,0 +1,61 @@
+"""
+Registrations per second through ``POST /api/registration/``, and the
+number of SQL statements each registration costs.
+
+    python -m benchmarks.bench_registration [--registrations 20]
+
+Runs with both password hasher profiles; the "tuned" one shows the share
+of the pipeline that is not spent hashing.
+"""
+
+import argparse
+import itertools
+
+from benchmarks._django import measure, report, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registrations", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test import override_settings
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    counter = itertools.count()
+
+    def register():
+        name = f"bench_reg_{next(counter)}"
+        response = client.post(
+            "/api/registration/",
+            {
+                "username": name,
+                "email": f"{name}@example.com",
+                "password": "pw-123456",
+                "repeated_password": "pw-123456",
+            },
+            format="json",
+        )
+        assert response.status_code == 201, response.data
+
+    rows = []
+    for profile, hashers in settings.PASSWORD_HASHER_PROFILES.items():
+        with override_settings(PASSWORD_HASHERS=hashers):
+            rows.append((f"{profile}: registrations", measure(register, args.registrations), "req/s"))
+
+    with CaptureQueriesContext(connection) as ctx:
+        register()
+    writes = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+    rows.append(("SQL statements per registration", len(ctx.captured_queries), "queries"))
+    rows.append(("  thereof INSERTs", len(writes), "queries"))
+
+    report("Registration pipeline", rows)
+
+
+if __name__ == "__main__":
+    main()
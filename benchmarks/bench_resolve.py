@@ -0,0 +1,75 @@
+"""
+URL resolution time per endpoint: single optional‑prefix mount
+(``core.urls``) vs. the former layout that included every app urlconf
+twice (``api/`` + root).
+
+    python -m benchmarks.bench_resolve [--repeat 20000]
+
+Both resolvers are built from the same app urlconfs, so the difference is
+purely the number of patterns walked before a match (or a 404).
+"""
+
+import argparse
+
+from benchmarks._django import measure, report, setup_django
+
+PATHS = (
+    "/api/login/",
+    "/api/profile/1/",
+    "/api/offers/",
+    "/api/orders/1/",
+    "/api/order-count/1/",
+    "/api/reviews/",
+    "/api/base-info/",
+    "/base-info/",
+    "/api/does-not-exist/",
+)
+
+
+def _legacy_urlpatterns():
+    from django.contrib import admin
+    from django.urls import include, path
+
+    from core.urls import API_URLCONFS
+
+    patterns = [path("admin/", admin.site.urls)]
+    for module in API_URLCONFS:
+        patterns += [path("api/", include(module)), path("", include(module))]
+    return patterns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    setup_django(test_db=False)
+    from django.urls import Resolver404, URLResolver
+    from django.urls.resolvers import RegexPattern
+
+    import core.urls
+
+    resolvers = {
+        "duplicated": URLResolver(RegexPattern(r"^/"), _legacy_urlpatterns()),
+        "single": URLResolver(RegexPattern(r"^/"), core.urls.urlpatterns),
+    }
+
+    def resolving(resolver, url):
+        def run():
+            try:
+                resolver.resolve(url)
+            except Resolver404:
+                pass
+        return run
+
+    rows = []
+    for url in PATHS:
+        for name, resolver in resolvers.items():
+            rate = measure(resolving(resolver, url), args.repeat)
+            rows.append((f"{url} [{name}]", 1e6 / rate, "µs"))
+
+    report("URL resolve time per call", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Write/read contention on a file‑based SQLite database: Django's plain
+``sqlite3`` defaults vs. the tuned ``DATABASES["default"]["OPTIONS"]``
+(WAL, pragmas, IMMEDIATE transactions).
+
+    python -m benchmarks.bench_sqlite [--writers 4] [--readers 4] [--seconds 3]
+
+Writers run the typical "read, then write" transaction of the order and
+review endpoints; readers list orders.  Each profile gets a fresh,
+migrated database file in a temp directory.
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks._django import report, setup_django, use_database_file
+
+PLAIN_OPTIONS = {}
+
+
+def _run_profile(name, options, args):
+    from django.db import OperationalError, connections, transaction
+
+    from auth_app.models import CustomUser
+    from orders_app.models import Order
+
+    use_database_file(Path(args.tmp) / f"{name}.sqlite3", OPTIONS=options)
+
+    biz = CustomUser.objects.create_user(username="bench_sql_biz", password="pw", role="business")
+    cust = CustomUser.objects.create_user(username="bench_sql_cust", password="pw", role="customer")
+    connections.close_all()
+
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def writer():
+        while time.perf_counter() < deadline:
+            try:
+                with transaction.atomic():
+                    position = Order.objects.filter(business_user=biz).count()
+                    Order.objects.create(
+                        customer_user=cust, business_user=biz, title=f"#{position}",
+                        price="10.00", offer_type="basic",
+                    )
+                bump("writes")
+            except OperationalError:
+                bump("locked")
+        connections.close_all()
+
+    def reader():
+        while time.perf_counter() < deadline:
+            try:
+                list(Order.objects.filter(business_user=biz).order_by("-id")[:20])
+                bump("reads")
+            except OperationalError:
+                bump("locked")
+        connections.close_all()
+
+    threads = [threading.Thread(target=writer) for _ in range(args.writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [
+        (f"{name}: writes", counts["writes"] / args.seconds, "tx/s"),
+        (f"{name}: reads", counts["reads"] / args.seconds, "req/s"),
+        (f"{name}: 'database is locked'", counts["locked"], "errors"),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    setup_django(test_db=False)
+    from django.conf import settings
+
+    tuned = settings.DATABASES["default"].get("OPTIONS", {})
+    with tempfile.TemporaryDirectory() as tmp:
+        args.tmp = tmp
+        rows = _run_profile("plain", PLAIN_OPTIONS, args)
+        rows += _run_profile("tuned", dict(tuned), args)
+
+    report(f"SQLite contention ({args.writers} writers, {args.readers} readers)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import pytest
+from django.core.cache import cache
+
+pytest_plugins = ["core_utils.pytest_plugin"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with an empty local cache (throttles, demo payloads)."""
+    cache.clear()
+    yield
@@ -0,0 +1,26 @@
+"""
+Native async variant of :class:`core.api.views.BaseInfoView` (ASGI only).
+"""
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+
+from core_utils.async_views import AsyncAPIView
+from stats_app.models import PlatformStats
+
+
+class AsyncBaseInfoView(AsyncAPIView):
+    """Same payload and cache headers as ``BaseInfoView``."""
+
+    async def get(self, request):
+        stats = await PlatformStats.aload()
+        response = self.render({
+            "review_count": stats.review_count,
+            "average_rating": float(stats.average_rating),
+            "business_profile_count": stats.business_profile_count,
+            "offer_count": stats.offer_count,
+        })
+        patch_cache_control(
+            response, public=True, max_age=settings.BASE_INFO_CACHE_SECONDS
+        )
+        return response
@@ -1,6 +1,7 @@
-from django.urls import path
-from .views import BaseInfoView
+from django.urls import path, re_path
+from .views import BaseInfoView, MetricsView
 
 urlpatterns = [
     path("base-info/", BaseInfoView.as_view(), name="base-info"),
-]
\ No newline at end of file
+    re_path(r"^_metrics/?$", MetricsView.as_view(), name="metrics"),
+]
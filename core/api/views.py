@@ -1,23 +1,46 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from rest_framework import permissions
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from reviews_app.models import Review
-from auth_app.models import CustomUser
-from offers_app.models import Offer
-from django.db.models import Avg
+
+from core_utils.metrics import registry
+from stats_app.models import PlatformStats
 
 class BaseInfoView(APIView):
+    """
+    Public platform figures for the landing page.
+
+    Served from the precomputed ``PlatformStats`` row (one PK lookup) and
+    marked cacheable for ``BASE_INFO_CACHE_SECONDS`` so CDNs can hold it.
+    """
     permission_classes = []
 
     def get(self, request):
-        review_count = Review.objects.count()
-        avg_val = Review.objects.aggregate(avg=Avg("rating"))["avg"]
-        average_rating = round(float(avg_val), 1) if avg_val is not None else 0.0
-        business_profile_count = CustomUser.objects.filter(role='business').count()
-        offer_count = Offer.objects.count()
-
-        return Response({
-            "review_count": review_count,
-            "average_rating": average_rating,
-            "business_profile_count": business_profile_count,
-            "offer_count": offer_count
-        })
\ No newline at end of file
+        stats = PlatformStats.load()
+        response = Response({
+            "review_count": stats.review_count,
+            "average_rating": float(stats.average_rating),
+            "business_profile_count": stats.business_profile_count,
+            "offer_count": stats.offer_count
+        })
+        patch_cache_control(
+            response, public=True, max_age=settings.BASE_INFO_CACHE_SECONDS
+        )
+        return response
+
+
+class MetricsView(APIView):
+    """
+    Per‑process request metrics in Prometheus text format (staff only).
+
+    See :mod:`core_utils.metrics`.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
@@ -12,5 +12,12 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+# every sync_to_async thread would keep its own persistent connection –
+# Django recommends CONN_MAX_AGE=0 under ASGI (see core/database.py)
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+# experimental native async read views (core/asgi_urls.py) only on request:
+# with SQLite they are slower than the sync views (benchmarks/bench_asgi.py)
+if os.environ.get('ASYNC_VIEWS') == '1':
+    os.environ.setdefault('DJANGO_ROOT_URLCONF', 'core.asgi_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,46 @@
+"""
+**Experimental** URLconf for ASGI deployments – opt‑in, ``core/asgi.py``
+selects it only with ``ASYNC_VIEWS=1``.
+
+``benchmarks/bench_asgi.py`` measures these views roughly 40 % *slower*
+than the sync views on SQLite (every async ORM call hops to Django's
+thread‑sensitive worker thread).  Enable them only after measuring a gain
+on the target database.
+
+Read‑heavy endpoints are served by native async views that use Django's
+async ORM; they are matched first, every other route falls through to the
+regular (sync) app urlconfs.  Under WSGI async views would each need their
+own event loop, so ``core.urls`` keeps the sync views there.
+"""
+
+from django.contrib import admin
+from django.urls import include, path, re_path
+
+from core.api.async_views import AsyncBaseInfoView
+from core.urls import api_urlpatterns, handler404  # noqa: F401
+from orders_app.api.async_views import AsyncCompletedOrderCountView, AsyncOrderCountView
+from users_app.api.async_views import AsyncBusinessProfileListView
+
+async_urlpatterns = [
+    path("base-info/", AsyncBaseInfoView.as_view(), name="base-info"),
+    path(
+        "profiles/business/",
+        AsyncBusinessProfileListView.as_view(),
+        name="business-profiles",
+    ),
+    re_path(
+        r"^order-count(?:/(?P<business_user_id>\d+))?/?$",
+        AsyncOrderCountView.as_view(),
+        name="order-count",
+    ),
+    re_path(
+        r"^completed-order-count(?:/(?P<business_user_id>\d+))?/?$",
+        AsyncCompletedOrderCountView.as_view(),
+        name="completed-order-count",
+    ),
+]
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    re_path(r'^(?:api/)?', include(async_urlpatterns + api_urlpatterns)),
+]
@@ -0,0 +1,141 @@
+"""
+Environment‑driven ``DATABASES["default"]`` configuration.
+
+SQLite stays the default.  Set ``DATABASE_URL`` to switch engines::
+
+    DATABASE_URL=sqlite:////var/lib/app/db.sqlite3
+    DATABASE_URL=postgres://user:secret@db:5432/app
+
+Read replicas (same URL syntax, comma‑separated) become the aliases
+``replica1``, ``replica2``, … used by :mod:`core.db_router`::
+
+    DATABASE_REPLICA_URLS=postgres://ro@replica-a/app,postgres://ro@replica-b/app
+
+Further variables (all optional):
+
+==========================  ===========  ====================================
+``DB_CONN_MAX_AGE``         ``60``       seconds a connection is reused;
+                                         ``0`` = per request, ``none`` = forever;
+                                         ``core/asgi.py`` defaults it to ``0``
+``DB_CONN_HEALTH_CHECKS``   ``1``        ping reused connections before use
+``DB_POOL``                 ``0``        Postgres: Django's native pool
+                                         (opt‑in, needs ``psycopg[pool]``)
+``DB_POOL_MIN_SIZE``        ``2``        pool size bounds …
+``DB_POOL_MAX_SIZE``        ``10``
+``DB_POOL_TIMEOUT``         ``10``       … and seconds to wait for a slot
+==========================  ===========  ====================================
+
+A pool replaces persistent connections (Django rejects both at once), so
+``DB_CONN_MAX_AGE`` is forced to ``0`` when ``DB_POOL`` is on.
+
+Under ASGI keep ``DB_CONN_MAX_AGE=0``: sync ORM calls run in
+``sync_to_async`` threads, and persistent connections held by those
+threads are never closed by the request cycle.
+"""
+
+import os
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from django.core.exceptions import ImproperlyConfigured
+
+# per‑connection SQLite tuning (init_command): WAL so readers do not block
+# the writer, NORMAL sync (safe with WAL), bigger page cache, mmap reads
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,        # ms
+    "mmap_size": 134217728,      # 128 MiB
+    "cache_size": -20000,        # KiB (negative = size instead of pages)
+    "temp_store": "MEMORY",
+}
+
+POSTGRES_SCHEMES = {"postgres", "postgresql", "pgsql"}
+
+
+def _flag(env, name: str, default: bool) -> bool:
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _conn_max_age(env) -> int | None:
+    value = env.get("DB_CONN_MAX_AGE", "60").strip().lower()
+    return None if value in {"none", "unlimited"} else int(value)
+
+
+def _sqlite(path) -> dict:
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": path,
+        "OPTIONS": {
+            "init_command": "".join(
+                f"PRAGMA {name}={value};" for name, value in SQLITE_PRAGMAS.items()
+            ),
+            # atomic blocks take the write lock up front – no "database is
+            # locked" when a read‑then‑write transaction upgrades its lock
+            "transaction_mode": "IMMEDIATE",
+        },
+    }
+
+
+def _postgres(url, env) -> dict:
+    config = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": unquote(url.path.lstrip("/")),
+        "USER": unquote(url.username or ""),
+        "PASSWORD": unquote(url.password or ""),
+        "HOST": url.hostname or "",
+        "PORT": str(url.port or ""),
+        "OPTIONS": {},
+    }
+    if _flag(env, "DB_POOL", False):   # psycopg[pool] is not in requirements.txt
+        config["OPTIONS"]["pool"] = {
+            "min_size": int(env.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(env.get("DB_POOL_MAX_SIZE", 10)),
+            "timeout": float(env.get("DB_POOL_TIMEOUT", 10)),
+        }
+    return config
+
+
+def _from_url(url: str, base_dir: Path, env) -> dict:
+    if not url:
+        config = _sqlite(base_dir / "db.sqlite3")
+    else:
+        parts = urlsplit(url)
+        if parts.scheme == "sqlite":
+            # sqlite:////abs/path → "/abs/path", sqlite:///rel → "rel"
+            config = _sqlite(unquote(parts.path[1:]) or base_dir / "db.sqlite3")
+        elif parts.scheme in POSTGRES_SCHEMES:
+            config = _postgres(parts, env)
+        else:
+            raise ImproperlyConfigured(f"Unsupported DATABASE_URL scheme: {parts.scheme!r}")
+
+    pooled = "pool" in config["OPTIONS"]
+    config["CONN_MAX_AGE"] = 0 if pooled else _conn_max_age(env)
+    config["CONN_HEALTH_CHECKS"] = _flag(env, "DB_CONN_HEALTH_CHECKS", True)
+    return config
+
+
+def database_config(base_dir: Path, env=None) -> dict:
+    """Return the ``DATABASES["default"]`` dict for *env* (``os.environ``)."""
+    env = os.environ if env is None else env
+    return _from_url(env.get("DATABASE_URL", "").strip(), base_dir, env)
+
+
+def replica_configs(base_dir: Path, env=None) -> dict:
+    """
+    ``{"replica1": {...}, ...}`` from the comma‑separated
+    ``DATABASE_REPLICA_URLS`` (see :mod:`core.db_router`).
+
+    In tests every replica mirrors ``default``.
+    """
+    env = os.environ if env is None else env
+    urls = [u.strip() for u in env.get("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+    configs = {}
+    for number, url in enumerate(urls, start=1):
+        config = _from_url(url, base_dir, env)
+        config["TEST"] = {"MIRROR": "default"}
+        configs[f"replica{number}"] = config
+    return configs
@@ -0,0 +1,176 @@
+"""
+Read‑replica routing.
+
+Reads issued while serving a *safe* request (``GET``/``HEAD``/``OPTIONS``)
+go to one of the aliases in ``DATABASE_REPLICAS``; everything else – writes,
+unsafe requests, management commands, signals outside a request – uses
+``default``.  Without replicas every read stays on ``default``.
+
+Read‑your‑writes:
+
+* a request that writes is pinned to the primary for the rest of it, so
+  later reads in the same request see the new rows;
+* after a request that wrote, the caller (identified by its
+  ``Authorization`` header) is pinned for ``REPLICA_PIN_SECONDS`` so the
+  follow‑up ``GET`` does not hit a lagging replica;
+* login and registration carry no ``Authorization`` header yet – they pin
+  the token they issue via :func:`pin_token`;
+* tokens are always read from the primary, so a token issued a moment ago
+  is never rejected by a replica that has not caught up.
+
+The pins live in ``CACHES["default"]``; to reach a follow‑up request served
+by another worker process, that cache must be shared (Redis, Memcached,
+database cache).  :func:`check_pin_cache` – a system check – rejects a
+process‑local cache (the default ``LocMemCache``) once replicas are set.
+
+The per‑request state lives in a ``ContextVar`` set by
+:class:`ReplicaRoutingMiddleware`; it follows the request into
+``sync_to_async`` worker threads under ASGI.
+"""
+
+import hashlib
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+
+PIN_CACHE_KEY = "core:db_pin:{client}"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@dataclass
+class RoutingState:
+    use_replica: bool = False   # safe request and replicas configured
+    pinned: bool = False        # read from the primary from now on
+    wrote: bool = False
+
+
+# models whose rows must be visible right after they are written
+PRIMARY_ONLY_MODELS = (Token,)
+
+_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def replicas() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", ()))
+
+
+def _pin_key(credentials: str) -> str:
+    digest = hashlib.sha256(credentials.encode()).hexdigest()[:32]
+    return PIN_CACHE_KEY.format(client=digest)
+
+
+def _pin_seconds() -> int:
+    return getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+
+def pin_token(key: str) -> None:
+    """Pin the client that will authenticate with token *key* to the primary."""
+    if replicas():
+        cache.set(_pin_key(f"Token {key}"), True, _pin_seconds())
+
+
+def check_pin_cache(app_configs=None, **kwargs) -> list:
+    """System check: read‑your‑writes pins need a cache shared by all workers."""
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if not replicas() or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Error(
+            "DATABASE_REPLICAS is set but CACHES['default'] is process-local, "
+            "so read-your-writes pins do not reach other worker processes.",
+            hint="Configure a shared cache (Redis, Memcached or the database cache).",
+            obj=backend,
+            id="core.E001",
+        )
+    ]
+
+
+class ReplicaRouter:
+    """``DATABASE_ROUTERS`` entry – see the module docstring."""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        aliases = replicas()
+        if state is None or not state.use_replica or state.pinned or not aliases:
+            return "default"
+        if issubclass(model, PRIMARY_ONLY_MODELS):
+            return "default"
+        return random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas are populated by replication, never migrated directly
+        return db not in replicas()
+
+
+class ReplicaRoutingMiddleware:
+    """Sets the routing state for the duration of each request."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _pin_key(request) -> str | None:
+        credentials = request.META.get("HTTP_AUTHORIZATION")
+        return _pin_key(credentials) if credentials else None
+
+    def _enter(self, request):
+        if not replicas():
+            return None, None
+        safe = request.method in SAFE_METHODS
+        key = self._pin_key(request)
+        pinned = safe and key is not None and cache.get(key) is not None
+        state = RoutingState(use_replica=safe, pinned=pinned)
+        return state, _state.set(state)
+
+    def _exit(self, request, state, token):
+        _state.reset(token)
+        if state.wrote:
+            key = self._pin_key(request)
+            if key is not None:
+                cache.set(key, True, _pin_seconds())
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state, token = self._enter(request)
+        if state is None:
+            return self.get_response(request)
+        try:
+            return self.get_response(request)
+        finally:
+            self._exit(request, state, token)
+
+    async def __acall__(self, request):
+        state, token = self._enter(request)
+        if state is None:
+            return await self.get_response(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            self._exit(request, state, token)
@@ -1,19 +1,56 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.handlers.exception import convert_exception_to_response
 from django.http import JsonResponse
+from django.utils.module_loading import import_string
 from rest_framework import status
 
+from core_utils import nplusone
+from core_utils.metrics import QueryStats, current_queries, registry
+
+API_MOUNT = "^(?:api/)?"
+
+
+def route_label(match) -> str:
+    """``/orders/<int:pk>/`` for a ``ResolverMatch`` (``None`` → unmatched)."""
+    if match is None:
+        return "<unmatched>"
+    route = match.route
+    # gemeinsamer Mount aus core/urls.py – /api/x und /x sind eine Route
+    if route.startswith(API_MOUNT):
+        route = route[len(API_MOUNT):]
+    return "/" + route.lstrip("^").rstrip("$")
+
 
 class ForceJson404Middleware:
     """
     Wandelt *sämtliche* Fehlerseiten (404 oder 403 als HTML/Plain‑Text)
     in JSON um, damit `Content‑Type: application/json` garantiert ist –
     unabhängig von DEBUG=True.
+
+    Sync und async fähig: unter ASGI läuft die Kette ohne Thread‑Wechsel.
     """
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if self.async_mode:
+            return self.__acall__(request)
+        return self._as_json(self.get_response(request))
 
+    async def __acall__(self, request):
+        return self._as_json(await self.get_response(request))
+
+    @staticmethod
+    def _as_json(response):
         # nur eingreifen, wenn Response NICHT schon JSON ist
         if response.get('Content-Type', '').startswith('application/json'):
             return response
@@ -23,8 +60,195 @@ class ForceJson404Middleware:
                                 status=status.HTTP_404_NOT_FOUND)
 
         if response.status_code == 403:
-            # Authentifiziert, aber keine Berechtigung (z. B. IsOwner)
+            # Authentifiziert, aber keine Berechtigung (z. B. IsOwner)
             return JsonResponse({"detail": "Forbidden."},
                                 status=status.HTTP_403_FORBIDDEN)
 
-        return response
\ No newline at end of file
+        return response
+
+
+class BrowserOnlyMiddleware:
+    """
+    Führt die Browser‑Middlewares (Session, CSRF, Auth, Messages) nur für
+    Pfade aus ``BROWSER_PATH_PREFIXES`` aus – standardmäßig ``/admin/``.
+
+    Die API authentifiziert ausschließlich per DRF‑Token; für sie kosten
+    Session‑Lookup, CSRF‑Prüfung und das lazy ``request.user`` nur Zeit –
+    wenig allerdings: ``benchmarks/bench_middleware.py`` misst keinen
+    Unterschied jenseits des Rauschens.
+    ``BROWSER_MIDDLEWARE`` wird hier wie ``MIDDLEWARE`` zu einer inneren
+    Kette gebaut; ``process_view`` / ``process_exception`` /
+    ``process_template_response`` werden für Browser‑Pfade durchgereicht.
+    """
+    sync_capable = True
+    async_capable = True  # sofern alle BROWSER_MIDDLEWARE es auch sind
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.prefixes = tuple(settings.BROWSER_PATH_PREFIXES)
+
+        self.middleware = []
+        handler = convert_exception_to_response(get_response)
+        for dotted_path in reversed(settings.BROWSER_MIDDLEWARE):
+            instance = import_string(dotted_path)(handler)
+            self.middleware.insert(0, instance)
+            handler = convert_exception_to_response(instance)
+        self.browser_handler = handler
+
+    def _is_browser(self, request) -> bool:
+        return request.path_info.startswith(self.prefixes)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if self._is_browser(request):
+            return self.browser_handler(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self._is_browser(request):
+            return await self.browser_handler(request)
+        return await self.get_response(request)
+
+    # -- view‑level hooks (Reihenfolge wie im BaseHandler) ----------------
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not self._is_browser(request):
+            return None
+        for mw in self.middleware:
+            hook = getattr(mw, "process_view", None)
+            response = hook and hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_exception(self, request, exception):
+        if not self._is_browser(request):
+            return None
+        for mw in reversed(self.middleware):
+            hook = getattr(mw, "process_exception", None)
+            response = hook and hook(request, exception)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if not self._is_browser(request):
+            return response
+        for mw in reversed(self.middleware):
+            hook = getattr(mw, "process_template_response", None)
+            if hook:
+                response = hook(request, response)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Misst Latenz, SQL‑Statements/‑Zeit und Antwortgröße pro Route und
+    schreibt sie in ``core_utils.metrics.registry`` (→ ``/api/_metrics``).
+
+    Sollte ganz oben in ``MIDDLEWARE`` stehen, damit die Zeit aller
+    weiteren Schichten mitgemessen wird.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        stats, token, start = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_queries.reset(token)
+        self._finish(request, response, stats, start)
+        return response
+
+    async def __acall__(self, request):
+        stats, token, start = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_queries.reset(token)
+        self._finish(request, response, stats, start)
+        return response
+
+    @staticmethod
+    def _start():
+        stats = QueryStats()
+        return stats, current_queries.set(stats), time.perf_counter()
+
+    def _finish(self, request, response, stats, start):
+        if response.streaming:
+            size = int(response.get("Content-Length", 0) or 0)
+        else:
+            size = len(response.content)
+        registry.observe(
+            route_label(getattr(request, "resolver_match", None)),
+            request.method,
+            response.status_code,
+            time.perf_counter() - start,
+            stats.count,
+            stats.seconds,
+            size,
+        )
+
+
+class NPlusOneMiddleware:
+    """
+    Zeichnet pro Request alle SQL‑Templates samt Aufrufstelle auf
+    (``core_utils.nplusone``) und meldet N+1‑Muster sowie Überschreitungen
+    eines ``query_budget`` der View – gemäß ``settings.NPLUSONE``.
+
+    Nur aktiv mit ``NPLUSONE["ENABLED"]`` (opt‑in, Umgebungsvariable
+    ``NPLUSONE=1``) – die Herkunft jedes Statements kostet einen Stack‑Walk.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        config = nplusone.options()
+        if not config["ENABLED"]:
+            return self.get_response(request)
+        with nplusone.tracing() as trace:
+            response = self.get_response(request)
+        self._report(request, trace, config)
+        return response
+
+    async def __acall__(self, request):
+        config = nplusone.options()
+        if not config["ENABLED"]:
+            return await self.get_response(request)
+        with nplusone.tracing() as trace:
+            response = await self.get_response(request)
+        self._report(request, trace, config)
+        return response
+
+    @staticmethod
+    def _report(request, trace, config):
+        label = f"{request.method} {request.path}"
+        nplusone.react(
+            config["ON_REPEAT"],
+            nplusone.repeat_problems(trace, config["THRESHOLD"], label),
+            nplusone.NPlusOneError,
+        )
+        problem = nplusone.budget_problem(trace, nplusone.view_budget(request), label)
+        nplusone.react(
+            config["ON_BUDGET"], [problem] if problem else [], nplusone.QueryBudgetExceeded
+        )
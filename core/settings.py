@@ -3,8 +3,11 @@ Django settings for your project – angepasst für das Super‑User‑Problem
 und einen optionalen Import von «django_extensions».
 """
 from pathlib import Path
+import os
 import warnings
 
+from core.database import database_config, replica_configs
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = "django‑insecure-2!*6$ge)awvr1ou@d8koo+u%*zu48oc$vml0k7u^=jkm66b*14"
@@ -49,18 +52,34 @@ except ModuleNotFoundError:
 
 # ---------------------------------------------------------------------
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",    # zuerst: misst alle Schichten
+    "core.middleware.NPlusOneMiddleware",   # nur mit NPLUSONE["ENABLED"]
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.db_router.ReplicaRoutingMiddleware",
+    "core.middleware.BrowserOnlyMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.ForceJson404Middleware",
+]
+
+# Session/CSRF/Auth/Messages nur für Browser‑Pfade (Admin); die API nutzt
+# ausschließlich Token‑Auth (siehe core.middleware.BrowserOnlyMiddleware)
+BROWSER_MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "core.middleware.ForceJson404Middleware",
 ]
+BROWSER_PATH_PREFIXES = ("/admin/",)
 
-ROOT_URLCONF = "core.urls"
+# Admin prüft MIDDLEWARE nur flach – die Klassen laufen für /admin/ über
+# BrowserOnlyMiddleware
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
+# core/asgi.py wählt mit ASYNC_VIEWS=1 core.asgi_urls (experimentelle
+# native async Read‑Views, opt‑in)
+ROOT_URLCONF = os.environ.get("DJANGO_ROOT_URLCONF", "core.urls")
 
 TEMPLATES = [
     {
@@ -80,13 +99,21 @@ TEMPLATES = [
 WSGI_APPLICATION = "core.wsgi.application"
 
 # ---------------------------------------------------------------------
+# SQLite (Default) oder DATABASE_URL, persistente Verbindungen + Health
+# Checks, Postgres‑Pool – siehe core/database.py
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_config(BASE_DIR),
+    **replica_configs(BASE_DIR),        # DATABASE_REPLICA_URLS
 }
 
+# Lesezugriffe sicherer Requests auf die Replicas (core/db_router.py);
+# ohne Replicas bleibt alles auf «default»
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+REPLICA_PIN_SECONDS = 5   # nach einem Write: Folge‑GETs vom Primary lesen
+# Pins liegen im Cache – mit Replicas muss CACHES["default"] von allen
+# Worker‑Prozessen geteilt werden (Systemcheck core.E001)
+
 # ---------------------------------------------------------------------
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -95,6 +122,32 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# ---------------------------------------------------------------------
+# PASSWORD HASHING
+# ---------------------------------------------------------------------
+# "default" = Django‑Standard (PBKDF2, 1 000 000 Iterationen)
+# "tuned"   = PBKDF2 mit PASSWORD_HASHER_ITERATIONS – deutlich billigere
+#             Logins, bestehende Hashes bleiben gültig
+PASSWORD_HASHER_PROFILE = os.environ.get("PASSWORD_HASHER_PROFILE", "default")
+PASSWORD_HASHER_ITERATIONS = int(os.environ.get("PASSWORD_HASHER_ITERATIONS", 200_000))
+PASSWORD_HASHER_PROFILES = {
+    "default": [
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+        "django.contrib.auth.hashers.Argon2PasswordHasher",
+        "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+        "django.contrib.auth.hashers.ScryptPasswordHasher",
+    ],
+    "tuned": [
+        "auth_app.hashers.TunedPBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+        "django.contrib.auth.hashers.Argon2PasswordHasher",
+        "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+        "django.contrib.auth.hashers.ScryptPasswordHasher",
+    ],
+}
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
@@ -109,7 +162,7 @@ AUTH_USER_MODEL = "auth_app.CustomUser"
 # ---------------------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -122,6 +175,73 @@ REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
         "rest_framework.renderers.JSONRenderer",
     ],
+    # nur für LoginView (auth_app.api.throttles)
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": "60/min",
+        "login_username": "10/min",
+    },
+}
+
+# Token → user snapshot cache of CachedTokenAuthentication (per process)
+TOKEN_AUTH_CACHE = {
+    "MAX_SIZE": 1024,
+    "TTL": 60,  # seconds
+}
+
+# /api/base-info/ – Cache‑Control max‑age für Browser & CDN
+BASE_INFO_CACHE_SECONDS = 60
+
+# /api/stats/business/<id>/dashboard/ – Cache pro Business‑User
+BUSINESS_DASHBOARD = {
+    "CACHE_SECONDS": 30,
+}
+
+# Unabhängige Queries zusammengesetzter Endpoints parallel ausführen
+# (core_utils.concurrency); 0 = seriell, lohnt sich nur mit Netzwerk‑DB
+CONCURRENT_QUERY_WORKERS = 0
+
+# N+1‑Erkennung pro Request (core_utils/nplusone.py); läuft den Stack bei
+# jedem Statement ab, daher nur auf Wunsch (NPLUSONE=1).  In Tests
+# erzwingt core_utils.pytest_plugin die query_budget‑Angaben der Views
+NPLUSONE = {
+    "ENABLED": os.environ.get("NPLUSONE") == "1",
+    "THRESHOLD": 5,
+    "ON_REPEAT": "log",
+    "ON_BUDGET": "log",
+}
+
+# Slow‑Query‑Log inkl. EXPLAIN (core_utils/slowlog.py) → rotierende Datei;
+# EXPLAIN läuft gegen die echte DB, daher nur auf Wunsch (SLOW_QUERY_LOG=1)
+SLOW_QUERY_LOG = {
+    "ENABLED": os.environ.get("SLOW_QUERY_LOG") == "1",
+    "THRESHOLD_MS": int(os.environ.get("SLOW_QUERY_MS", 200)),
+    "EXPLAIN": True,
+}
+SLOW_QUERY_LOG_FILE = BASE_DIR / "logs" / "slow_queries.log"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "timestamped": {"format": "%(asctime)s %(message)s"},
+    },
+    "handlers": {
+        "slow_queries": {
+            "class": "core_utils.slowlog.SlowQueryFileHandler",  # legt logs/ erst beim Schreiben an
+            "formatter": "timestamped",
+            "filename": SLOW_QUERY_LOG_FILE,
+            "maxBytes": 5 * 1024 * 1024,
+            "backupCount": 5,
+            "encoding": "utf-8",
+            "delay": True,       # Datei erst beim ersten Eintrag öffnen
+        },
+    },
+    "loggers": {
+        "core_utils.slowlog": {
+            "handlers": ["slow_queries"],
+            "level": "WARNING",
+        },
+    },
 }
 
 CORS_ALLOW_ALL_ORIGINS = True
@@ -20,4 +20,530 @@ class TestBaseInfoAPI:
         assert isinstance(data["review_count"], int)
         assert isinstance(data["average_rating"], float)
         assert isinstance(data["business_profile_count"], int)
-        assert isinstance(data["offer_count"], int)
\ No newline at end of file
+        assert isinstance(data["offer_count"], int)
+
+@pytest.mark.django_db
+class TestBaseInfoSnapshot:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def _base_info(self):
+        return self.client.get(reverse("base-info")).data
+
+    def test_counters_follow_writes(self, django_capture_on_commit_callbacks):
+        from auth_app.models import CustomUser
+        from offers_app.models import Offer
+        from reviews_app.models import Review
+        from stats_app.models import PlatformStats
+
+        PlatformStats.refresh()
+        with django_capture_on_commit_callbacks(execute=True):
+            biz = CustomUser.objects.create_user(username="snap_biz", password="pw", role="business")
+            cust = CustomUser.objects.create_user(username="snap_cust", password="pw", role="customer")
+            Offer.objects.create(user=biz, title="Logo", description="Design")
+            review = Review.objects.create(business_user=biz, reviewer=cust, rating=4, description="ok")
+        assert self._base_info() == {
+            "review_count": 1, "average_rating": 4.0,
+            "business_profile_count": 1, "offer_count": 1,
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            review.rating = 2
+            review.save()
+            cust.role = "business"
+            cust.save()
+        assert self._base_info()["average_rating"] == 2.0
+        assert self._base_info()["business_profile_count"] == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            biz.delete()  # cascades to the offer and the review
+        assert self._base_info() == {
+            "review_count": 0, "average_rating": 0.0,
+            "business_profile_count": 1, "offer_count": 0,
+        }
+
+    def test_role_change_left_out_of_update_fields_is_counted_later(
+        self, django_capture_on_commit_callbacks
+    ):
+        from auth_app.models import CustomUser
+        from stats_app.models import PlatformStats
+
+        CustomUser.objects.create_user(username="snap_partial", password="pw", role="customer")
+        PlatformStats.refresh()
+        user = CustomUser.objects.get(username="snap_partial")
+        with django_capture_on_commit_callbacks(execute=True):
+            user.role = "business"
+            user.email = "partial@example.com"
+            user.save(update_fields=["email"])
+            user.save()
+        assert PlatformStats.objects.get().business_profile_count == 1
+
+    def test_counters_change_on_commit_without_extra_selects(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        from auth_app.models import CustomUser
+        from stats_app.models import PlatformStats
+
+        CustomUser.objects.create_user(username="snap_user", password="pw", role="customer")
+        PlatformStats.refresh()
+        user = CustomUser.objects.get(username="snap_user")
+        with django_capture_on_commit_callbacks() as callbacks:
+            with django_assert_num_queries(1):      # the UPDATE only
+                user.email = "new@example.com"
+                user.save()
+            user.role = "business"
+            user.save()
+        assert PlatformStats.objects.get().business_profile_count == 0
+        bumps = [cb for cb in callbacks if cb.func == PlatformStats.bump]   # not the dashboard drops
+        assert len(bumps) == 1
+        bumps[0]()
+        assert PlatformStats.objects.get().business_profile_count == 1
+
+    def test_single_query_and_cache_headers(self, django_assert_num_queries):
+        from stats_app.models import PlatformStats
+
+        PlatformStats.refresh()
+        with django_assert_num_queries(1):
+            response = self.client.get(reverse("base-info"))
+        assert "public" in response["Cache-Control"]
+        assert "max-age=60" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+class TestBrowserOnlyMiddleware:
+    def test_api_skips_session_and_csrf(self):
+        from django.test import Client
+
+        client = Client(enforce_csrf_checks=True)
+        response = client.get("/api/base-info/")
+        assert response.status_code == 200
+        assert "Cookie" not in response.get("Vary", "")
+        assert not response.cookies
+        assert not hasattr(response.wsgi_request, "session")
+
+    def test_admin_keeps_session_and_csrf(self):
+        from django.test import Client
+
+        client = Client(enforce_csrf_checks=True)
+        response = client.get("/admin/login/")
+        assert response.status_code == 200
+        assert "csrftoken" in response.cookies
+        assert hasattr(response.wsgi_request, "session")
+
+        rejected = client.post("/admin/login/", {"username": "x", "password": "y"})
+        assert rejected.status_code == 403
+
+    def test_admin_session_login(self):
+        from django.test import Client
+        from auth_app.models import CustomUser
+
+        admin_user = CustomUser.objects.create_superuser("mw_admin", "a@example.com", "pw")
+        client = Client()
+        client.force_login(admin_user)
+        assert client.get("/admin/").status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("core.asgi_urls")
+class TestAsyncReadViews:
+    """Native async views (ASGI urlconf) mirror their sync counterparts."""
+
+    def setup_method(self):
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncClient
+
+        self.client = AsyncClient()
+        self.get = async_to_sync(self.client.get)
+
+    def _user(self, username, role):
+        from auth_app.models import CustomUser
+        from rest_framework.authtoken.models import Token
+
+        user = CustomUser.objects.create_user(username=username, password="pw", role=role)
+        return user, {"headers": {"Authorization": f"Token {Token.objects.create(user=user).key}"}}
+
+    def test_base_info(self):
+        from core.api.views import BaseInfoView
+
+        response = self.get("/api/base-info/")
+        assert response.status_code == 200
+        assert response.json() == BaseInfoView().get(None).data
+        assert "max-age=60" in response["Cache-Control"]
+
+    def test_order_counts(self):
+        from orders_app.models import Order
+
+        biz, _ = self._user("async_biz", "business")
+        cust, auth = self._user("async_cust", "customer")
+        for status in ("in_progress", "completed", "completed"):
+            Order.objects.create(
+                customer_user=cust, business_user=biz, title="Logo",
+                price="10.00", offer_type="basic", status=status,
+            )
+
+        assert self.get(f"/api/order-count/{biz.id}/").status_code == 401
+        assert self.get(f"/api/order-count/{biz.id}/", **auth).json() == {"order_count": 1}
+        assert self.get(
+            "/api/completed-order-count/", {"business_user_id": biz.id}, **auth
+        ).json() == {"completed_order_count": 2}
+        assert self.get("/api/order-count/99999/", **auth).status_code == 404
+        assert self.get("/api/order-count/", **auth).status_code == 400
+
+    def test_business_profiles_match_sync_view(self):
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from users_app.api.views import BusinessProfileListView
+
+        self._user("async_list_biz", "business")
+        cust, auth = self._user("async_list_cust", "customer")
+        request = APIRequestFactory().get("/api/profiles/business/")
+        force_authenticate(request, user=cust)
+        expected = BusinessProfileListView.as_view()(request).data
+
+        response = self.get("/api/profiles/business/", **auth)
+        assert response.status_code == 200
+        assert response.json() == expected
+
+        searched = self.get("/api/profiles/business/", {"search": "nomatch"}, **auth)
+        assert searched.status_code == 200
+        assert searched.json() == []
+
+    def test_async_404_is_json(self):
+        response = self.get("/api/does-not-exist/")
+        assert response.status_code == 404
+        assert response["Content-Type"].startswith("application/json")
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_applied_per_connection():
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        pragmas = {
+            name: cursor.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ("synchronous", "busy_timeout", "temp_store")
+        }
+    assert pragmas == {"synchronous": 1, "busy_timeout": 5000, "temp_store": 2}
+    assert connection.transaction_mode == "IMMEDIATE"
+
+
+class TestDatabaseConfig:
+    def _config(self, **env):
+        from pathlib import Path
+        from core.database import database_config
+
+        return database_config(Path("/srv/app"), env=env)
+
+    def test_sqlite_default_with_persistent_connections(self):
+        config = self._config()
+        assert config["ENGINE"] == "django.db.backends.sqlite3"
+        assert str(config["NAME"]) == "/srv/app/db.sqlite3"
+        assert config["OPTIONS"]["transaction_mode"] == "IMMEDIATE"
+        assert (config["CONN_MAX_AGE"], config["CONN_HEALTH_CHECKS"]) == (60, True)
+
+    def _asgi_settings(self, *names, **env):
+        import os
+        import subprocess
+        import sys
+
+        keep = {k: v for k, v in os.environ.items() if k not in {"DB_CONN_MAX_AGE", "ASYNC_VIEWS", "DJANGO_ROOT_URLCONF"}}
+        code = "import core.asgi; from django.conf import settings; " + "; ".join(
+            f"print(settings.{name})" for name in names
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], env={**keep, **env}, capture_output=True, text=True, check=True
+        )
+        return result.stdout.split()
+
+    def test_asgi_entry_point_disables_persistent_connections(self):
+        assert self._asgi_settings("DATABASES['default']['CONN_MAX_AGE']") == ["0"]
+
+    def test_async_views_are_opt_in(self):
+        assert self._asgi_settings("ROOT_URLCONF") == ["core.urls"]
+        assert self._asgi_settings("ROOT_URLCONF", ASYNC_VIEWS="1") == ["core.asgi_urls"]
+
+    def test_sqlite_url_and_overrides(self):
+        config = self._config(
+            DATABASE_URL="sqlite:////tmp/x.sqlite3", DB_CONN_MAX_AGE="none",
+            DB_CONN_HEALTH_CHECKS="0",
+        )
+        assert config["NAME"] == "/tmp/x.sqlite3"
+        assert (config["CONN_MAX_AGE"], config["CONN_HEALTH_CHECKS"]) == (None, False)
+
+    def test_postgres_url_uses_pool_when_enabled(self):
+        config = self._config(
+            DATABASE_URL="postgres://app:s%40cret@db:5433/shop", DB_POOL="1", DB_POOL_MAX_SIZE="20"
+        )
+        assert config["ENGINE"] == "django.db.backends.postgresql"
+        assert (config["NAME"], config["USER"], config["PASSWORD"]) == ("shop", "app", "s@cret")
+        assert (config["HOST"], config["PORT"]) == ("db", "5433")
+        assert config["OPTIONS"]["pool"] == {"min_size": 2, "max_size": 20, "timeout": 10.0}
+        assert config["CONN_MAX_AGE"] == 0
+
+    def test_postgres_without_pool_keeps_connections(self):
+        config = self._config(DATABASE_URL="postgresql://db/shop")
+        assert "pool" not in config["OPTIONS"]
+        assert config["CONN_MAX_AGE"] == 60
+
+    def test_unknown_scheme(self):
+        from django.core.exceptions import ImproperlyConfigured
+
+        with pytest.raises(ImproperlyConfigured):
+            self._config(DATABASE_URL="mysql://db/shop")
+
+
+class TestReplicaRouter:
+    """Routing decisions only – no replica alias exists in the test DBs."""
+
+    def _middleware(self, seen):
+        from core.db_router import ReplicaRoutingMiddleware, ReplicaRouter
+        from offers_app.models import Offer
+
+        router = ReplicaRouter()
+
+        def view(request):
+            seen.append(router.db_for_read(Offer))
+            if request.GET.get("write"):
+                router.db_for_write(Offer)
+                seen.append(router.db_for_read(Offer))
+            return None
+
+        return ReplicaRoutingMiddleware(view)
+
+    def test_safe_requests_read_from_replica(self, settings):
+        from django.test import RequestFactory
+
+        settings.DATABASE_REPLICAS = ["replica1", "replica2"]
+        seen = []
+        self._middleware(seen)(RequestFactory().get("/api/offers/"))
+        assert seen[0] in {"replica1", "replica2"}
+
+    def test_unsafe_requests_and_writes_use_primary(self, settings):
+        from django.test import RequestFactory
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        seen = []
+        middleware = self._middleware(seen)
+        middleware(RequestFactory().post("/api/offers/"))
+        middleware(RequestFactory().get("/api/offers/", {"write": 1}))
+        assert seen == ["default", "replica1", "default"]
+
+    def test_caller_pinned_after_write(self, settings):
+        from django.test import RequestFactory
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        seen = []
+        middleware = self._middleware(seen)
+        auth = {"HTTP_AUTHORIZATION": "Token abc"}
+        middleware(RequestFactory().post("/api/offers/?write=1", **auth))
+        middleware(RequestFactory().get("/api/offers/", **auth))
+        middleware(RequestFactory().get("/api/offers/", HTTP_AUTHORIZATION="Token other"))
+        assert seen == ["default", "default", "default", "replica1"]
+
+    def test_unsafe_request_without_write_does_not_pin(self, settings):
+        from django.test import RequestFactory
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        seen = []
+        middleware = self._middleware(seen)
+        auth = {"HTTP_AUTHORIZATION": "Token abc"}
+        middleware(RequestFactory().post("/api/offers/", **auth))
+        middleware(RequestFactory().get("/api/offers/", **auth))
+        assert seen == ["default", "replica1"]
+
+    def test_tokens_are_read_from_primary(self, settings):
+        from django.test import RequestFactory
+        from core.db_router import ReplicaRoutingMiddleware, ReplicaRouter
+        from rest_framework.authtoken.models import Token
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        seen = []
+        ReplicaRoutingMiddleware(lambda request: seen.append(ReplicaRouter().db_for_read(Token)))(
+            RequestFactory().get("/api/offers/")
+        )
+        assert seen == ["default"]
+
+    def test_primary_without_replicas_or_request(self, settings):
+        from django.test import RequestFactory
+        from core.db_router import ReplicaRouter
+        from offers_app.models import Offer
+
+        settings.DATABASE_REPLICAS = []
+        seen = []
+        self._middleware(seen)(RequestFactory().get("/api/offers/"))
+        assert seen == ["default"]
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        assert ReplicaRouter().db_for_read(Offer) == "default"  # outside a request
+        assert ReplicaRouter().allow_migrate("replica1", "offers_app") is False
+
+    def test_replicas_require_a_shared_pin_cache(self, settings):
+        from core.db_router import check_pin_cache
+
+        settings.DATABASE_REPLICAS = []
+        assert check_pin_cache() == []
+        settings.DATABASE_REPLICAS = ["replica1"]
+        assert [e.id for e in check_pin_cache()] == ["core.E001"]
+        settings.CACHES = {"default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "cache",
+        }}
+        assert check_pin_cache() == []
+
+    def test_replica_aliases_from_env(self):
+        from pathlib import Path
+        from core.database import replica_configs
+
+        configs = replica_configs(
+            Path("/srv/app"),
+            env={"DATABASE_REPLICA_URLS": "sqlite:////tmp/a.sqlite3, sqlite:////tmp/b.sqlite3"},
+        )
+        assert list(configs) == ["replica1", "replica2"]
+        assert configs["replica2"]["NAME"] == "/tmp/b.sqlite3"
+        assert configs["replica1"]["TEST"] == {"MIRROR": "default"}
+
+
+@pytest.fixture
+def sqlite_replica(transactional_db, settings, tmp_path):
+    """
+    Serve ``default`` from one SQLite file and ``replica1`` from another.
+
+    Both start as copies of the test database; the replica never receives
+    later writes, i.e. it behaves like a replica lagging indefinitely.
+    """
+    import sqlite3
+    from django.db import connections
+    from django.db.backends.sqlite3.base import DatabaseWrapper
+
+    original = connections["default"]
+    original.ensure_connection()
+    wrappers = {}
+    for alias in ("default", "replica1"):
+        path = tmp_path / f"{alias}.sqlite3"
+        with sqlite3.connect(path) as target:
+            original.connection.backup(target)
+        target.close()
+        wrappers[alias] = DatabaseWrapper({**original.settings_dict, "NAME": str(path)}, alias)
+        connections[alias] = wrappers[alias]
+    settings.DATABASE_REPLICAS = ["replica1"]
+    try:
+        yield wrappers
+    finally:
+        for wrapper in wrappers.values():
+            wrapper.close()
+        connections["default"] = original
+        del connections["replica1"]
+
+
+class TestReplicaIntegration:
+    """Real queries against a primary and a lagging replica SQLite file."""
+
+    def test_reads_of_other_clients_hit_the_replica(self, sqlite_replica):
+        from auth_app.models import CustomUser
+        from offers_app.models import Offer
+        from rest_framework.authtoken.models import Token
+
+        user = CustomUser(id=100, username="reader", role="business")
+        for alias in ("default", "replica1"):   # bulk_create: no profile signal
+            CustomUser.objects.using(alias).bulk_create([user])
+            Token.objects.using(alias).create(user=user, key="reader-token")
+        Offer.objects.using("replica1").create(user=user, title="only on replica", description="-")
+
+        client = APIClient(HTTP_AUTHORIZATION="Token reader-token")
+        titles = [o["title"] for o in client.get(reverse("offer-list-create")).data["results"]]
+        assert titles == ["only on replica"]
+
+    def test_registration_then_get_reads_own_writes(self, sqlite_replica):
+        from auth_app.models import CustomUser
+
+        response = APIClient().post(reverse("registration"), {
+            "username": "fresh", "email": "fresh@example.com", "role": "customer",
+            "password": "Pw-123456!", "repeated_password": "Pw-123456!",
+        }, format="json")
+        assert response.status_code == 201
+        assert not CustomUser.objects.using("replica1").filter(username="fresh").exists()
+
+        client = APIClient(HTTP_AUTHORIZATION=f"Token {response.data['token']}")
+        profile = client.get(
+            reverse("user-profile-universal-detail", kwargs={"ref": response.data["user_id"]})
+        )
+        assert profile.status_code == 200
+        assert profile.data["username"] == "fresh"
+
+    def test_platform_stats_refresh_counts_on_primary(self, sqlite_replica):
+        from auth_app.models import CustomUser
+        from stats_app.models import PlatformStats
+
+        CustomUser.objects.create_user(username="biz", password="pw", role="business")
+        PlatformStats.objects.all().delete()
+        assert APIClient().get(reverse("base-info")).data["business_profile_count"] == 1
+        assert PlatformStats.objects.using("default").get().business_profile_count == 1
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def setup_method(self):
+        from core_utils.metrics import registry
+
+        registry.reset()
+        self.client = APIClient()
+
+    def _staff(self):
+        from auth_app.models import CustomUser
+
+        return CustomUser.objects.create_user(
+            username="metrics_staff", password="pw", role="customer", is_staff=True
+        )
+
+    def test_requires_staff(self):
+        from auth_app.models import CustomUser
+
+        assert self.client.get("/api/_metrics").status_code == 401
+        user = CustomUser.objects.create_user(username="metrics_user", password="pw", role="customer")
+        self.client.force_authenticate(user)
+        assert self.client.get("/api/_metrics").status_code == 403
+
+    def test_records_latency_queries_and_size_per_route(self):
+        from stats_app.models import PlatformStats
+
+        PlatformStats.refresh()
+        first = self.client.get("/api/base-info/")
+        self.client.get("/base-info/")
+        self.client.force_authenticate(self._staff())
+        body = self.client.get("/api/_metrics").content.decode()
+
+        labels = 'route="/base-info/",method="GET",status="200"'
+        assert f"http_request_duration_seconds_count{{{labels}}} 2" in body
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in body
+        assert f"http_db_queries_total{{{labels}}} 2" in body
+        assert f"http_response_bytes_total{{{labels}}} {2 * len(first.content)}" in body
+        assert "# TYPE http_request_duration_seconds histogram" in body
+
+    def test_unmatched_routes_share_one_series(self):
+        self.client.get("/api/nope/")
+        self.client.get("/api/also-nope/")
+        self.client.force_authenticate(self._staff())
+        body = self.client.get("/api/_metrics").content.decode()
+        assert 'http_request_duration_seconds_count{route="<unmatched>",method="GET",status="404"} 2' in body
+
+    def test_admin_requests_are_observed_once(self):
+        from core_utils.metrics import registry
+
+        self.client.force_login(self._staff())
+        assert self.client.get("/admin/").status_code == 200
+        series = registry.snapshot()[("/admin/", "GET", "200")]
+        assert series.requests == 1
+        assert series.queries >= 2      # session + user of the inner middleware stack
+
+    def test_threads_share_one_store(self):
+        import threading
+        from core_utils.metrics import registry
+
+        def observe():
+            registry.observe("/x/", "GET", 200, 0.01, 1, 0.001, 10)
+
+        threads = [threading.Thread(target=observe) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registry.snapshot()[("/x/", "GET", "200")].requests == 20
+        assert len(registry._series) == 1
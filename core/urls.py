@@ -1,32 +1,38 @@
 """
 URL configuration for the core Django project.
 
-Includes routes for admin and all apps with and without /api/ prefix.
+Every app route is served both with and without the ``/api/`` prefix.
+Instead of including each app urlconf twice (which makes the resolver walk
+all patterns a second time for root paths and for every 404), one flat
+pattern list is mounted behind an *optional* ``api/`` prefix.  ``reverse()``
+keeps returning the un‑prefixed paths as before.
 """
 
+from importlib import import_module
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import include, path, re_path
+
+API_URLCONFS = (
+    "auth_app.api.urls",
+    "users_app.api.urls",
+    "offers_app.api.urls",
+    "orders_app.api.urls",
+    "reviews_app.api.urls",
+    "stats_app.api.urls",
+    "core.api.urls",
+)
+
+# one flat list – no nested resolver per app
+api_urlpatterns = [
+    pattern
+    for module in API_URLCONFS
+    for pattern in import_module(module).urlpatterns
+]
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-
-    path('api/', include('auth_app.api.urls')),
-    path('', include('auth_app.api.urls')),
-
-    path('api/', include('users_app.api.urls')),
-    path('', include('users_app.api.urls')),
-
-    path('api/', include('offers_app.api.urls')),
-    path('', include('offers_app.api.urls')),
-
-    path('api/', include('orders_app.api.urls')),
-    path('', include('orders_app.api.urls')),
-
-    path('api/', include('reviews_app.api.urls')),
-    path('', include('reviews_app.api.urls')),
-
-    path('api/', include('core.api.urls')),
-    path('', include('core.api.urls')),
+    re_path(r'^(?:api/)?', include(api_urlpatterns)),
 ]
 
-handler404 = "core.views.error_404"
\ No newline at end of file
+handler404 = "core.views.error_404"
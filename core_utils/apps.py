@@ -4,3 +4,28 @@ from django.apps import AppConfig
 class CoreUtilsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core_utils'
+
+    def ready(self):
+        from django.core import checks
+        from django.core.signals import request_finished, request_started
+        from django.db.backends.signals import connection_created
+        from django.test.signals import setting_changed
+
+        from core.db_router import check_pin_cache
+
+        from .metrics import install_query_recorder
+        from .nplusone import install_query_tracer
+        from .slowlog import (
+            forget_request, install_slow_query_logger, remember_request, reset_options,
+        )
+
+        # execute wrappers on every new connection (outermost first)
+        connection_created.connect(install_slow_query_logger, dispatch_uid="core_utils.slowlog")
+        connection_created.connect(install_query_recorder, dispatch_uid="core_utils.metrics")
+        connection_created.connect(install_query_tracer, dispatch_uid="core_utils.nplusone")
+
+        request_started.connect(remember_request, dispatch_uid="core_utils.slowlog")
+        request_finished.connect(forget_request, dispatch_uid="core_utils.slowlog")
+        setting_changed.connect(reset_options, dispatch_uid="core_utils.slowlog")
+
+        checks.register(check_pin_cache, checks.Tags.caches)
@@ -0,0 +1,48 @@
+"""
+Minimal async base view for read‑only JSON endpoints.
+
+DRF's ``APIView`` is synchronous; under ASGI every DRF view is run in a
+worker thread.  :class:`AsyncAPIView` is a plain Django async ``View`` that
+keeps the parts of DRF the read endpoints rely on – token authentication
+(through :class:`~auth_app.authentication.CachedTokenAuthentication`),
+DRF‑style 401 bodies and DRF's JSON rendering – so responses are
+byte‑compatible with their sync counterparts.
+"""
+
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.renderers import JSONRenderer
+
+from auth_app.authentication import CachedTokenAuthentication
+
+
+class AsyncAPIView(View):
+    """Async ``GET`` view with optional token authentication."""
+
+    http_method_names = ["get", "head", "options"]
+    authentication_required = False
+    authenticator = CachedTokenAuthentication()
+    renderer = JSONRenderer()
+
+    async def dispatch(self, request, *args, **kwargs):
+        if self.authentication_required:
+            try:
+                result = await self.authenticator.aauthenticate(request)
+            except exceptions.AuthenticationFailed as exc:
+                return self.unauthorized(exc.detail)
+            if result is None:
+                return self.unauthorized(exceptions.NotAuthenticated.default_detail)
+            request.user, request.auth = result
+        return await super().dispatch(request, *args, **kwargs)
+
+    # ------------------------------------------------------------------ #
+    def render(self, data, status: int = 200) -> HttpResponse:
+        return HttpResponse(
+            self.renderer.render(data), content_type="application/json", status=status
+        )
+
+    def unauthorized(self, detail) -> HttpResponse:
+        response = self.render({"detail": str(detail)}, status=401)
+        response["WWW-Authenticate"] = self.authenticator.authenticate_header(None)
+        return response
@@ -0,0 +1,87 @@
+"""
+Run independent ORM queries concurrently.
+
+Composite endpoints (dashboard, stats summary) issue several queries that
+do not depend on each other.  Run one after another, their latency is the
+*sum*; run side by side, it is bounded by the *slowest* one.
+
+* :func:`run_concurrently` – sync code: a shared thread pool, every worker
+  on its own DB connection (closed / recycled per ``CONN_MAX_AGE``).
+* :func:`gather` – async code: a keyed ``asyncio.gather``.  Django's async
+  ORM methods (``acount()``, ``aexists()`` …) all run through
+  ``sync_to_async(thread_sensitive=True)`` on one shared thread, so ORM
+  calls gathered this way still execute one after another; only other
+  awaitables (HTTP calls, cache round trips) overlap with them.
+
+Settings (optional)::
+
+    CONCURRENT_QUERY_WORKERS = 0   # 0 → run serially (default)
+
+Threads only pay off with a networked database.  Inside an open
+transaction the callables always run serially on the calling thread –
+other connections would not see its uncommitted rows.
+
+Workers run in a copy of the caller's ``contextvars`` context, so per‑request
+state (request metrics, N+1 trace, replica routing) covers their queries
+too; ``asyncio.gather`` tasks copy the context on their own.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        if workers not in _executors:
+            _executors[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="queries"
+            )
+        return _executors[workers]
+
+
+def _in_worker(fn: Callable):
+    close_old_connections()
+    try:
+        return fn()
+    finally:
+        close_old_connections()
+
+
+def run_concurrently(tasks: dict[str, Callable], workers: int | None = None) -> dict:
+    """
+    Call every ``tasks`` value and return ``{name: result}``.
+
+    Exceptions propagate to the caller (the first one in *tasks* order).
+    """
+    if workers is None:
+        workers = getattr(settings, "CONCURRENT_QUERY_WORKERS", 0)
+    if workers <= 0 or len(tasks) < 2 or connection.in_atomic_block:
+        return {name: fn() for name, fn in tasks.items()}
+
+    pool = _executor(workers)
+    futures = {
+        # one copy per task – a context cannot be entered by two threads at once
+        name: pool.submit(contextvars.copy_context().run, _in_worker, fn)
+        for name, fn in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+async def gather(**awaitables: Awaitable) -> dict:
+    """
+    ``asyncio.gather`` keyed by name: ``await gather(a=qs.acount(), …)``.
+
+    Async ORM calls are serialised on Django's thread‑sensitive thread –
+    this saves no database time, see the module docstring.
+    """
+    results = await asyncio.gather(*awaitables.values())
+    return dict(zip(awaitables, results))
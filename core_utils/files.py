@@ -0,0 +1,18 @@
+"""
+Helpers for stored files in ``values()`` fast paths.
+"""
+
+from django.core.files.storage import default_storage
+
+
+def file_url(name: str, request=None, storage=None) -> str:
+    """
+    Render a stored file name like DRF's ``FileField`` / ``ImageField``.
+
+    Empty names become ``""``; with *request* the URL is absolute.
+    *storage* defaults to the project's default storage.
+    """
+    if not name:
+        return ""
+    url = (storage or default_storage).url(name)
+    return request.build_absolute_uri(url) if request is not None else url
@@ -0,0 +1,147 @@
+"""
+Per‑process request metrics in Prometheus text format.
+
+:class:`core.middleware.MetricsMiddleware` records, per route / method /
+status: a latency histogram, the number and total time of SQL statements,
+and response bytes.  ``GET /api/_metrics`` (staff only) renders them.
+
+Aggregates live in one dict guarded by a lock that is held only for the
+few additions of one observation, so memory stays bounded by the number
+of series however many threads a server starts.  Each worker process
+exports its own figures – scrape every process, or sum in Prometheus.
+
+SQL is counted by an execute wrapper that :func:`install_query_recorder`
+adds to every new connection (``connection_created``, hooked up in
+``core_utils.apps``); it reports into a ``ContextVar`` so it also sees
+queries that async views run in worker threads.
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class QueryStats:
+    """SQL statements executed while serving one request."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+current_queries: ContextVar[QueryStats | None] = ContextVar("current_queries", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = current_queries.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - start
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """``connection_created`` receiver; wrappers survive reconnects."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class _Series:
+    __slots__ = ("requests", "latency_sum", "buckets", "queries", "query_seconds", "bytes")
+
+    def __init__(self):
+        self.requests = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last = +Inf
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.bytes = 0
+
+
+class MetricsRegistry:
+    """Process‑wide series, one lock for updates and exports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: dict[tuple, _Series] = {}
+
+    def observe(self, route, method, status, seconds, queries, query_seconds, size):
+        key = (route, method, str(status))
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.requests += 1
+            series.latency_sum += seconds
+            series.buckets[bucket] += 1
+            series.queries += queries
+            series.query_seconds += query_seconds
+            series.bytes += size
+
+    def snapshot(self) -> dict:
+        copied = {}
+        with self._lock:
+            for key, series in self._series.items():
+                copy = copied[key] = _Series()
+                for attr in _Series.__slots__:
+                    value = getattr(series, attr)
+                    setattr(copy, attr, list(value) if attr == "buckets" else value)
+        return copied
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    # ------------------------------------------------------------------ #
+    def render_prometheus(self) -> str:
+        data = sorted(self.snapshot().items())
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def labels(key, **extra):
+            route, method, status = key
+            pairs = {"route": route, "method": method, "status": status, **extra}
+            body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items())
+            return "{" + body + "}"
+
+        family("http_request_duration_seconds", "histogram", "Request latency per route.")
+        for key, series in data:
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), series.buckets):
+                cumulative += count
+                lines.append(
+                    f"http_request_duration_seconds_bucket{labels(key, le=str(bound))} {cumulative}"
+                )
+            lines.append(f"http_request_duration_seconds_sum{labels(key)} {series.latency_sum:.6f}")
+            lines.append(f"http_request_duration_seconds_count{labels(key)} {series.requests}")
+
+        for name, attr, help_text, fmt in (
+            ("http_db_queries_total", "queries", "SQL statements executed per route.", "{}"),
+            ("http_db_query_seconds_total", "query_seconds", "Time spent in SQL per route.", "{:.6f}"),
+            ("http_response_bytes_total", "bytes", "Response body bytes per route.", "{}"),
+        ):
+            family(name, "counter", help_text)
+            for key, series in data:
+                lines.append(f"{name}{labels(key)} {fmt.format(getattr(series, attr))}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
@@ -1,3 +1,59 @@
+"""
+Shared model helpers.
+
+:class:`TracksLoadedValues` remembers the field values an instance was read
+with, so ``pre_save`` / ``post_save`` handlers can tell whether a field
+really changed without selecting the stored row again.
+"""
+
 from django.db import models
 
-# Create your models here.
+
+class TracksLoadedValues(models.Model):
+    """Abstract base: ``changed_fields()`` compares against the loaded row."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # the written values are the stored ones from now on; with
+        # update_fields, unsaved changes to other fields stay pending
+        update_fields = kwargs.get("update_fields")
+        deferred = self.get_deferred_fields()
+        saved = {
+            f.attname: getattr(self, f.attname)
+            for f in self._meta.concrete_fields
+            if f.attname not in deferred
+            and (update_fields is None or f.name in update_fields or f.attname in update_fields)
+        }
+        if update_fields is None:
+            self._loaded_values = saved
+        else:
+            self._loaded_values = {**getattr(self, "_loaded_values", {}), **saved}
+
+    def loaded_value(self, field: str, default=None):
+        """Value of *field* when the instance was read or last saved."""
+        return getattr(self, "_loaded_values", {}).get(field, default)
+
+    def changed_fields(self, *fields: str, update_fields=None) -> set[str]:
+        """
+        Those of *fields* whose value differs from the stored one.
+
+        Fields not written by a ``save(update_fields=...)`` never change;
+        new instances and instances built without ``from_db`` report every
+        field as changed.
+        """
+        if update_fields is not None:
+            fields = [f for f in fields if f in update_fields]
+        loaded = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded is None:
+            return set(fields)
+        missing = object()
+        return {f for f in fields if loaded.get(f, missing) != getattr(self, f)}
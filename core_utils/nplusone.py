@@ -0,0 +1,196 @@
+"""
+N+1 query detection.
+
+While a :class:`QueryTrace` is active (``with tracing():``), every SQL
+statement is recorded as a *normalized template* plus the first stack frame
+in project code that issued it (its *origin*).  The same template from the
+same origin repeating more than ``THRESHOLD`` times in one request is the
+classic N+1 signature – e.g. a ``SerializerMethodField`` querying per row.
+
+Two consumers:
+
+* :class:`core.middleware.NPlusOneMiddleware` traces each request in
+  development and logs / raises on repeats.  It also enforces the
+  ``query_budget`` a view may declare (total statements per request).
+* ``core_utils.pytest_plugin`` – the test suite enforces declared budgets
+  for every request and offers the ``nplusone`` fixture for strict checks.
+
+Settings::
+
+    NPLUSONE = {
+        "ENABLED": False,       # opt‑in: every statement walks the stack
+        "THRESHOLD": 5,         # repeats of one template/origin allowed
+        "ON_REPEAT": "log",     # "log" | "warn" | "raise"
+        "ON_BUDGET": "log",     # "log" | "warn" | "raise"
+    }
+
+The recorder is installed on every connection by the ``core_utils`` ready
+hook and costs one ``ContextVar`` lookup per statement while inactive.
+"""
+
+import logging
+import re
+import sys
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger("core_utils.nplusone")
+
+DEFAULTS = {"ENABLED": False, "THRESHOLD": 5, "ON_REPEAT": "log", "ON_BUDGET": "log"}
+# instrumentation frames (this package's wrappers, request middleware)
+_SKIP_PREFIX = str(Path(__file__).resolve().parent)
+_SKIP_SUFFIX = "middleware.py"
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(AssertionError):
+    """A statement repeated more often than ``THRESHOLD`` in one request."""
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A view issued more statements than its declared ``query_budget``."""
+
+
+def options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "NPLUSONE", {})}
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse literals and ``IN (%s, %s, …)`` lists into one template."""
+    sql = _IN_LIST.sub("(%s, ...)", sql)
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("N", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def _origin() -> str:
+    """First project frame (outside the detector) on the current stack."""
+    root = str(Path(settings.BASE_DIR))
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(root)
+            and "site-packages" not in filename
+            and not filename.startswith(_SKIP_PREFIX)
+            and not filename.endswith(_SKIP_SUFFIX)
+        ):
+            relative = filename[len(root):].lstrip("/\\")
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class QueryTrace:
+    """
+    Statements of one request / block, grouped by (template, origin).
+
+    Traces nest: a statement is counted in the active trace and all
+    enclosing ones (e.g. the ``nplusone`` fixture around a request that
+    the middleware traces as well).
+    """
+
+    def __init__(self, parent: "QueryTrace | None" = None):
+        self.counts: Counter = Counter()
+        self.parent = parent
+
+    def add(self, sql: str) -> None:
+        key = (normalize_sql(sql), _origin())
+        trace = self
+        while trace is not None:
+            trace.counts[key] += 1
+            trace = trace.parent
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def repeated(self, threshold: int) -> list[tuple[str, str, int]]:
+        return [
+            (template, origin, count)
+            for (template, origin), count in self.counts.most_common()
+            if count > threshold
+        ]
+
+
+current_trace: ContextVar[QueryTrace | None] = ContextVar("current_trace", default=None)
+
+
+def trace_query(execute, sql, params, many, context):
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add(sql)
+    return execute(sql, params, many, context)
+
+
+def install_query_tracer(sender, connection, **kwargs):
+    """``connection_created`` receiver; wrappers survive reconnects."""
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(trace_query)
+
+
+@contextmanager
+def tracing():
+    trace = QueryTrace(parent=current_trace.get())
+    token = current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        current_trace.reset(token)
+
+
+# ---------------------------------------------------------------------
+# reporting
+# ---------------------------------------------------------------------
+def repeat_problems(trace: QueryTrace, threshold: int, label: str = "") -> list[str]:
+    return [
+        f"{label}: {count}× from {origin}: {template[:200]}"
+        for template, origin, count in trace.repeated(threshold)
+    ]
+
+
+def budget_problem(trace: QueryTrace, budget: int | None, label: str = "") -> str | None:
+    if budget is None or trace.total <= budget:
+        return None
+    top = ", ".join(
+        f"{count}× {origin}" for (_, origin), count in trace.counts.most_common(3)
+    )
+    return f"{label}: {trace.total} queries, budget {budget} (top: {top})"
+
+
+def react(action: str, problems: list[str], error: type[AssertionError]) -> None:
+    """Apply an ``ON_*`` action (``log`` / ``warn`` / ``raise``) to *problems*."""
+    if not problems:
+        return
+    message = "\n".join(problems)
+    if action == "raise":
+        raise error(message)
+    if action == "warn":
+        warnings.warn(message, RuntimeWarning, stacklevel=2)
+    else:
+        logger.warning(message)
+
+
+def view_budget(request) -> int | None:
+    """
+    ``query_budget`` declared on the resolved view class, if any.
+
+    Either an ``int`` for every method or ``{"GET": 3, ...}`` per method.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    view_class = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(request.method)
+    return budget
@@ -0,0 +1,56 @@
+"""
+pytest plugin for :mod:`core_utils.nplusone` (enabled in ``conftest.py``).
+
+* Every test runs with the detector on: a request exceeding its view's
+  ``query_budget`` fails the test (``QueryBudgetExceeded``); repeated
+  statements only warn.  Mark a test ``@pytest.mark.no_query_budget`` to
+  opt out.
+* ``nplusone`` fixture – strict check for a block::
+
+      def test_list(client, nplusone):
+          with nplusone(threshold=2):
+              client.get("/api/offers/")
+"""
+
+from contextlib import contextmanager
+
+import pytest
+
+from core_utils import nplusone as detector
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "no_query_budget: do not enforce declared view query budgets"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _enforce_query_budgets(request, settings):
+    """Turn budget overruns into test failures; repeats into warnings."""
+    if request.node.get_closest_marker("no_query_budget"):
+        yield
+        return
+    settings.NPLUSONE = {
+        **detector.options(),
+        "ENABLED": True,
+        "ON_REPEAT": "warn",
+        "ON_BUDGET": "raise",
+    }
+    yield
+
+
+@pytest.fixture
+def nplusone():
+    """Context manager failing when a statement repeats more than *threshold* times."""
+
+    @contextmanager
+    def check(threshold: int | None = None):
+        limit = detector.options()["THRESHOLD"] if threshold is None else threshold
+        with detector.tracing() as trace:
+            yield trace
+        problems = detector.repeat_problems(trace, limit, "block")
+        if problems:
+            raise detector.NPlusOneError("\n".join(problems))
+
+    return check
@@ -0,0 +1,159 @@
+"""
+Slow‑query log with automatic ``EXPLAIN`` capture.
+
+:func:`install_slow_query_logger` (``connection_created``, hooked up in
+``core_utils.apps``) adds :func:`log_slow_query` to the execute wrappers of
+every connection.  A statement slower than ``THRESHOLD_MS`` is logged to
+the ``core_utils.slowlog`` logger – a rotating file
+(:class:`SlowQueryFileHandler`, see ``LOGGING``) – with
+
+* the route of the request it ran in (``GET /orders/<int:pk>/`` – the URL
+  pattern, resolved only when a query is logged, so the entries of one
+  endpoint group together; ``-`` outside requests),
+* the parameter *shapes* (types and list lengths, never the values),
+* the SQL and its plan: ``EXPLAIN QUERY PLAN`` on SQLite, ``EXPLAIN`` on
+  Postgres.  The plan is read on a separate raw cursor, so it neither
+  disturbs the caller's result set nor shows up in query metrics.
+
+Settings::
+
+    SLOW_QUERY_LOG = {"ENABLED": False, "THRESHOLD_MS": 200, "EXPLAIN": True}
+
+Off by default: the ``EXPLAIN`` runs against the live database.  The
+settings are read once (and again on ``setting_changed``); with the log
+disabled the wrapper only checks a flag.
+"""
+
+import logging
+import logging.handlers
+import time
+from contextvars import ContextVar
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger("core_utils.slowlog")
+
+DEFAULTS = {"ENABLED": False, "THRESHOLD_MS": 200, "EXPLAIN": True}
+EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+# (method, path_info) of the running request
+current_request: ContextVar[tuple[str, str] | None] = ContextVar("slowlog_request", default=None)
+
+
+@cache
+def options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "SLOW_QUERY_LOG", {})}
+
+
+def reset_options(sender, setting, **kwargs):
+    """``setting_changed`` receiver."""
+    if setting == "SLOW_QUERY_LOG":
+        options.cache_clear()
+
+
+class SlowQueryFileHandler(logging.handlers.RotatingFileHandler):
+    """``RotatingFileHandler`` that creates its directory on first write."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+# ---------------------------------------------------------------------
+# request label (request_started / request_finished receivers)
+# ---------------------------------------------------------------------
+def remember_request(sender, environ=None, scope=None, **kwargs):
+    if environ is not None:
+        request = (environ.get("REQUEST_METHOD", ""), environ.get("PATH_INFO", ""))
+    elif scope is not None:
+        path = scope.get("path", "").removeprefix(scope.get("root_path", ""))
+        request = (scope.get("method", ""), path)
+    else:
+        request = None
+    current_request.set(request)
+
+
+def forget_request(sender, **kwargs):
+    current_request.set(None)
+
+
+def request_label() -> str:
+    """``GET /offers/<int:pk>/`` for the running request, ``-`` outside one."""
+    from core.middleware import route_label  # core.middleware imports core_utils
+
+    request = current_request.get()
+    if request is None:
+        return "-"
+    method, path = request
+    try:
+        return f"{method} {route_label(resolve(path))}"
+    except Resolver404:
+        return f"{method} {path}"
+
+
+# ---------------------------------------------------------------------
+# wrapper
+# ---------------------------------------------------------------------
+def param_shapes(params, many: bool) -> str:
+    if many:
+        params = list(params or ())
+        first = param_shapes(params[0], False) if params else ""
+        return f"{len(params)}× ({first})"
+    if params is None:
+        return ""
+    values = params.values() if isinstance(params, dict) else params
+    shapes = []
+    for value in values:
+        if isinstance(value, (list, tuple, set)):
+            shapes.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            shapes.append(type(value).__name__)
+    return ", ".join(shapes)
+
+
+def explain(connection, sql: str, params, many: bool) -> str:
+    prefix = EXPLAIN_PREFIX.get(connection.vendor)
+    if prefix is None or many or not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return ""
+    cursor = connection.create_cursor()  # raw cursor: bypasses all wrappers
+    try:
+        cursor.execute(prefix + sql, params)
+        rows = cursor.fetchall()
+    except Exception as exc:  # the plan is best effort, never break the query
+        return f"<EXPLAIN failed: {exc}>"
+    finally:
+        cursor.close()
+    return "\n".join("  " + " | ".join(str(col) for col in row) for row in rows)
+
+
+def log_slow_query(execute, sql, params, many, context):
+    config = options()
+    if not config["ENABLED"]:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= config["THRESHOLD_MS"]:
+            connection = context["connection"]
+            plan = explain(connection, sql, params, many) if config["EXPLAIN"] else ""
+            logger.warning(
+                "slow query %.1f ms [%s] %s | params: %s\n  %s%s",
+                elapsed_ms,
+                connection.alias,
+                request_label(),
+                param_shapes(params, many) or "-",
+                sql,
+                f"\n plan:\n{plan}" if plan else "",
+            )
+
+
+def install_slow_query_logger(sender, connection, **kwargs):
+    """``connection_created`` receiver; wrappers survive reconnects."""
+    if log_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_query)
@@ -0,0 +1,226 @@
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from auth_app.models import CustomUser
+from core_utils.concurrency import gather, run_concurrently
+
+
+def _thread_name():
+    return threading.current_thread().name
+
+
+@pytest.mark.django_db
+class TestRunConcurrently:
+    def test_serial_inside_transaction(self, settings):
+        settings.CONCURRENT_QUERY_WORKERS = 4
+        result = run_concurrently({"a": _thread_name, "b": _thread_name})
+        assert result == {"a": threading.current_thread().name, "b": threading.current_thread().name}
+
+    def test_serial_by_default(self):
+        assert run_concurrently({"one": lambda: 1, "two": lambda: 2}) == {"one": 1, "two": 2}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRunConcurrentlyThreaded:
+    def test_queries_run_on_pool_threads(self, settings):
+        settings.CONCURRENT_QUERY_WORKERS = 2
+        CustomUser.objects.create_user(username="conc_biz", password="pw", role="business")
+
+        result = run_concurrently({
+            "business": lambda: (CustomUser.objects.filter(role="business").count(), _thread_name()),
+            "customer": lambda: (CustomUser.objects.filter(role="customer").count(), _thread_name()),
+        })
+        assert result["business"][0] == 1
+        assert result["customer"][0] == 0
+        assert all(name.startswith("queries") for _, name in result.values())
+
+    def test_pool_queries_reach_request_metrics_and_traces(self, settings):
+        from core_utils.metrics import QueryStats, current_queries
+        from core_utils.nplusone import tracing
+
+        settings.CONCURRENT_QUERY_WORKERS = 2
+        stats = QueryStats()
+        token = current_queries.set(stats)
+        try:
+            with tracing() as trace:
+                run_concurrently({
+                    "count": lambda: CustomUser.objects.count(),
+                    "exists": lambda: CustomUser.objects.exists(),
+                })
+        finally:
+            current_queries.reset(token)
+        assert stats.count == 2
+        assert trace.total == 2
+
+    def test_exceptions_propagate(self, settings):
+        settings.CONCURRENT_QUERY_WORKERS = 2
+
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_concurrently({"ok": lambda: 1, "boom": boom})
+
+
+@pytest.mark.django_db
+def test_gather_keys_async_results():
+    CustomUser.objects.create_user(username="gather_biz", password="pw", role="business")
+
+    async def run():
+        return await gather(
+            business=CustomUser.objects.filter(role="business").acount(),
+            exists=CustomUser.objects.filter(username="nobody").aexists(),
+        )
+
+    assert async_to_sync(run)() == {"business": 1, "exists": False}
+
+
+class TestNormalizeSql:
+    def test_collapses_literals_and_in_lists(self):
+        from core_utils.nplusone import normalize_sql
+
+        assert normalize_sql(
+            "SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'x'  LIMIT 21"
+        ) == "SELECT * FROM t WHERE id IN (%s, ...) AND name = ? LIMIT N"
+
+
+@pytest.mark.django_db
+class TestNPlusOneDetector:
+    def setup_method(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(username="n1_biz", password="pw", role="business")
+        self.client.force_authenticate(self.user)
+
+    def test_fixture_reports_per_row_queries_with_origin(self, nplusone):
+        from core_utils.nplusone import NPlusOneError
+        from offers_app.models import Offer
+
+        for i in range(4):
+            Offer.objects.create(user=self.user, title=f"Offer {i}", description="d")
+
+        with pytest.raises(NPlusOneError) as excinfo:
+            with nplusone(threshold=2):
+                self.client.get("/api/offers/")
+        assert "offers_app/api/serializers.py" in str(excinfo.value)
+
+    def test_declared_budget_is_enforced(self, monkeypatch):
+        from core_utils.nplusone import QueryBudgetExceeded
+        from reviews_app.api.views import ReviewViewSet
+
+        monkeypatch.setattr(ReviewViewSet, "query_budget", {"GET": 0})
+        with pytest.raises(QueryBudgetExceeded):
+            self.client.get("/api/reviews/")
+
+    @pytest.mark.no_query_budget
+    def test_middleware_logs_repeats(self, settings, caplog):
+        from offers_app.models import Offer
+
+        for i in range(3):
+            Offer.objects.create(user=self.user, title=f"Offer {i}", description="d")
+        settings.NPLUSONE = {"ENABLED": True, "THRESHOLD": 1, "ON_REPEAT": "log"}
+
+        with caplog.at_level("WARNING", logger="core_utils.nplusone"):
+            assert self.client.get("/api/offers/").status_code == 200
+        assert "GET /api/offers/" in caplog.text
+
+
+@pytest.mark.django_db
+class TestSlowQueryLog:
+    @pytest.fixture(autouse=True)
+    def _log_everything(self, settings, monkeypatch):
+        from core_utils import slowlog
+
+        settings.SLOW_QUERY_LOG = {"ENABLED": True, "THRESHOLD_MS": 0, "EXPLAIN": True}
+        monkeypatch.setattr(slowlog.logger, "handlers", [])  # keep the log file clean
+
+    def test_logs_route_param_shapes_and_plan(self, caplog):
+        from rest_framework.test import APIClient
+
+        user = CustomUser.objects.create_user(username="slow_biz", password="pw", role="business")
+        client = APIClient()
+        client.force_authenticate(user)
+        with caplog.at_level("WARNING", logger="core_utils.slowlog"):
+            assert client.get("/api/orders/4711/").status_code == 404
+
+        orders = [r.getMessage() for r in caplog.records if '"orders_app_order"' in r.getMessage()]
+        assert orders
+        assert "GET /orders/<int:pk>/ " in orders[0]
+        assert "4711" not in orders[0]
+        assert "params: int" in orders[0]
+        assert "plan:" in orders[0]
+
+    def test_plan_does_not_disturb_results(self):
+        CustomUser.objects.create_user(username="slow_a", password="pw", role="business")
+        CustomUser.objects.create_user(username="slow_b", password="pw", role="business")
+        names = list(
+            CustomUser.objects.filter(username__startswith="slow_").order_by("username")
+            .values_list("username", flat=True)
+        )
+        assert names == ["slow_a", "slow_b"]
+
+    def test_param_shapes(self):
+        from core_utils.slowlog import param_shapes
+
+        assert param_shapes((1, "x", [1, 2, 3]), many=False) == "int, str, list[3]"
+        assert param_shapes([(1, "a"), (2, "b")], many=True) == "2× (int, str)"
+
+    def test_settings_are_read_once(self, settings, monkeypatch):
+        from core_utils import slowlog
+
+        slowlog.options()
+        with monkeypatch.context() as patched:
+            patched.setattr(slowlog, "DEFAULTS", None)  # a re‑merge would fail
+            CustomUser.objects.count()
+        settings.SLOW_QUERY_LOG = {"ENABLED": False}
+        assert slowlog.options()["ENABLED"] is False
+
+    def test_disabled_by_default(self, settings, caplog):
+        del settings.SLOW_QUERY_LOG
+        with caplog.at_level("WARNING", logger="core_utils.slowlog"):
+            CustomUser.objects.count()
+        assert not caplog.records
+
+    def test_file_handler_creates_directory_on_first_write(self, tmp_path):
+        import logging
+
+        from core_utils.slowlog import SlowQueryFileHandler
+
+        log_file = tmp_path / "logs" / "slow_queries.log"
+        handler = SlowQueryFileHandler(log_file, delay=True)
+        try:
+            assert not log_file.parent.exists()
+            handler.emit(logging.makeLogRecord({"msg": "slow query"}))
+        finally:
+            handler.close()
+        assert log_file.read_text().strip() == "slow query"
+
+
+@pytest.mark.django_db
+class TestTracksLoadedValues:
+    def test_changed_fields_compare_with_loaded_row(self, django_assert_num_queries):
+        CustomUser.objects.create_user(username="tracked", password="pw", role="customer")
+        user = CustomUser.objects.get(username="tracked")
+        with django_assert_num_queries(0):
+            assert user.changed_fields("role", "username") == set()
+            user.role = "business"
+            assert user.changed_fields("role", "username") == {"role"}
+            assert user.changed_fields("role", update_fields=["email"]) == set()
+        user.save()
+        assert user.loaded_value("role") == "business"
+        assert user.changed_fields("role") == set()
+
+    def test_partial_save_keeps_other_changes_pending(self):
+        CustomUser.objects.create_user(username="partial", password="pw", role="customer")
+        user = CustomUser.objects.get(username="partial")
+        user.role = "business"
+        user.email = "partial@example.com"
+        user.save(update_fields=["email"])
+        assert user.changed_fields("role", "email") == {"role"}
+        assert user.loaded_value("role") == "customer"
+
+    def test_new_instances_report_every_field(self):
+        assert CustomUser(username="fresh").changed_fields("role", "username") == {"role", "username"}
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_remove_offerdetail_url'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='offer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -17,7 +17,7 @@ class Offer(models.Model):
     )
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # incremental rollups (stats_app.rollups)
     min_price = models.DecimalField(
         max_digits=10, decimal_places=2, null=True, blank=True
     )
@@ -0,0 +1,43 @@
+"""
+Native async variants of the order‑count endpoints (ASGI only).
+
+Same contract as :class:`OrderCountAPIView` /
+:class:`CompletedOrderCountAPIView`: token auth, business‑user ID from
+the path or ``?business_user_id=``, 400 / 404 on missing ID / user.
+"""
+
+from django.contrib.auth import get_user_model
+
+from core_utils.async_views import AsyncAPIView
+from core_utils.concurrency import gather
+from orders_app.models import Order
+
+
+class AsyncOrderCountView(AsyncAPIView):
+    """Count the orders of one business user in ``status``."""
+
+    authentication_required = True
+    query_budget = 3            # token + business user + count
+    status = "in_progress"
+    response_key = "order_count"
+
+    async def get(self, request, business_user_id=None):
+        user_id = business_user_id or request.GET.get("business_user_id")
+        if not user_id:
+            return self.render({"detail": "business_user_id is required."}, status=400)
+
+        # one await for both; the async ORM still runs them one after
+        # another on Django's thread‑sensitive thread
+        User = get_user_model()
+        results = await gather(
+            exists=User.objects.filter(id=user_id, role="business").aexists(),
+            count=Order.objects.filter(business_user_id=user_id, status=self.status).acount(),
+        )
+        if not results["exists"]:
+            return self.render({"detail": "Business user not found."}, status=404)
+        return self.render({self.response_key: results["count"]})
+
+
+class AsyncCompletedOrderCountView(AsyncOrderCountView):
+    status = "completed"
+    response_key = "completed_order_count"
@@ -19,19 +19,15 @@ urlpatterns = [
     path("orders/<int:pk>/", OrderDetailAPIView.as_view(), name="order-detail"),
 
     # -------  counts  -------
-    # optional trailing slash – regex `/?$`
+    # ID from the path or ?business_user_id=, optional trailing slash
     re_path(
-        r"^order-count/(?P<business_user_id>\d+)/?$",
+        r"^order-count(?:/(?P<business_user_id>\d+))?/?$",
         OrderCountAPIView.as_view(),
         name="order-count",
     ),
     re_path(
-        r"^completed-order-count/(?P<business_user_id>\d+)/?$",
+        r"^completed-order-count(?:/(?P<business_user_id>\d+))?/?$",
         CompletedOrderCountAPIView.as_view(),
         name="completed-order-count",
     ),
-    
-    re_path(r"^order-count/?$", OrderCountAPIView.as_view(), name="order-count-alt"),
-    re_path(r"^completed-order-count/?$", CompletedOrderCountAPIView.as_view(), name="completed-order-count-alt"),
-
 ]
\ No newline at end of file
@@ -115,6 +115,7 @@ class _BusinessOrderCountMixin:
     """Shared helpers for order‑count endpoints."""
 
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3            # token + business user + count
 
     @staticmethod
     def _resolve_user_id(request, path_id):
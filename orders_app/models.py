@@ -29,7 +29,7 @@ class Order(models.Model):
         max_length=20, choices=STATUS_CHOICES, default="in_progress"
     )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # incremental rollups (stats_app.rollups)
 
     def __str__(self):
         return f"Order {self.id}: {self.title} ({self.customer_user} → {self.business_user})"
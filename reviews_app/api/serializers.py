@@ -1,8 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+
 from reviews_app.models import Review
-from django.contrib.auth import get_user_model
+from users_app.models import UserProfile
 
 User = get_user_model()
+
+
+class ReviewUserDetailsSerializer(serializers.ModelSerializer):
+    """Minimal profile chip embedded via ``?expand=reviewer,business_user``."""
+
+    username = serializers.CharField(source="user.username", read_only=True)
+
+    class Meta:
+        model = UserProfile
+        fields = ["username", "first_name", "last_name", "file"]
+
+    def to_representation(self, instance):
+        rep = super().to_representation(instance)
+        if rep.get("file") is None:
+            rep["file"] = ""
+        return rep
+
+
+def _is_duplicate_review(exc: IntegrityError) -> bool:
+    """
+    True if *exc* is a ``unique_review_per_business`` violation: Postgres
+    names the constraint, SQLite lists its columns.
+    """
+    message = str(exc)
+    return "unique_review_per_business" in message or (
+        "UNIQUE" in message and "business_user_id" in message and "reviewer_id" in message
+    )
+
+
+def _profile_of(user) -> UserProfile:
+    """Return the (select_related) profile or an unsaved empty placeholder."""
+    try:
+        return user.userprofile
+    except ObjectDoesNotExist:
+        return UserProfile(user=user)
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     """
     Serializer for the *Review* model.
@@ -10,8 +52,13 @@ class ReviewSerializer(serializers.ModelSerializer):
     * `business_user`  – primary‑key of a user whose role is **business**
     * `reviewer`       – set automatically from the request user
     * `rating`         – integer between 1 and 5
+
+    A customer may review any given business account **only once**.
     """
 
+    DUPLICATE_MESSAGE = "You have already reviewed this business."
+    EXPANDABLE = ("reviewer", "business_user")
+
     class Meta:
         model = Review
         fields = [
@@ -39,20 +86,39 @@ class ReviewSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("business_user must have role 'business'.")
         return value
 
-    def validate(self, data):
+    def to_representation(self, instance):
         """
-        Prevent duplicate reviews: a customer may review any given business
-        account **only once**.
+        Add ``<field>_details`` for every user field listed in the
+        ``expand`` context entry; the plain IDs stay untouched.
         """
-        request = self.context.get("request")
-        user = request.user if request else None
-        business_user = data.get("business_user") or (
-            self.instance.business_user if self.instance else None
-        )
-
-        if self.instance is None and user and business_user:
-            if Review.objects.filter(business_user=business_user, reviewer=user).exists():
-                raise serializers.ValidationError(
-                    "You have already reviewed this business."
-                )
-        return data
+        rep = super().to_representation(instance)
+        for field in self.context.get("expand", ()):
+            rep[f"{field}_details"] = ReviewUserDetailsSerializer(
+                _profile_of(getattr(instance, field)), context=self.context
+            ).data
+        return rep
+
+    def _save_unique(self, save, *args):
+        """
+        Run *save* and map a violation of the ``unique_review_per_business``
+        constraint to the duplicate‑review error; other integrity errors
+        propagate.
+
+        No ``exists()`` pre‑check: the INSERT itself rejects duplicates,
+        which also holds for concurrent submissions.
+        """
+        try:
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError as exc:
+            if not _is_duplicate_review(exc):
+                raise
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [self.DUPLICATE_MESSAGE]}
+            ) from exc
+
+    def create(self, validated_data):
+        return self._save_unique(super().create, validated_data)
+
+    def update(self, instance, validated_data):
+        return self._save_unique(super().update, instance, validated_data)
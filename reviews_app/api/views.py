@@ -5,6 +5,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 
 from reviews_app.models import Review
+from users_app.models import UserProfile
 from .serializers import ReviewSerializer
 from .permissions import IsReviewerOrReadOnly
 
@@ -12,16 +13,33 @@ from .permissions import IsReviewerOrReadOnly
 class ReviewViewSet(ModelViewSet):
     """
     CRUD endpoint for **Review** objects.
+
+    ``?expand=reviewer,business_user`` embeds username, name and picture
+    of the referenced users (``<field>_details``), fetched in the same
+    query as the reviews.
     """
 
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated, IsReviewerOrReadOnly]
     pagination_class = None
+    query_budget = {"GET": 3}   # token + list (expand via select_related)
     filter_backends  = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = {"business_user": ["exact"], "reviewer": ["exact"]}
     ordering_fields  = ["updated_at", "rating"]
     ordering         = ["-updated_at"]
+
+    def _expand(self) -> list[str]:
+        """Return the valid, de‑duplicated entries of ``?expand=``."""
+        raw = self.request.query_params.get("expand", "")
+        requested = {part.strip() for part in raw.split(",")}
+        return [f for f in ReviewSerializer.EXPANDABLE if f in requested]
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["expand"] = self._expand()
+        return context
+
     def get_queryset(self):
         """
         Extend default queryset to honour the alias parameters
@@ -38,6 +56,9 @@ class ReviewViewSet(ModelViewSet):
         if r_id is not None:
             qs = qs.filter(reviewer_id=r_id)
 
+        expand = self._expand()
+        if expand:
+            qs = qs.select_related(*(f"{f}__userprofile" for f in expand))
         return qs
 
     def perform_create(self, serializer):
@@ -50,13 +71,20 @@ class ReviewViewSet(ModelViewSet):
         * legacy flag `user.userprofile.is_customer == True`
         """
         user = self.request.user
-        is_customer_role    = getattr(user, "role", None) == "customer"
-        is_customer_profile = (
-            hasattr(user, "userprofile")
-            and getattr(user.userprofile, "is_customer", False)
-        )
-
-        if not (is_customer_role or is_customer_profile):
+        if not self._is_customer(user):
             raise PermissionDenied("Only customers can create reviews.")
 
-        serializer.save(reviewer=user)
\ No newline at end of file
+        serializer.save(reviewer=user)
+
+    @staticmethod
+    def _is_customer(user) -> bool:
+        """
+        Resolve customer status with at most one query.
+
+        The role is checked first; only other roles fall back to the legacy
+        profile flag, read via ``exists()`` instead of loading – and possibly
+        failing to load – ``user.userprofile``.
+        """
+        if getattr(user, "role", None) == "customer":
+            return True
+        return UserProfile.objects.filter(user=user, is_customer=True).exists()
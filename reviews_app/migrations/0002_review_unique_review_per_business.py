@@ -0,0 +1,34 @@
+# Generated by Django 5.2.3 on 2026-10-19 09:39
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def drop_duplicate_reviews(apps, schema_editor):
+    # keep the newest review per (business_user, reviewer); PlatformStats
+    # is not adjusted – run `manage.py refresh_platform_stats` afterwards
+    Review = apps.get_model('reviews_app', 'Review')
+    reviews = Review.objects.using(schema_editor.connection.alias)
+    keep = (
+        reviews.values('business_user', 'reviewer')
+        .annotate(keep_id=Max('id'))
+        .values_list('keep_id', flat=True)
+    )
+    reviews.exclude(id__in=list(keep)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_reviews, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('business_user', 'reviewer'), name='unique_review_per_business'),
+        ),
+    ]
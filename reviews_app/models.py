@@ -1,9 +1,11 @@
 from django.db import models
 from django.conf import settings
 
+from core_utils.models import TracksLoadedValues
+
 User = settings.AUTH_USER_MODEL  # Always best practice with CustomUser
 
-class Review(models.Model):
+class Review(TracksLoadedValues, models.Model):
     """
     Model for reviews. Each review links a reviewer (user) to a business_user (user).
     """
@@ -22,10 +24,16 @@ class Review(models.Model):
     rating = models.PositiveSmallIntegerField()
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # incremental rollups (stats_app.rollups)
 
     class Meta:
         ordering = ["-updated_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_user", "reviewer"],
+                name="unique_review_per_business",
+            ),
+        ]
 
     def __str__(self):
         return f"Review {self.id} by {self.reviewer} for {self.business_user} ({self.rating})"
\ No newline at end of file
@@ -235,4 +235,132 @@ class TestReviewPOST:
         self.client.force_authenticate(user=self.customer2)
         url = reverse('review-detail', args=[review.id])
         response = self.client.delete(url)
-        assert response.status_code == 403
\ No newline at end of file
+        assert response.status_code == 403
+
+@pytest.mark.django_db
+class TestReviewUniqueConstraint:
+    def setup_method(self):
+        self.client = APIClient()
+        self.customer = User.objects.create_user(username='unique_kunde', password='pw123', role='customer')
+        self.business = User.objects.create_user(username='unique_biz', password='pw123', role='business')
+
+    def test_duplicate_rejected_by_constraint(self):
+        self.client.force_authenticate(user=self.customer)
+        url = reverse('review-list')
+        data = {"business_user": self.business.id, "rating": 4, "description": "Gut!"}
+
+        assert self.client.post(url, data).status_code == 201
+        response = self.client.post(url, data)
+        assert response.status_code == 400
+        assert "already reviewed" in str(response.data["non_field_errors"][0])
+        assert Review.objects.filter(reviewer=self.customer).count() == 1
+
+    def test_create_runs_no_duplicate_precheck(self, django_assert_num_queries):
+        self.client.force_authenticate(user=self.customer)
+        url = reverse('review-list')
+        data = {"business_user": self.business.id, "rating": 5, "description": "Top"}
+        # business_user lookup, savepoint, INSERT, release savepoint
+        # (the stats UPDATE runs on commit)
+        with django_assert_num_queries(4):
+            self.client.post(url, data)
+
+
+@pytest.mark.django_db
+class TestReviewCustomerCheck:
+    def setup_method(self):
+        self.client = APIClient()
+        self.business = User.objects.create_user(username='check_biz', password='pw123', role='business')
+        self.url = reverse('review-list')
+        self.data = {"business_user": self.business.id, "rating": 5, "description": "Top"}
+
+    def test_customer_role_skips_profile_query(self, django_assert_num_queries):
+        User.objects.create_user(username='check_kunde', password='pw123', role='customer')
+        customer = User.objects.get(username='check_kunde')  # no cached profile
+        self.client.force_authenticate(user=customer)
+        # business_user lookup, savepoint, INSERT, release savepoint
+        # (the stats UPDATE runs on commit)
+        with django_assert_num_queries(4):
+            response = self.client.post(self.url, self.data)
+        assert response.status_code == 201
+
+    def test_legacy_profile_flag_still_accepted(self):
+        legacy = User.objects.create_user(username='legacy', password='pw123', role='business')
+        UserProfile.objects.filter(user=legacy).update(is_customer=True)
+        self.client.force_authenticate(user=User.objects.get(pk=legacy.pk))
+        assert self.client.post(self.url, self.data).status_code == 201
+
+    def test_non_customer_rejected(self):
+        other = User.objects.create_user(username='other_biz', password='pw123', role='business')
+        self.client.force_authenticate(user=User.objects.get(pk=other.pk))
+        assert self.client.post(self.url, self.data).status_code == 403
+
+
+@pytest.mark.django_db
+class TestReviewExpand:
+    def setup_method(self):
+        self.client = APIClient()
+        self.business = User.objects.create_user(username='expand_biz', password='pw123', role='business')
+        UserProfile.objects.filter(user=self.business).update(first_name="Biz", last_name="Owner")
+        self.customers = [
+            User.objects.create_user(username=f'expand_kunde{i}', password='pw123', role='customer')
+            for i in range(3)
+        ]
+        for customer in self.customers:
+            Review.objects.create(
+                business_user=self.business, reviewer=customer, rating=4, description="ok"
+            )
+        self.client.force_authenticate(user=self.customers[0])
+
+    def test_expand_embeds_profile_chips(self):
+        response = self.client.get(reverse('review-list') + '?expand=reviewer,business_user')
+        assert response.status_code == 200
+        review = response.data[0]
+        assert review["business_user"] == self.business.id
+        assert review["business_user_details"] == {
+            "username": "expand_biz", "first_name": "Biz", "last_name": "Owner", "file": "",
+        }
+        assert review["reviewer_details"]["username"].startswith("expand_kunde")
+
+    def test_expand_uses_single_query(self, django_assert_num_queries):
+        url = reverse('review-list') + '?expand=reviewer,business_user'
+        with django_assert_num_queries(1):
+            self.client.get(url)
+
+    def test_without_expand_no_details(self):
+        response = self.client.get(reverse('review-list') + '?expand=bogus')
+        assert "reviewer_details" not in response.data[0]
+
+
+@pytest.mark.django_db
+class TestSaveUnique:
+    def test_other_integrity_errors_propagate(self):
+        from django.db import IntegrityError
+        from reviews_app.api.serializers import ReviewSerializer
+
+        def save():
+            raise IntegrityError("NOT NULL constraint failed: reviews_app_review.reviewer_id")
+
+        with pytest.raises(IntegrityError):
+            ReviewSerializer()._save_unique(save)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestUniqueConstraintMigration:
+    def test_keeps_newest_review_per_pair(self):
+        from django.db import connection
+        from django.db.migrations.executor import MigrationExecutor
+
+        customer = User.objects.create_user(username='mig_kunde', password='pw123', role='customer')
+        business = User.objects.create_user(username='mig_biz', password='pw123', role='business')
+
+        executor = MigrationExecutor(connection)
+        executor.migrate([('reviews_app', '0001_initial')])
+        try:
+            OldReview = executor.loader.project_state(('reviews_app', '0001_initial')).apps.get_model('reviews_app', 'Review')
+            for rating in (2, 5):
+                OldReview.objects.create(business_user_id=business.id, reviewer_id=customer.id, rating=rating, description="dup")
+        finally:
+            executor = MigrationExecutor(connection)
+            executor.migrate(executor.loader.graph.leaf_nodes())
+
+        assert list(Review.objects.values_list('rating', flat=True)) == [5]
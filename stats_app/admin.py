@@ -1,3 +1,38 @@
 from django.contrib import admin
+from .models import DailyBusinessStats, DailyOrderStats, PlatformStats
 
-# Register your models here.
+@admin.register(PlatformStats)
+class PlatformStatsAdmin(admin.ModelAdmin):
+    """
+    Read‑only view of the platform stats snapshot.
+
+    The counters are maintained with ``F()`` updates (``stats_app.signals``);
+    fix drift with ``manage.py refresh_platform_stats``, never by hand.
+    """
+    list_display = (
+        "review_count",
+        "average_rating",
+        "business_profile_count",
+        "offer_count",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailyOrderStats)
+class DailyOrderStatsAdmin(admin.ModelAdmin):
+    list_display = ("day", "business_user", "status", "order_count", "revenue")
+    list_filter = ("status",)
+
+
+@admin.register(DailyBusinessStats)
+class DailyBusinessStatsAdmin(admin.ModelAdmin):
+    list_display = ("day", "business_user", "new_offers", "review_count")
@@ -0,0 +1,22 @@
+"""
+Custom permission classes for the stats endpoints.
+"""
+
+from rest_framework.permissions import BasePermission
+
+
+class IsStatsOwnerOrStaff(BasePermission):
+    """
+    Business figures are visible to the business user itself and to staff.
+
+    The business is addressed by the ``business_user_id`` URL kwarg, so the
+    check runs before any stats query instead of on a fetched object.
+    """
+
+    message = "Only the business user or staff can view these stats."
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user.is_authenticated:
+            return False
+        return user.is_staff or user.id == view.kwargs.get("business_user_id")
@@ -0,0 +1,20 @@
+from django.urls import path
+from .views import BusinessDailyStatsView, BusinessDashboardView, BusinessStatsSummaryView
+
+urlpatterns = [
+    path(
+        "stats/business/<int:business_user_id>/daily/",
+        BusinessDailyStatsView.as_view(),
+        name="business-stats-daily",
+    ),
+    path(
+        "stats/business/<int:business_user_id>/summary/",
+        BusinessStatsSummaryView.as_view(),
+        name="business-stats-summary",
+    ),
+    path(
+        "stats/business/<int:business_user_id>/dashboard/",
+        BusinessDashboardView.as_view(),
+        name="business-dashboard",
+    ),
+]
@@ -0,0 +1,154 @@
+"""
+Dashboard endpoints served from the daily rollup tables.
+
+GET /api/stats/business/<id>/daily/    – one entry per day
+GET /api/stats/business/<id>/summary/  – totals over the range
+GET /api/stats/business/<id>/dashboard/ – live composite dashboard
+
+The first two accept ``?from=YYYY-MM-DD&to=YYYY-MM-DD`` (default: last 30 days)
+and never touch ``Order`` / ``Review`` / ``Offer`` – the figures are as
+fresh as the last ``manage.py rollup_stats`` run.  All three are visible to
+the business user itself and to staff only.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_utils.concurrency import run_concurrently
+from stats_app.api.permissions import IsStatsOwnerOrStaff
+from stats_app.dashboard import business_dashboard
+from stats_app.models import DailyBusinessStats, DailyOrderStats
+
+DEFAULT_RANGE_DAYS = 30
+RATINGS = DailyBusinessStats.RATING_FIELDS
+
+
+class _RollupRangeMixin:
+    """Shared ``?from`` / ``?to`` parsing; owner or staff only."""
+
+    permission_classes = [permissions.IsAuthenticated, IsStatsOwnerOrStaff]
+    query_budget = 3            # token + two rollup queries
+
+    def _date_range(self, request):
+        today = timezone.now().date()
+        start = parse_date(request.query_params.get("from", "") or "")
+        end = parse_date(request.query_params.get("to", "") or "")
+        end = end or today
+        start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+        return start, end
+
+    @staticmethod
+    def _histogram(row) -> dict:
+        return {str(i): row[field] or 0 for i, field in enumerate(RATINGS, start=1)}
+
+    def _invalid_range(self):
+        return Response(
+            {"detail": "'from' must not be after 'to'."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class BusinessDailyStatsView(_RollupRangeMixin, APIView):
+    """Daily orders (per status), revenue, new offers and reviews."""
+
+    def get(self, request, business_user_id):
+        start, end = self._date_range(request)
+        if start > end:
+            return self._invalid_range()
+
+        days = defaultdict(lambda: {
+            "orders": {}, "new_offers": 0, "review_count": 0,
+            "rating_histogram": {str(i): 0 for i in range(1, 6)},
+        })
+        for row in DailyOrderStats.objects.filter(
+            business_user_id=business_user_id, day__range=(start, end)
+        ).values("day", "status", "order_count", "revenue"):
+            days[row["day"]]["orders"][row["status"]] = {
+                "count": row["order_count"], "revenue": float(row["revenue"]),
+            }
+        for row in DailyBusinessStats.objects.filter(
+            business_user_id=business_user_id, day__range=(start, end)
+        ).values("day", "new_offers", "review_count", *RATINGS):
+            entry = days[row["day"]]
+            entry["new_offers"] = row["new_offers"]
+            entry["review_count"] = row["review_count"]
+            entry["rating_histogram"] = self._histogram(row)
+
+        return Response([{"day": day, **days[day]} for day in sorted(days)])
+
+
+class BusinessStatsSummaryView(_RollupRangeMixin, APIView):
+    """Totals over the range – two independent grouped queries on the rollups."""
+
+    def get(self, request, business_user_id):
+        start, end = self._date_range(request)
+        if start > end:
+            return self._invalid_range()
+        scope = {"business_user_id": business_user_id, "day__range": (start, end)}
+
+        def orders():
+            return {
+                row["status"]: {"count": row["count"], "revenue": float(row["revenue"] or 0)}
+                for row in DailyOrderStats.objects.filter(**scope)
+                .values("status")
+                .annotate(count=Sum("order_count"), revenue=Sum("revenue"))
+                .order_by()
+            }
+
+        def totals():
+            return DailyBusinessStats.objects.filter(**scope).aggregate(
+                new_offers=Sum("new_offers"),
+                review_count=Sum("review_count"),
+                **{field: Sum(field) for field in RATINGS},
+            )
+
+        results = run_concurrently({"orders": orders, "totals": totals})
+        orders, totals = results["orders"], results["totals"]
+        histogram = self._histogram(totals)
+        reviews = totals["review_count"] or 0
+        rating_sum = sum(int(k) * v for k, v in histogram.items())
+
+        return Response({
+            "from": start,
+            "to": end,
+            "orders": orders,
+            "new_offers": totals["new_offers"] or 0,
+            "review_count": reviews,
+            "average_rating": round(rating_sum / reviews, 1) if reviews else 0.0,
+            "rating_histogram": histogram,
+        })
+
+
+class BusinessDashboardView(APIView):
+    """
+    Profile, order counts, reviews and offers of one business user.
+
+    One cached payload instead of five separate requests; see
+    :mod:`stats_app.dashboard`.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsStatsOwnerOrStaff]
+    query_budget = 5            # token + four sections (0 when cached)
+
+    def get(self, request, business_user_id):
+        payload = business_dashboard(business_user_id)
+        if payload is None:
+            return Response(
+                {"detail": "Business user not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        # cached with relative media URLs – absolutise per request
+        profile = payload["profile"]
+        if profile["file"]:
+            profile["file"] = request.build_absolute_uri(profile["file"])
+        for offer in payload["offers"]["results"]:
+            if offer["image"]:
+                offer["image"] = request.build_absolute_uri(offer["image"])
+        return Response(payload)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class StatsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'stats_app'
+
+    def ready(self):
+        # Signal‑Registration (PlatformStats increments)
+        import stats_app.signals  # noqa: F401
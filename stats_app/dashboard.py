@@ -0,0 +1,122 @@
+"""
+Composite seller dashboard: profile, order counts, reviews and offers.
+
+Replaces five round trips (profile, ``order-count``, ``completed-order-count``,
+``reviews/?business_user_id=``, ``offers/?creator_id=``) with one payload
+built from four independent queries – one per section, the counts and the
+rating average as grouped aggregates.
+
+The four queries go through :func:`core_utils.concurrency.run_concurrently`
+(thread pool when ``CONCURRENT_QUERY_WORKERS`` > 0).
+
+The reviews and offers sections carry the totals and the newest
+``LIST_LIMIT`` entries; count and average rating come from window
+aggregates of the same query.
+
+The payload is cached per business user and dropped by ``stats_app.signals``
+once a change to one of its orders, offers, reviews or its profile has
+committed.
+
+Settings (optional)::
+
+    BUSINESS_DASHBOARD = {"CACHE_SECONDS": 30, "LIST_LIMIT": 20}
+"""
+
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Window
+
+from core_utils.concurrency import run_concurrently
+from core_utils.files import file_url
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+from users_app.api.serializers import BUSINESS_PROFILE_VALUES, business_profile_rows
+from users_app.models import UserProfile
+
+CACHE_KEY = "stats_app:dashboard:{user_id}"
+REVIEW_VALUES = ("id", "business_user", "reviewer", "rating", "description",
+                 "created_at", "updated_at")
+OFFER_VALUES = ("id", "title", "image", "description", "min_price",
+                "min_delivery_time", "created_at", "updated_at")
+
+
+def _options() -> dict:
+    return {"CACHE_SECONDS": 30, "LIST_LIMIT": 20, **getattr(settings, "BUSINESS_DASHBOARD", {})}
+
+
+# ---------------------------------------------------------------------
+# sections – one query each
+# ---------------------------------------------------------------------
+def _profile(user_id):
+    rows = UserProfile.objects.filter(user_id=user_id, user__role="business").values(
+        *BUSINESS_PROFILE_VALUES
+    )[:1]
+    profiles = business_profile_rows(rows)
+    return profiles[0] if profiles else None
+
+
+def _orders(user_id) -> dict:
+    return Order.objects.filter(business_user_id=user_id).aggregate(
+        order_count=Count("id", filter=Q(status="in_progress")),
+        completed_order_count=Count("id", filter=Q(status="completed")),
+        cancelled_order_count=Count("id", filter=Q(status="cancelled")),
+    )
+
+
+def _reviews(user_id) -> dict:
+    results = list(
+        Review.objects.filter(business_user_id=user_id)
+        .annotate(total=Window(Count("id")), average=Window(Avg("rating")))
+        .order_by("-updated_at")
+        .values(*REVIEW_VALUES, "total", "average")[:_options()["LIST_LIMIT"]]
+    )
+    count = results[0]["total"] if results else 0
+    average = results[0]["average"] if results else 0
+    for row in results:
+        del row["total"], row["average"]
+    return {"count": count, "average_rating": round(average, 1), "results": results}
+
+
+def _offers(user_id) -> dict:
+    results = list(
+        Offer.objects.filter(user_id=user_id)
+        .annotate(total=Window(Count("id")))
+        .order_by("-updated_at")
+        .values(*OFFER_VALUES, "total")[:_options()["LIST_LIMIT"]]
+    )
+    count = results[0]["total"] if results else 0
+    image_storage = Offer._meta.get_field("image").storage
+    for row in results:
+        del row["total"]
+        row["image"] = file_url(row["image"], storage=image_storage)
+        row["min_price"] = float(row["min_price"]) if row["min_price"] is not None else None
+    return {"count": count, "results": results}
+
+
+SECTIONS = {"profile": _profile, "orders": _orders, "reviews": _reviews, "offers": _offers}
+
+
+def build_dashboard(user_id) -> dict | None:
+    """Return the dashboard of business user *user_id* (``None`` if unknown)."""
+    data = run_concurrently({name: partial(fn, user_id) for name, fn in SECTIONS.items()})
+    if data["profile"] is None:
+        return None
+    return {"business_user": int(user_id), **data}
+
+
+def business_dashboard(user_id) -> dict | None:
+    """Cached :func:`build_dashboard`; unknown users are not cached."""
+    key = CACHE_KEY.format(user_id=user_id)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_dashboard(user_id)
+        if payload is not None:
+            cache.set(key, payload, _options()["CACHE_SECONDS"])
+    return payload
+
+
+def invalidate_dashboard(user_id) -> None:
+    cache.delete(CACHE_KEY.format(user_id=user_id))
@@ -0,0 +1,23 @@
+"""
+Recompute the ``PlatformStats`` snapshot behind ``/api/base-info/``.
+
+Signals keep the snapshot current for regular writes; schedule this
+command (e.g. hourly cron) to correct drift from bulk operations.
+"""
+
+from django.core.management.base import BaseCommand
+
+from stats_app.models import PlatformStats
+
+
+class Command(BaseCommand):
+    help = "Recompute the platform stats snapshot from the source tables."
+
+    def handle(self, *args, **options):
+        stats = PlatformStats.refresh()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"reviews={stats.review_count} avg={stats.average_rating} "
+                f"business={stats.business_profile_count} offers={stats.offer_count}"
+            )
+        )
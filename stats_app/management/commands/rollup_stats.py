@@ -0,0 +1,37 @@
+"""
+Update the daily dashboard rollups incrementally.
+
+Only rows changed since the last run (``updated_at`` watermark) are read;
+schedule it e.g. every few minutes.  ``--full`` rebuilds all rollups,
+which also accounts for deleted orders, offers and reviews.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from stats_app.rollups import DEFAULT_OVERLAP, run_rollups
+
+
+class Command(BaseCommand):
+    help = "Roll up orders, offers and reviews into the daily stats tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Rebuild from scratch.")
+        parser.add_argument(
+            "--overlap",
+            type=int,
+            default=int(DEFAULT_OVERLAP.total_seconds()),
+            help="Seconds re‑read before each watermark (late commits).",
+        )
+
+    def handle(self, *args, **options):
+        result = run_rollups(
+            full=options["full"], overlap=timedelta(seconds=options["overlap"])
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rolled up {result['orders']} order row(s), "
+                f"{result['business']} business row(s)."
+            )
+        )
@@ -1,3 +1,146 @@
-from django.db import models
+"""
+Precomputed platform figures served by ``/api/base-info/``.
+"""
 
-# Create your models here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import models, router, transaction
+from django.db.models import Count, F, Sum
+
+
+class PlatformStats(models.Model):
+    """
+    Single‑row snapshot of the platform counters.
+
+    Kept current by ``stats_app.signals`` (atomic ``F()`` increments once a
+    review, offer or user write has committed); ``refresh()`` recomputes it from
+    scratch – on first use and via ``manage.py refresh_platform_stats``
+    for writes that bypass signals (``bulk_create``, raw SQL).
+    """
+    SINGLETON_ID = 1
+
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "platform stats"
+
+    def __str__(self):  # pragma: no cover
+        return f"PlatformStats ({self.updated_at:%Y-%m-%d %H:%M})"
+
+    @property
+    def average_rating(self) -> float:
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @classmethod
+    def load(cls) -> "PlatformStats":
+        """Return the snapshot, computing it if it does not exist yet."""
+        stats = cls.objects.filter(pk=cls.SINGLETON_ID).first()
+        return stats if stats is not None else cls.refresh()
+
+    @classmethod
+    async def aload(cls) -> "PlatformStats":
+        """Async :meth:`load` (the rare refresh runs in a worker thread)."""
+        stats = await cls.objects.filter(pk=cls.SINGLETON_ID).afirst()
+        return stats if stats is not None else await sync_to_async(cls.refresh)()
+
+    @classmethod
+    def refresh(cls) -> "PlatformStats":
+        """
+        Recompute all counters with one query per source table.
+
+        Counts are read from the database the row is written to, never from
+        a possibly lagging read replica.
+        """
+        from auth_app.models import CustomUser
+        from offers_app.models import Offer
+        from reviews_app.models import Review
+
+        db = router.db_for_write(cls)
+        with transaction.atomic(using=db):
+            reviews = Review.objects.using(db).aggregate(count=Count("id"), total=Sum("rating"))
+            stats, _ = cls.objects.using(db).update_or_create(
+                pk=cls.SINGLETON_ID,
+                defaults={
+                    "review_count": reviews["count"],
+                    "rating_sum": reviews["total"] or 0,
+                    "business_profile_count": CustomUser.objects.using(db).filter(
+                        role=CustomUser.Roles.BUSINESS
+                    ).count(),
+                    "offer_count": Offer.objects.using(db).count(),
+                },
+            )
+        return stats
+
+    @classmethod
+    def bump(cls, **deltas: int) -> None:
+        """Apply counter deltas in one UPDATE (full refresh if missing)."""
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            cls.refresh()
+
+
+# ---------------------------------------------------------------------
+# Daily rollups (filled by ``manage.py rollup_stats``)
+# ---------------------------------------------------------------------
+class DailyOrderStats(models.Model):
+    """Orders created on ``day`` for one business user, per current status."""
+    day = models.DateField()
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    status = models.CharField(max_length=20)
+    order_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_user", "day", "status"],
+                name="unique_daily_order_stats",
+            ),
+        ]
+
+
+class DailyBusinessStats(models.Model):
+    """New offers and reviews (with rating histogram) per business and day."""
+    day = models.DateField()
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    new_offers = models.PositiveIntegerField(default=0)
+    review_count = models.PositiveIntegerField(default=0)
+    rating_1 = models.PositiveIntegerField(default=0)
+    rating_2 = models.PositiveIntegerField(default=0)
+    rating_3 = models.PositiveIntegerField(default=0)
+    rating_4 = models.PositiveIntegerField(default=0)
+    rating_5 = models.PositiveIntegerField(default=0)
+
+    RATING_FIELDS = ("rating_1", "rating_2", "rating_3", "rating_4", "rating_5")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_user", "day"],
+                name="unique_daily_business_stats",
+            ),
+        ]
+
+
+class RollupWatermark(models.Model):
+    """Highest ``updated_at`` of a source table already rolled up."""
+    source = models.CharField(max_length=50, unique=True)
+    value = models.DateTimeField()
+
+    def __str__(self):  # pragma: no cover
+        return f"{self.source} @ {self.value:%Y-%m-%d %H:%M:%S}"
@@ -0,0 +1,164 @@
+"""
+Incremental daily rollups for the business dashboards.
+
+Each run looks only at source rows whose ``updated_at`` is newer than the
+stored :class:`~stats_app.models.RollupWatermark` of that source.  Those
+rows name the affected *partitions* – ``(business_user_id, day)`` with
+``day = created_at::date`` – and exactly these partitions are recomputed
+from the source tables with grouped aggregates and rewritten.
+
+Deleted source rows leave no ``updated_at`` trace; run with ``full=True``
+(``manage.py rollup_stats --full``) to rebuild everything from scratch.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+from stats_app.models import DailyBusinessStats, DailyOrderStats, RollupWatermark
+
+# watermark name → (model, business‑user field)
+SOURCES = {
+    "orders": (Order, "business_user_id"),
+    "offers": (Offer, "user_id"),
+    "reviews": (Review, "business_user_id"),
+}
+DEFAULT_OVERLAP = timedelta(minutes=1)
+USERS_PER_QUERY = 100
+
+
+def _changed_partitions(source: str, since) -> tuple[set, object]:
+    """Return the partitions touched since *since* and the new high mark."""
+    model, user_field = SOURCES[source]
+    qs = model.objects.all()
+    if since is not None:
+        qs = qs.filter(updated_at__gt=since)
+    high = qs.aggregate(high=Max("updated_at"))["high"]
+    partitions = set(
+        qs.annotate(day=TruncDate("created_at"))
+        .values_list(user_field, "day")
+        .order_by()
+        .distinct()
+    )
+    return partitions, high
+
+
+def _partition_filters(partitions: set, user_field: str):
+    """Yield ``Q`` objects covering *partitions* in bounded chunks."""
+    days_by_user = defaultdict(set)
+    for user_id, day in partitions:
+        days_by_user[user_id].add(day)
+    users = sorted(days_by_user)
+    for i in range(0, len(users), USERS_PER_QUERY):
+        q = Q()
+        for user_id in users[i:i + USERS_PER_QUERY]:
+            q |= Q(**{user_field: user_id, "created_at__date__in": days_by_user[user_id]})
+        yield q
+
+
+def _delete_partitions(model, partitions: set) -> None:
+    days_by_user = defaultdict(set)
+    for user_id, day in partitions:
+        days_by_user[user_id].add(day)
+    for user_id, days in days_by_user.items():
+        model.objects.filter(business_user_id=user_id, day__in=days).delete()
+
+
+def _grouped(model, user_field: str, partitions: set, group=(), **aggregates):
+    """Grouped aggregate rows ``(user, day, *group, …)`` restricted to *partitions*."""
+    for q in _partition_filters(partitions, user_field):
+        yield from (
+            model.objects.filter(q)
+            .annotate(day=TruncDate("created_at"))
+            .values(user_field, "day", *group)
+            .annotate(**aggregates)
+            .order_by()
+        )
+
+
+def _rollup_orders(partitions: set) -> int:
+    _delete_partitions(DailyOrderStats, partitions)
+    rows = [
+        DailyOrderStats(
+            business_user_id=row["business_user_id"],
+            day=row["day"],
+            status=row["status"],
+            order_count=row["order_count"],
+            revenue=row["revenue"] or 0,
+        )
+        for row in _grouped(
+            Order, "business_user_id", partitions, group=("status",),
+            order_count=Count("id"), revenue=Sum("price"),
+        )
+    ]
+    DailyOrderStats.objects.bulk_create(rows)
+    return len(rows)
+
+
+def _rollup_business(partitions: set) -> int:
+    _delete_partitions(DailyBusinessStats, partitions)
+    stats = {}
+
+    def row_for(user_id, day):
+        key = (user_id, day)
+        if key not in stats:
+            stats[key] = DailyBusinessStats(business_user_id=user_id, day=day)
+        return stats[key]
+
+    for row in _grouped(Offer, "user_id", partitions, new_offers=Count("id")):
+        row_for(row["user_id"], row["day"]).new_offers = row["new_offers"]
+
+    histogram = {
+        field: Count("id", filter=Q(rating=i))
+        for i, field in enumerate(DailyBusinessStats.RATING_FIELDS, start=1)
+    }
+    for row in _grouped(
+        Review, "business_user_id", partitions, review_count=Count("id"), **histogram
+    ):
+        target = row_for(row["business_user_id"], row["day"])
+        target.review_count = row["review_count"]
+        for field in DailyBusinessStats.RATING_FIELDS:
+            setattr(target, field, row[field])
+
+    DailyBusinessStats.objects.bulk_create(stats.values())
+    return len(stats)
+
+
+@transaction.atomic
+def run_rollups(full: bool = False, overlap: timedelta = DEFAULT_OVERLAP) -> dict:
+    """
+    Bring the rollup tables up to date and return per‑table row counts.
+
+    *overlap* re‑reads a short window before each watermark so rows that
+    committed late with an older ``updated_at`` are not missed.
+    """
+    if full:
+        DailyOrderStats.objects.all().delete()
+        DailyBusinessStats.objects.all().delete()
+        RollupWatermark.objects.all().delete()
+
+    marks = dict(RollupWatermark.objects.values_list("source", "value"))
+    changed, highs = {}, {}
+    for source in SOURCES:
+        since = marks.get(source)
+        changed[source], highs[source] = _changed_partitions(
+            source, since - overlap if since else None
+        )
+
+    result = {
+        "orders": _rollup_orders(changed["orders"]) if changed["orders"] else 0,
+        "business": (
+            _rollup_business(changed["offers"] | changed["reviews"])
+            if changed["offers"] or changed["reviews"] else 0
+        ),
+    }
+    for source, high in highs.items():
+        if high is not None:
+            RollupWatermark.objects.update_or_create(source=source, defaults={"value": high})
+    return result
@@ -0,0 +1,144 @@
+"""
+Incremental maintenance of :class:`stats_app.models.PlatformStats`.
+
+The PlatformStats handlers issue a single ``UPDATE … SET x = x + delta``
+*after* the triggering write has committed (``transaction.on_commit``):
+rolled back writes are never counted, and the shared row is locked only
+for that short UPDATE instead of for the whole surrounding transaction.
+A crash between the two leaves the snapshot slightly off until the next
+``manage.py refresh_platform_stats``.
+
+Previous ratings / roles come from the values the instance was loaded
+with (:class:`core_utils.models.TracksLoadedValues`); unchanged fields
+cost nothing.
+
+The remaining handlers drop the cached seller dashboard
+(:mod:`stats_app.dashboard`) of the affected business user.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from auth_app.models import CustomUser
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+from stats_app.dashboard import invalidate_dashboard
+from stats_app.models import PlatformStats
+from users_app.models import UserProfile
+
+BUSINESS = CustomUser.Roles.BUSINESS
+UNCHANGED = object()
+
+
+def _previous_value(instance, field: str, update_fields=None):
+    """
+    Value of *field* before this save: ``None`` for new rows, ``UNCHANGED``
+    when the save does not change it.  Only instances that were not read
+    through the ORM need a SELECT.
+    """
+    if instance._state.adding or instance.pk is None:
+        return None
+    if not instance.changed_fields(field, update_fields=update_fields):
+        return UNCHANGED
+    value = instance.loaded_value(field, UNCHANGED)
+    if value is not UNCHANGED:
+        return value
+    return (
+        type(instance).objects.filter(pk=instance.pk)
+        .values_list(field, flat=True)
+        .first()
+    )
+
+
+def _bump_on_commit(**deltas: int) -> None:
+    if any(deltas.values()):
+        transaction.on_commit(partial(PlatformStats.bump, **deltas))
+
+
+# ---------------------------------------------------------------------
+# reviews
+# ---------------------------------------------------------------------
+@receiver(pre_save, sender=Review)
+def remember_review_rating(sender, instance: Review, update_fields=None, **kwargs):
+    instance._stats_old_rating = _previous_value(instance, "rating", update_fields)
+
+
+@receiver(post_save, sender=Review)
+def count_review(sender, instance: Review, created: bool, **kwargs):
+    if created:
+        _bump_on_commit(review_count=1, rating_sum=instance.rating)
+        return
+    old = getattr(instance, "_stats_old_rating", UNCHANGED)
+    if old is not UNCHANGED and old is not None:
+        _bump_on_commit(rating_sum=instance.rating - old)
+
+
+@receiver(post_delete, sender=Review)
+def uncount_review(sender, instance: Review, **kwargs):
+    _bump_on_commit(review_count=-1, rating_sum=-instance.rating)
+
+
+# ---------------------------------------------------------------------
+# offers
+# ---------------------------------------------------------------------
+@receiver(post_save, sender=Offer)
+def count_offer(sender, instance: Offer, created: bool, **kwargs):
+    if created:
+        _bump_on_commit(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def uncount_offer(sender, instance: Offer, **kwargs):
+    _bump_on_commit(offer_count=-1)
+
+
+# ---------------------------------------------------------------------
+# business users
+# ---------------------------------------------------------------------
+@receiver(pre_save, sender=CustomUser)
+def remember_user_role(sender, instance: CustomUser, update_fields=None, **kwargs):
+    instance._stats_old_role = _previous_value(instance, "role", update_fields)
+
+
+@receiver(post_save, sender=CustomUser)
+def count_business_user(sender, instance: CustomUser, created: bool, **kwargs):
+    old = getattr(instance, "_stats_old_role", UNCHANGED)
+    if old is UNCHANGED:
+        return
+    was_business = old == BUSINESS
+    is_business = instance.role == BUSINESS
+    _bump_on_commit(business_profile_count=int(is_business) - int(was_business))
+
+
+@receiver(post_delete, sender=CustomUser)
+def uncount_business_user(sender, instance: CustomUser, **kwargs):
+    if instance.role == BUSINESS:
+        _bump_on_commit(business_profile_count=-1)
+
+
+# ---------------------------------------------------------------------
+# seller dashboard cache
+# ---------------------------------------------------------------------
+DASHBOARD_OWNER = {
+    Order: "business_user_id",
+    Offer: "user_id",
+    Review: "business_user_id",
+    UserProfile: "user_id",
+    CustomUser: "pk",
+}
+
+
+def drop_dashboard(sender, instance, **kwargs):
+    # after commit – dropping earlier lets a concurrent reader re‑cache the
+    # old rows before the write becomes visible
+    owner_id = getattr(instance, DASHBOARD_OWNER[sender])
+    transaction.on_commit(partial(invalidate_dashboard, owner_id))
+
+
+for _model in DASHBOARD_OWNER:
+    post_save.connect(drop_dashboard, sender=_model, dispatch_uid=f"dashboard-save-{_model.__name__}")
+    post_delete.connect(drop_dashboard, sender=_model, dispatch_uid=f"dashboard-delete-{_model.__name__}")
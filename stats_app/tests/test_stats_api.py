@@ -0,0 +1,206 @@
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from auth_app.models import CustomUser
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+from stats_app.models import DailyBusinessStats, DailyOrderStats, RollupWatermark
+from stats_app.rollups import run_rollups
+
+
+@pytest.mark.django_db
+class TestDailyRollups:
+    def setup_method(self):
+        self.client = APIClient()
+        self.biz = CustomUser.objects.create_user(username="roll_biz", password="pw", role="business")
+        self.cust = CustomUser.objects.create_user(username="roll_cust", password="pw", role="customer")
+        self.client.force_authenticate(self.biz)
+
+    def _order(self, price, status="in_progress"):
+        return Order.objects.create(
+            customer_user=self.cust, business_user=self.biz, title="Logo",
+            price=price, offer_type="basic", status=status,
+        )
+
+    def _seed(self):
+        self._order("100.00", "completed")
+        self._order("50.00", "completed")
+        self._order("20.00")
+        Offer.objects.create(user=self.biz, title="Logo", description="Design")
+        Review.objects.create(business_user=self.biz, reviewer=self.cust, rating=4, description="ok")
+
+    def test_rollups_aggregate_per_day(self):
+        self._seed()
+        assert run_rollups() == {"orders": 2, "business": 1}
+
+        completed = DailyOrderStats.objects.get(business_user=self.biz, status="completed")
+        assert completed.order_count == 2
+        assert float(completed.revenue) == 150.0
+        daily = DailyBusinessStats.objects.get(business_user=self.biz)
+        assert (daily.new_offers, daily.review_count, daily.rating_4) == (1, 1, 1)
+        assert RollupWatermark.objects.count() == 3
+
+    def test_incremental_run_only_reads_changed_rows(self):
+        self._seed()
+        run_rollups()
+        # push watermarks past the overlap window → nothing changed
+        RollupWatermark.objects.update(value=timezone.now() + timedelta(minutes=5))
+        assert run_rollups() == {"orders": 0, "business": 0}
+
+        RollupWatermark.objects.update(value=timezone.now() - timedelta(minutes=5))
+        order = Order.objects.filter(status="in_progress").get()
+        order.status = "completed"
+        order.save()
+        run_rollups()
+        completed = DailyOrderStats.objects.get(business_user=self.biz, status="completed")
+        assert completed.order_count == 3
+        assert not DailyOrderStats.objects.filter(status="in_progress").exists()
+
+    @pytest.mark.parametrize("source", ["orders", "offers", "reviews"])
+    def test_changed_rows_are_found_via_index(self, source):
+        from stats_app.rollups import SOURCES
+
+        model, _ = SOURCES[source]
+        plan = model.objects.filter(updated_at__gt=timezone.now()).explain()
+        assert "updated_at" in plan
+        assert "USING INDEX" in plan
+
+    def test_full_rebuild_accounts_for_deletes(self):
+        self._seed()
+        run_rollups()
+        Review.objects.all().delete()
+        run_rollups(full=True)
+        assert DailyBusinessStats.objects.get(business_user=self.biz).review_count == 0
+
+    def test_endpoints_read_rollups_only(self, django_assert_num_queries):
+        self._seed()
+        run_rollups()
+        # source rows after the rollup are not visible until the next run
+        self._order("999.00", "completed")
+
+        url = reverse("business-stats-summary", kwargs={"business_user_id": self.biz.id})
+        with django_assert_num_queries(2):
+            response = self.client.get(url)
+        assert response.status_code == 200
+        assert response.data["orders"]["completed"] == {"count": 2, "revenue": 150.0}
+        assert response.data["review_count"] == 1
+        assert response.data["average_rating"] == 4.0
+        assert response.data["rating_histogram"]["4"] == 1
+
+        url = reverse("business-stats-daily", kwargs={"business_user_id": self.biz.id})
+        response = self.client.get(url)
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        assert response.data[0]["new_offers"] == 1
+
+    def test_endpoints_validate_range_and_auth(self):
+        url = reverse("business-stats-daily", kwargs={"business_user_id": self.biz.id})
+        assert self.client.get(url, {"from": "2025-02-01", "to": "2025-01-01"}).status_code == 400
+        assert APIClient().get(url).status_code == 401
+
+    @pytest.mark.parametrize("name", ["business-stats-daily", "business-stats-summary"])
+    def test_only_owner_and_staff_may_read(self, name):
+        other = CustomUser.objects.create_user(username="roll_other", password="pw", role="business")
+        staff = CustomUser.objects.create_user(username="roll_staff", password="pw", is_staff=True)
+        url = reverse(name, kwargs={"business_user_id": self.biz.id})
+        for user, expected in ((self.cust, 403), (other, 403), (staff, 200), (self.biz, 200)):
+            self.client.force_authenticate(user)
+            assert self.client.get(url).status_code == expected, user.username
+
+
+@pytest.mark.django_db
+class TestBusinessDashboard:
+    def setup_method(self):
+        self.client = APIClient()
+        self.biz = CustomUser.objects.create_user(username="dash_biz", password="pw", role="business")
+        self.cust = CustomUser.objects.create_user(username="dash_cust", password="pw", role="customer")
+        self.client.force_authenticate(self.biz)
+        for status in ("in_progress", "completed", "completed"):
+            Order.objects.create(
+                customer_user=self.cust, business_user=self.biz, title="Logo",
+                price="10.00", offer_type="basic", status=status,
+            )
+        Offer.objects.create(user=self.biz, title="Logo", description="Design", min_price="50.00")
+        Review.objects.create(business_user=self.biz, reviewer=self.cust, rating=5, description="great")
+        self.url = reverse("business-dashboard", kwargs={"business_user_id": self.biz.id})
+
+    def test_one_payload_four_queries_then_cached(self, django_assert_num_queries):
+        with django_assert_num_queries(4):
+            response = self.client.get(self.url)
+        assert response.status_code == 200
+        data = response.data
+        assert data["profile"]["username"] == "dash_biz"
+        assert data["orders"]["order_count"] == 1
+        assert data["orders"]["completed_order_count"] == 2
+        assert data["reviews"]["count"] == 1
+        assert data["reviews"]["average_rating"] == 5.0
+        assert data["offers"]["results"][0]["min_price"] == 50.0
+
+        with django_assert_num_queries(0):
+            assert self.client.get(self.url).data == data
+
+    def test_writes_invalidate_cache_on_commit(self, django_capture_on_commit_callbacks):
+        self.client.get(self.url)
+        with django_capture_on_commit_callbacks(execute=True):
+            Order.objects.create(
+                customer_user=self.cust, business_user=self.biz, title="Logo",
+                price="10.00", offer_type="basic",
+            )
+            # not committed yet – the cached payload is still served
+            assert self.client.get(self.url).data["orders"]["order_count"] == 1
+        assert self.client.get(self.url).data["orders"]["order_count"] == 2
+
+    def test_lists_are_capped_but_totals_are_not(self, settings):
+        settings.BUSINESS_DASHBOARD = {"CACHE_SECONDS": 30, "LIST_LIMIT": 2}
+        for i in range(2):
+            Offer.objects.create(user=self.biz, title=f"Offer {i}", description="Design")
+            reviewer = CustomUser.objects.create_user(username=f"dash_rev{i}", password="pw")
+            Review.objects.create(business_user=self.biz, reviewer=reviewer, rating=2, description="meh")
+        data = self.client.get(self.url).data
+        assert (data["offers"]["count"], len(data["offers"]["results"])) == (3, 2)
+        assert (data["reviews"]["count"], len(data["reviews"]["results"])) == (3, 2)
+        assert data["reviews"]["average_rating"] == 3.0
+
+    def test_only_owner_and_staff_may_read(self):
+        other = CustomUser.objects.create_user(username="dash_other", password="pw", role="business")
+        staff = CustomUser.objects.create_user(username="dash_staff", password="pw", is_staff=True)
+        for user, expected in ((self.cust, 403), (other, 403), (staff, 200)):
+            self.client.force_authenticate(user)
+            assert self.client.get(self.url).status_code == expected, user.username
+
+    def test_unknown_or_customer_user_is_404(self):
+        self.client.force_authenticate(self.cust)
+        url = reverse("business-dashboard", kwargs={"business_user_id": self.cust.id})
+        assert self.client.get(url).status_code == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dashboard_thread_pool_matches_serial(settings):
+    from stats_app.dashboard import build_dashboard
+
+    biz = CustomUser.objects.create_user(username="pool_biz", password="pw", role="business")
+    Offer.objects.create(user=biz, title="Logo", description="Design")
+    serial = build_dashboard(biz.id)
+    settings.CONCURRENT_QUERY_WORKERS = 4
+    assert build_dashboard(biz.id) == serial
+
+
+@pytest.mark.django_db
+def test_platform_stats_admin_is_read_only():
+    from django.test import Client
+    from stats_app.models import PlatformStats
+
+    stats = PlatformStats.refresh()
+    admin_user = CustomUser.objects.create_superuser("stats_admin", "a@example.com", "pw")
+    client = Client()
+    client.force_login(admin_user)
+    base = "/admin/stats_app/platformstats/"
+    assert client.get(base).status_code == 200
+    assert client.get(f"{base}add/").status_code == 403
+    assert client.get(f"{base}{stats.pk}/delete/").status_code == 403
+    assert client.post(f"{base}{stats.pk}/change/", {"review_count": 99}).status_code == 403
+    assert PlatformStats.objects.get().review_count == 0
@@ -0,0 +1,36 @@
+"""
+Native async variant of :class:`BusinessProfileListView` (ASGI only).
+"""
+
+from asgiref.sync import sync_to_async
+
+from core_utils.async_views import AsyncAPIView
+from users_app.api.serializers import BUSINESS_PROFILE_VALUES, business_profile_rows
+from users_app.api.views import BusinessProfileListView
+from users_app.models import UserProfile
+
+
+class AsyncBusinessProfileListView(AsyncAPIView):
+    """
+    Full business profile list via async iteration.
+
+    ``?search=`` and pagination need DRF's filter / paginator machinery;
+    such requests are handed to the sync view in a worker thread.
+    """
+
+    authentication_required = True
+    query_budget = 3
+    sync_params = ("search", *BusinessProfileListView.page_query_params)
+    sync_view = staticmethod(sync_to_async(BusinessProfileListView.as_view()))
+
+    async def get(self, request):
+        if any(p in request.GET for p in self.sync_params):
+            return await self.sync_view(request)
+
+        rows = [
+            row
+            async for row in UserProfile.objects.filter(user__role="business")
+            .order_by("user__id")
+            .values(*BUSINESS_PROFILE_VALUES)
+        ]
+        return self.render(business_profile_rows(rows, request))
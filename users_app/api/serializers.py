@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from users_app.models import UserProfile
 from auth_app.models import CustomUser
+from users_app.search import SEARCH_FIELDS, reindex_profile
+from core_utils.files import file_url
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """
@@ -49,13 +51,17 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         Updates UserProfile and synchronizes email in related User object if needed.
+        Keeps the profile search index current when searchable fields change.
         """
         user_data = validated_data.pop("user", {})
         email = user_data.get("email")
         if email:
             instance.user.email = email
             instance.user.save()
-        return super().update(instance, validated_data)
+        instance = super().update(instance, validated_data)
+        if validated_data.keys() & set(SEARCH_FIELDS):
+            reindex_profile(instance)
+        return instance
 
 
 class BusinessProfileListSerializer(serializers.ModelSerializer):
@@ -102,6 +108,77 @@ class BusinessProfileListSerializer(serializers.ModelSerializer):
         return rep
 
 
+BUSINESS_PROFILE_VALUES = (
+    "user",
+    "user__username",
+    "first_name",
+    "last_name",
+    "file",
+    "location",
+    "tel",
+    "description",
+    "working_hours",
+    "user__role",
+)
+
+
+def _profile_file_url(name: str, request=None) -> str:
+    return file_url(name, request, UserProfile._meta.get_field("file").storage)
+
+
+def business_profile_rows(rows, request=None) -> list[dict]:
+    """
+    Fast path for :class:`BusinessProfileListSerializer`.
+
+    Turns ``queryset.values(*BUSINESS_PROFILE_VALUES)`` rows into the exact
+    representation of the serializer without instantiating models or
+    field objects.
+    """
+    data = []
+    for row in rows:
+        data.append({
+            "user": row["user"],
+            "username": row["user__username"],
+            "first_name": row["first_name"] or "",
+            "last_name": row["last_name"] or "",
+            "file": _profile_file_url(row["file"], request),
+            "location": row["location"] or "",
+            "tel": row["tel"] or "",
+            "description": row["description"] or "",
+            "working_hours": row["working_hours"] or "",
+            "type": row["user__role"],
+        })
+    return data
+
+
+PROFILE_SEARCH_VALUES = (
+    "id",
+    "user",
+    "user__username",
+    "first_name",
+    "last_name",
+    "file",
+    "location",
+    "user__role",
+)
+
+
+def profile_search_rows(rows, request=None) -> list[dict]:
+    """Compact typeahead entries built from ``values(*PROFILE_SEARCH_VALUES)``."""
+    return [
+        {
+            "user": row["user"],
+            "username": row["user__username"],
+            "first_name": row["first_name"] or "",
+            "last_name": row["last_name"] or "",
+            "file": _profile_file_url(row["file"], request),
+            "location": row["location"] or "",
+            "type": row["user__role"],
+        }
+        for row in rows
+    ]
+
+
 class CustomerProfileListSerializer(serializers.ModelSerializer):
     """
     Serializer for customer profile list with username and role readonly.
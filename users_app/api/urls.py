@@ -4,6 +4,7 @@ from .views import (
     CustomerProfileListView,
     BusinessProfileDetailView,
     BusinessProfileRefUpdateView,      
+    ProfileSearchView,
     UserProfileUniversalDetailView,
 )
 
@@ -28,6 +29,7 @@ urlpatterns = [
 
     path("profiles/business/", BusinessProfileListView.as_view(), name="business-profiles"),
     path("profiles/customer/", CustomerProfileListView.as_view(), name="customer-profiles"),
+    path("profiles/search/", ProfileSearchView.as_view(), name="profile-search"),
     
     path(
     "profiles/business/<str:ref>/",
@@ -7,6 +7,7 @@ from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, filters
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 from auth_app.models import CustomUser
 from users_app.models import UserProfile
@@ -15,7 +16,13 @@ from users_app.permissions import (
     IsProfileOwnerOrReadOnly,
 )
 
+from users_app.search import reindex_profile, search_profile_ids
+
 from .serializers import (
+    BUSINESS_PROFILE_VALUES,
+    PROFILE_SEARCH_VALUES,
+    business_profile_rows,
+    profile_search_rows,
     UserProfileSerializer,
     BusinessProfileListSerializer,
     CustomerProfileListSerializer,
@@ -32,22 +39,50 @@ class BusinessProfileRefUpdateView(generics.RetrieveUpdateAPIView):
     • Authenticated caller required  
     • Read access for everyone; write access only for the profile owner  
     • `ref` may be user‑ID, the alias ``ref<ID>`` or a username
+    • GET is a single read without transaction; a missing profile is
+      only created on writes
     """
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsProfileOwnerOrReadOnly]
 
-    @transaction.atomic
-    def get_object(self):
+    def _user_lookup(self) -> dict:
+        """Translate `ref` into ``CustomUser`` lookup kwargs."""
         ref = self.kwargs["ref"]
         if ref.lower().startswith("ref") and ref[3:].isdigit():
             ref = ref[3:]
+        key = "id" if ref.isdigit() else "username"
+        return {key: ref, "role": "business"}
+
+    def _read_profile(self, lookup: dict) -> UserProfile:
+        """
+        Fetch profile and user in one query; fall back to an unsaved
+        placeholder for business users without a profile row.
+        """
+        profile_lookup = {f"user__{k}": v for k, v in lookup.items()}
+        profile = (
+            UserProfile.objects.select_related("user")
+            .filter(**profile_lookup)
+            .first()
+        )
+        if profile is None:
+            profile = UserProfile(user=get_object_or_404(CustomUser, **lookup))
+        return profile
 
-        if ref.isdigit():
-            user = get_object_or_404(CustomUser, id=ref, role="business")
-        else:
-            user = get_object_or_404(CustomUser, username=ref, role="business")
+    @transaction.atomic
+    def _write_profile(self, lookup: dict) -> UserProfile:
+        """Create (and index) the profile lazily – writes only."""
+        user = get_object_or_404(CustomUser, **lookup)
+        profile, created = UserProfile.objects.get_or_create(user=user)
+        if created:
+            reindex_profile(profile, replace=False)
+        return profile
 
-        profile, _ = UserProfile.objects.get_or_create(user=user)
+    def get_object(self):
+        lookup = self._user_lookup()
+        if self.request.method in permissions.SAFE_METHODS:
+            profile = self._read_profile(lookup)
+        else:
+            profile = self._write_profile(lookup)
         self.check_object_permissions(self.request, profile)
         return profile
 
@@ -61,10 +96,14 @@ class BusinessProfileDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        qs = UserProfile.objects.filter(user__role="business")
-        if not qs.exists():
+        profile = (
+            UserProfile.objects.filter(user__role="business")
+            .select_related("user")
+            .first()
+        )
+        if profile is None:
             raise Http404("No business profile found")
-        return qs.first()
+        return profile
 
 
 # ---------------------------------------------------------------------
@@ -74,13 +113,17 @@ class BusinessProfileListView(generics.ListAPIView):
     """
     List **all** business profiles.
 
-    • Creates placeholder profiles for business users without one  
-    • Supports `?search=<term>` on username, first name, last name, location  
-    • No pagination → full list returned
+    • Read‑only: placeholder profiles are created by the ``post_save``
+      signal (and ``manage.py backfill_profiles``), never on GET  
+    • Supports `?search=<term>` on username, first name, last name, location  
+    • Full list by default; paginated when `?page` or `?page_size` is given  
+    • Rows are read via ``values()`` – no model instances are built
     """
     serializer_class = BusinessProfileListSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = None
+    query_budget = 3            # token + rows (+ count when paginated)
+    page_query_params = ("page", "page_size")
 
     # ← NEW: enable ?search=
     filter_backends = [filters.SearchFilter]
@@ -92,28 +135,17 @@ class BusinessProfileListView(generics.ListAPIView):
     ]
 
     def get_queryset(self):
-        business_users = CustomUser.objects.filter(role="business")
-        existing = set(
-            UserProfile.objects.filter(user__role="business")
-            .values_list("user_id", flat=True)
-        )
+        return UserProfile.objects.filter(user__role="business").order_by("user__id")
 
-        # create missing placeholder profiles
-        missing = [u for u in business_users if u.id not in existing]
-        UserProfile.objects.bulk_create(
-            [UserProfile(user=u) for u in missing],
-            ignore_conflicts=True,
-        )
+    def list(self, request, *args, **kwargs):
+        rows = self.filter_queryset(self.get_queryset()).values(*BUSINESS_PROFILE_VALUES)
 
-        return (
-            UserProfile.objects.filter(user__role="business")
-            .select_related("user")
-            .order_by("user__id")
-        )
+        if not any(p in request.query_params for p in self.page_query_params):
+            return Response(business_profile_rows(rows, request))
 
-    def list(self, request, *args, **kwargs):
-        data = self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data
-        return Response(data)
+        paginator = api_settings.DEFAULT_PAGINATION_CLASS()
+        page = paginator.paginate_queryset(rows, request, view=self)
+        return paginator.get_paginated_response(business_profile_rows(page, request))
 
 
 class CustomerProfileListView(generics.ListAPIView):
@@ -133,6 +165,42 @@ class CustomerProfileListView(generics.ListAPIView):
         )
 
 
+class ProfileSearchView(generics.GenericAPIView):
+    """
+    Typeahead for the "find a freelancer" box.
+
+    ``GET /api/profiles/search/?q=<term>&type=business|customer&limit=<n>``
+    returns the top *n* (default 10, max 25) profiles from the search index
+    – prefix matches, with a fuzzy (trigram) fallback for typos.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4            # token + prefix ids (+ fuzzy) + rows, any word count
+    default_limit = 10
+    max_limit = 25
+    roles = {"business", "customer"}
+
+    def _limit(self) -> int:
+        raw = self.request.query_params.get("limit", "")
+        limit = int(raw) if raw.isdigit() else self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get(self, request, *args, **kwargs):
+        role = request.query_params.get("type")
+        ids = search_profile_ids(
+            request.query_params.get("q", ""),
+            role=role if role in self.roles else None,
+            limit=self._limit(),
+        )
+        if not ids:
+            return Response([])
+        rows = {
+            row["id"]: row
+            for row in UserProfile.objects.filter(id__in=ids).values(*PROFILE_SEARCH_VALUES)
+        }
+        ordered = [rows[pid] for pid in ids if pid in rows]
+        return Response(profile_search_rows(ordered, request))
+
+
 class UserProfileUniversalDetailView(generics.RetrieveUpdateAPIView):
     """
     Retrieve **or update** *any* profile (customer or business) by
@@ -143,9 +211,9 @@ class UserProfileUniversalDetailView(generics.RetrieveUpdateAPIView):
 
     def get_object(self):
         ref = self.kwargs["ref"]
-        if ref.isdigit():
-            profile = get_object_or_404(UserProfile, user__id=ref)
-        else:
-            profile = get_object_or_404(UserProfile, user__username=ref)
+        key = "user__id" if ref.isdigit() else "user__username"
+        profile = get_object_or_404(
+            UserProfile.objects.select_related("user"), **{key: ref}
+        )
         self.check_object_permissions(self.request, profile)
         return profile
@@ -0,0 +1,45 @@
+"""
+One‑off backfill: create placeholder profiles for users that have none.
+
+New users get their profile from ``users_app.signals.create_user_profile``;
+this command covers accounts created before that signal existed or via raw
+fixture loading.  ``bulk_create`` sends no ``post_save``, so the command
+indexes the new profiles for the typeahead itself.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from auth_app.models import CustomUser
+from users_app.models import UserProfile
+from users_app.search import reindex_profile
+
+
+class Command(BaseCommand):
+    help = "Create missing UserProfile rows for existing users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of profiles inserted per statement.",
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        missing = list(
+            CustomUser.objects.filter(userprofile__isnull=True).values_list("id", flat=True)
+        )
+        created = UserProfile.objects.bulk_create(
+            [UserProfile(user_id=user_id) for user_id in missing],
+            batch_size=options["batch_size"],
+            ignore_conflicts=True,
+        )
+        # ignore_conflicts leaves the pks unset – reload the profiles to index
+        profiles = UserProfile.objects.filter(user_id__in=missing).select_related("user")
+        for profile in profiles.iterator(chunk_size=options["batch_size"]):
+            reindex_profile(profile)
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(created)} missing profile(s).")
+        )
@@ -0,0 +1,27 @@
+"""
+Rebuild the typeahead search index for all profiles.
+
+Normally the index is kept current by ``users_app.signals`` and
+``UserProfileSerializer.update``; run this after bulk imports, raw SQL
+changes or the initial deployment of the index tables.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from users_app.models import ProfileSearchToken, ProfileSearchTrigram, UserProfile
+from users_app.search import reindex_profile
+
+
+class Command(BaseCommand):
+    help = "Rebuild ProfileSearchToken / ProfileSearchTrigram from scratch."
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        ProfileSearchToken.objects.all().delete()
+        ProfileSearchTrigram.objects.all().delete()
+        count = 0
+        for profile in UserProfile.objects.select_related("user").iterator():
+            reindex_profile(profile, replace=False)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} profile(s)."))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.3 on 2026-10-19 09:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0003_userprofile_is_customer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(max_length=20)),
+                ('token', models.CharField(max_length=100)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='users_app.userprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'role'], name='profile_token_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfileSearchTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(max_length=20)),
+                ('gram', models.CharField(max_length=3)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_trigrams', to='users_app.userprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['gram', 'role'], name='profile_trigram_idx')],
+            },
+        ),
+    ]
@@ -24,4 +24,36 @@ class UserProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self) -> str:  # pragma: no cover
-        return f"{self.user.username} Profile"
\ No newline at end of file
+        return f"{self.user.username} Profile"
+
+class ProfileSearchToken(models.Model):
+    """
+    Lower‑cased word of a profile's searchable fields (prefix matching).
+
+    Maintained by :mod:`users_app.search`; ``role`` is copied from the
+    user so the typeahead can filter without a join.
+    """
+    profile = models.ForeignKey(
+        UserProfile, on_delete=models.CASCADE, related_name="search_tokens"
+    )
+    role = models.CharField(max_length=20)
+    token = models.CharField(max_length=100)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["token", "role"], name="profile_token_idx"),
+        ]
+
+
+class ProfileSearchTrigram(models.Model):
+    """Three‑letter shingle of a search token (fuzzy matching)."""
+    profile = models.ForeignKey(
+        UserProfile, on_delete=models.CASCADE, related_name="search_trigrams"
+    )
+    role = models.CharField(max_length=20)
+    gram = models.CharField(max_length=3)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["gram", "role"], name="profile_trigram_idx"),
+        ]
@@ -0,0 +1,140 @@
+"""
+Profile search index for the "find a freelancer" typeahead.
+
+Every profile is broken down into lower‑cased word tokens (username, first
+name, last name, location) and their trigrams.  Both live in indexed tables,
+so a keystroke costs a couple of index range scans instead of unanchored
+``icontains`` scans over ``UserProfile``:
+
+* **prefix** – ``token >= q AND token < q + U+FFFF`` on ``profile_token_idx``,
+  one grouped query for all words of the search term
+* **fuzzy**  – shared trigrams counted per profile on ``profile_trigram_idx``
+  (fallback when nothing matches by prefix)
+
+The index is refreshed through :func:`reindex_profile` whenever a profile
+is created or updated, or its user's ``username`` / ``role`` changes;
+``manage.py rebuild_profile_search`` rebuilds it.
+"""
+
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Case, Count, Max, Min, Q, Value, When
+from django.db.models.functions import Length
+
+from users_app.models import ProfileSearchToken, ProfileSearchTrigram, UserProfile
+
+SEARCH_FIELDS = ("first_name", "last_name", "location")
+MIN_FUZZY_SIMILARITY = 0.5
+MIN_FUZZY_LENGTH = 3
+MAX_QUERY_WORDS = 5     # further words of a search term are ignored
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_PREFIX_END = "\uffff"
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lower‑cased word tokens."""
+    return [t[:100] for t in _WORD_RE.findall((text or "").lower())]
+
+
+def trigrams(token: str) -> set[str]:
+    """Return the padded trigrams of *token* (``pg_trgm`` style)."""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def profile_tokens(profile: UserProfile) -> set[str]:
+    """Collect the searchable tokens of *profile* and its user."""
+    tokens = set(tokenize(profile.user.username))
+    for field in SEARCH_FIELDS:
+        tokens.update(tokenize(getattr(profile, field)))
+    return tokens
+
+
+@transaction.atomic
+def reindex_profile(profile: UserProfile, replace: bool = True) -> None:
+    """
+    Write the index rows of a single *profile*.
+
+    ``replace=False`` skips deleting old rows – for freshly created profiles.
+    """
+    if replace:
+        ProfileSearchToken.objects.filter(profile=profile).delete()
+        ProfileSearchTrigram.objects.filter(profile=profile).delete()
+
+    role = profile.user.role
+    tokens = profile_tokens(profile)
+    grams = set().union(*(trigrams(t) for t in tokens)) if tokens else set()
+    ProfileSearchToken.objects.bulk_create(
+        [ProfileSearchToken(profile=profile, role=role, token=t) for t in tokens]
+    )
+    ProfileSearchTrigram.objects.bulk_create(
+        [ProfileSearchTrigram(profile=profile, role=role, gram=g) for g in grams]
+    )
+
+
+def _prefix(word: str) -> Q:
+    return Q(token__gte=word, token__lt=word + _PREFIX_END)
+
+
+def _prefix_matches(words: list[str], role: str | None, limit: int) -> list[int]:
+    """
+    IDs of profiles that have a token starting with *every* word.
+
+    One query: the token rows matching any word are grouped per profile,
+    and a profile is kept only if every word matched one of its tokens.
+    Ranked by whole‑word hits, then by the shortest matching token ("bern"
+    before "berlin" for "ber"); ``LIMIT`` is applied in SQL.
+    """
+    qs = ProfileSearchToken.objects.filter(reduce(or_, (_prefix(w) for w in words)))
+    if role:
+        qs = qs.filter(role=role)
+    per_word = {
+        f"word_{i}": Max(Case(When(_prefix(word), then=Value(1)), default=Value(0)))
+        for i, word in enumerate(words)
+    }
+    rows = (
+        qs.values("profile_id")
+        .annotate(**per_word)
+        .filter(**{name: 1 for name in per_word})
+        .annotate(exact=Count("id", filter=Q(token__in=words)), shortest=Min(Length("token")))
+        .order_by("-exact", "shortest", "profile_id")[:limit]
+    )
+    return [row["profile_id"] for row in rows]
+
+
+def _fuzzy_matches(words: list[str], role: str | None, limit: int) -> list[int]:
+    """IDs of profiles ranked by the number of shared trigrams."""
+    grams = set().union(*(trigrams(w) for w in words))
+    qs = ProfileSearchTrigram.objects.filter(gram__in=grams)
+    if role:
+        qs = qs.filter(role=role)
+    min_hits = max(1, round(len(grams) * MIN_FUZZY_SIMILARITY))
+    rows = (
+        qs.values("profile_id")
+        .annotate(hits=Count("id"))
+        .filter(hits__gte=min_hits)
+        .order_by("-hits", "profile_id")[:limit]
+    )
+    return [row["profile_id"] for row in rows]
+
+
+def search_profile_ids(query: str, role: str | None = None, limit: int = 10) -> list[int]:
+    """
+    Return up to *limit* profile IDs for *query*.
+
+    Prefix matches are returned as they are; only when there are none the
+    query falls back to fuzzy matching (words of at least
+    ``MIN_FUZZY_LENGTH`` letters), so typos ("jonh") still find "john".
+    Only the first ``MAX_QUERY_WORDS`` distinct words are used.
+    """
+    words = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_WORDS]
+    if not words:
+        return []
+    ids = _prefix_matches(words, role, limit)
+    if ids:
+        return ids
+    fuzzy_words = [w for w in words if len(w) >= MIN_FUZZY_LENGTH]
+    return _fuzzy_matches(fuzzy_words, role, limit) if fuzzy_words else []
@@ -4,12 +4,52 @@ from django.conf import settings
 
 from auth_app.models import CustomUser
 from users_app.models import UserProfile
+from users_app.search import reindex_profile
 
 
 @receiver(post_save, sender=CustomUser)
 def create_user_profile(sender, instance: CustomUser, created: bool, **kwargs):
     """
     Automatically create a matching UserProfile for every new CustomUser.
+
+    This is the only place where placeholder profiles are created; existing
+    users without one can be fixed with ``manage.py backfill_profiles``.
+    A freshly inserted user cannot own a profile yet, so no lookup is
+    needed before the INSERT (fixture loading is skipped via ``raw``).
+    The new profile is added to the typeahead search index right away.
+    """
+    if created and not kwargs.get("raw", False):
+        profile = UserProfile.objects.create(user=instance, is_customer=False)
+        reindex_profile(profile, replace=False)
+
+
+@receiver(post_save, sender=CustomUser)
+def reindex_user_profile(sender, instance: CustomUser, created: bool, update_fields=None, **kwargs):
+    """
+    The search index copies ``username`` and ``role`` – refresh it when
+    either one changes on an existing user.
+    """
+    if created or kwargs.get("raw", False):
+        return
+    if not instance.changed_fields("username", "role", update_fields=update_fields):
+        return
+    profile = UserProfile.objects.filter(user=instance).first()
+    if profile is not None:
+        profile.user = instance
+        reindex_profile(profile)
+
+
+def ensure_profile(user: CustomUser) -> UserProfile:
+    """
+    Return the profile of *user*, creating it only when it is missing.
+
+    A consistent user (the normal case – see ``create_user_profile``) costs
+    no write and, right after creation, not even a query thanks to the
+    cached reverse relation.  A created profile is indexed for the typeahead.
     """
-    if created and not hasattr(instance, "userprofile"):
-        UserProfile.objects.create(user=instance, is_customer=False)
\ No newline at end of file
+    try:
+        return user.userprofile
+    except UserProfile.DoesNotExist:
+        profile = UserProfile.objects.create(user=user, is_customer=False)
+        reindex_profile(profile, replace=False)
+        return profile
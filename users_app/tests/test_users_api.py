@@ -117,3 +117,320 @@ class TestUserProfilesAPI:
         data = {"first_name": "Hacker"}
         response = self.client_customer.patch(url, data, format="json")
         assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestBusinessProfileList:
+    """
+    Tests for the read‑only, values()‑based business profile list.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Create three business users (profiles via signal) and one customer.
+        """
+        self.business_users = [
+            CustomUser.objects.create_user(
+                username=f"biz_list_{i}", password="testpass123", role="business"
+            )
+            for i in range(3)
+        ]
+        CustomUser.objects.create_user(
+            username="cust_list", password="testpass123", role="customer"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_users[0])
+        self.url = reverse("business-profiles")
+
+    def test_get_does_not_write(self, django_assert_num_queries):
+        """
+        A GET runs exactly one SELECT and never creates profiles.
+        """
+        with django_assert_num_queries(1):
+            response = self.client.get(self.url)
+        assert response.status_code == 200
+        assert [p["username"] for p in response.data] == [
+            "biz_list_0", "biz_list_1", "biz_list_2",
+        ]
+
+    def test_fast_path_matches_serializer(self):
+        """
+        The values() rows render exactly like BusinessProfileListSerializer.
+        """
+        from users_app.api.serializers import BusinessProfileListSerializer
+
+        UserProfile.objects.filter(user=self.business_users[1]).update(
+            location="Berlin", file="profile_pics/a.png"
+        )
+        response = self.client.get(self.url)
+        profiles = UserProfile.objects.filter(user__role="business").order_by("user__id")
+        expected = BusinessProfileListSerializer(
+            profiles, many=True, context={"request": response.wsgi_request}
+        ).data
+        assert response.data == expected
+
+    def test_opt_in_pagination(self):
+        """
+        `?page_size` switches to the paginated envelope.
+        """
+        response = self.client.get(self.url, {"page_size": 2})
+        assert response.data["count"] == 3
+        assert len(response.data["results"]) == 2
+
+    def test_backfill_command_creates_missing_profiles(self):
+        """
+        `backfill_profiles` restores profiles removed behind the signal's back.
+        """
+        from django.core.management import call_command
+
+        UserProfile.objects.filter(user__in=self.business_users[1:]).delete()
+        call_command("backfill_profiles")
+        assert UserProfile.objects.filter(user__role="business").count() == 3
+
+    def test_backfilled_and_lazy_profiles_are_searchable(self):
+        """
+        Profiles created without ``post_save`` still reach the typeahead index.
+        """
+        from django.core.management import call_command
+        from users_app.signals import ensure_profile
+
+        backfilled, lazy = self.business_users[1:]
+        UserProfile.objects.filter(user__in=[backfilled, lazy]).delete()
+        call_command("backfill_profiles")
+        UserProfile.objects.filter(user=lazy).delete()
+        ensure_profile(CustomUser.objects.get(pk=lazy.pk))
+
+        for user in (backfilled, lazy):
+            response = self.client.get(reverse("profile-search"), {"q": user.username})
+            assert [p["username"] for p in response.data] == [user.username]
+
+
+@pytest.mark.django_db
+class TestBusinessProfileRefRead:
+    """
+    Tests for the read path of `profile/business/<ref>/`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Create a business owner and an authenticated client for it.
+        """
+        self.owner = CustomUser.objects.create_user(
+            username="ref_biz", password="testpass123", role="business"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def test_get_is_single_query_without_transaction(self, django_assert_num_queries):
+        """
+        Both the ID and username variants resolve with one plain SELECT.
+        """
+        for ref in (str(self.owner.id), f"ref{self.owner.id}", "ref_biz"):
+            url = reverse("business-profile-ref-update", kwargs={"ref": ref})
+            with django_assert_num_queries(1) as ctx:
+                response = self.client.get(url)
+            assert response.status_code == 200
+            assert response.data["username"] == "ref_biz"
+            assert "SAVEPOINT" not in ctx.captured_queries[0]["sql"]
+
+    def test_get_missing_profile_does_not_create(self):
+        """
+        GET renders a placeholder for a profile‑less user without writing.
+        """
+        UserProfile.objects.filter(user=self.owner).delete()
+        url = reverse("business-profile-ref-update", kwargs={"ref": self.owner.id})
+        response = self.client.get(url)
+        assert response.status_code == 200
+        assert not UserProfile.objects.filter(user=self.owner).exists()
+
+    def test_patch_creates_missing_profile(self):
+        """
+        Writes still create the profile lazily.
+        """
+        UserProfile.objects.filter(user=self.owner).delete()
+        url = reverse("business-profile-ref-update", kwargs={"ref": self.owner.id})
+        response = self.client.patch(url, {"location": "Zürich"}, format="json")
+        assert response.status_code == 200
+        assert UserProfile.objects.get(user=self.owner).location == "Zürich"
+        response = self.client.get(reverse("profile-search"), {"q": "ref_biz"})
+        assert [p["username"] for p in response.data] == ["ref_biz"]
+
+
+@pytest.mark.django_db
+class TestProfileLookupIndexes:
+    """
+    Query counts and index usage for role / username based profile lookups.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Create one business and one customer user.
+        """
+        self.business = CustomUser.objects.create_user(
+            username="idx_biz", password="testpass123", role="business"
+        )
+        self.customer = CustomUser.objects.create_user(
+            username="idx_cust", password="testpass123", role="customer"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.customer)
+
+    def test_universal_detail_single_join_query(self, django_assert_num_queries):
+        """
+        Profile and user are fetched together, by ID as well as by username.
+        """
+        for ref in (str(self.business.id), "idx_biz"):
+            url = reverse("user-profile-universal-detail", kwargs={"ref": ref})
+            with django_assert_num_queries(1):
+                response = self.client.get(url)
+            assert response.data["username"] == "idx_biz"
+
+    def test_business_detail_single_query(self, django_assert_num_queries):
+        """
+        The convenience endpoint no longer runs exists() + first().
+        """
+        with django_assert_num_queries(1):
+            response = self.client.get(reverse("business-profile-detail"))
+        assert response.status_code == 200
+
+    def test_role_filter_uses_index(self):
+        """
+        Filtering on `role` is served by the (role, id) index prefix.
+        """
+        plan = CustomUser.objects.filter(role="business").explain()
+        assert "user_role_id_idx" in plan
+
+    def test_username_ref_uses_unique_index(self):
+        """
+        `ref` matches usernames exactly – the unique username index serves
+        it, no case‑insensitive expression index is needed.
+        """
+        plan = (
+            UserProfile.objects.select_related("user")
+            .filter(user__username="idx_biz", user__role="business")
+            .explain()
+        )
+        assert "(username=?)" in plan
+
+
+@pytest.mark.django_db
+class TestProfileSearch:
+    """
+    Tests for the prefix / trigram typeahead at `profiles/search/`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Create a few business users and one customer with names and places.
+        """
+        people = [
+            ("jsmith", "business", "John", "Smith", "Berlin"),
+            ("jdoe", "business", "Jane", "Doe", "Bern"),
+            ("mmuster", "business", "Max", "Mustermann", "Zürich"),
+            ("jcustomer", "customer", "Johanna", "Kunde", "Basel"),
+        ]
+        self.client = APIClient()
+        for username, role, first, last, location in people:
+            user = CustomUser.objects.create_user(
+                username=username, password="testpass123", role=role
+            )
+            self.client.force_authenticate(user=user)
+            response = self.client.patch(
+                reverse("user-profile-universal-detail", kwargs={"ref": username}),
+                {"first_name": first, "last_name": last, "location": location},
+                format="json",
+            )
+            assert response.status_code == 200
+        self.url = reverse("profile-search")
+
+    def _usernames(self, **params):
+        response = self.client.get(self.url, params)
+        assert response.status_code == 200
+        return [p["username"] for p in response.data]
+
+    def test_prefix_match(self):
+        """
+        Prefixes of any indexed word match, optionally filtered by type.
+        """
+        assert self._usernames(q="ber") == ["jdoe", "jsmith"]
+        assert self._usernames(q="jo") == ["jsmith", "jcustomer"]
+        assert self._usernames(q="jo", type="business") == ["jsmith"]
+
+    def test_every_word_must_match(self):
+        """
+        Multi‑word queries intersect the prefix matches.
+        """
+        assert self._usernames(q="jane d") == ["jdoe"]
+
+    def test_many_words_stay_within_query_budget(self):
+        """
+        All words are matched in one query (budget enforced by the plugin).
+        """
+        assert self._usernames(q="jane doe bern") == ["jdoe"]
+        assert self._usernames(q="al be ga de ep ze et") == []
+
+    def test_fuzzy_match(self):
+        """
+        Typos are still found through shared trigrams.
+        """
+        assert "mmuster" in self._usernames(q="mustremann")
+
+    def test_limit_and_empty_query(self):
+        """
+        `limit` caps the result list; blank queries return nothing.
+        """
+        assert len(self._usernames(q="j", limit=1)) == 1
+        assert self._usernames(q="  ") == []
+
+    def test_update_reindexes_profile(self):
+        """
+        Saving a profile through the serializer refreshes its tokens.
+        """
+        self.client.patch(
+            reverse("user-profile-universal-detail", kwargs={"ref": "jcustomer"}),
+            {"location": "Genf"},
+            format="json",
+        )
+        assert self._usernames(q="genf") == ["jcustomer"]
+        assert "jcustomer" not in self._usernames(q="basel")
+
+    def test_ranked_by_relevance(self):
+        """
+        Whole‑word hits rank first, then the closest (shortest) token.
+        """
+        CustomUser.objects.create_user(username="jo", password="testpass123", role="customer")
+        assert self._usernames(q="jo") == ["jo", "jsmith", "jcustomer"]
+        assert self._usernames(q="jo", limit=1) == ["jo"]
+
+    def test_username_and_role_changes_reindex(self):
+        """
+        The index copies username and role – both follow user updates.
+        """
+        from users_app.models import ProfileSearchToken
+
+        user = CustomUser.objects.get(username="mmuster")
+        user.username = "mmeier"
+        user.role = "customer"
+        user.save()
+        tokens = set(ProfileSearchToken.objects.filter(profile__user=user).values_list("token", "role"))
+        assert ("mmeier", "customer") in tokens
+        assert not any(token == "mmuster" or role == "business" for token, role in tokens)
+        assert self._usernames(q="mmeier", type="customer") == ["mmeier"]
+        assert self._usernames(q="mmeier", type="business") == []
+
+    def test_rebuild_command(self):
+        """
+        `rebuild_profile_search` restores a wiped index.
+        """
+        from django.core.management import call_command
+        from users_app.models import ProfileSearchToken, ProfileSearchTrigram
+
+        ProfileSearchToken.objects.all().delete()
+        ProfileSearchTrigram.objects.all().delete()
+        assert self._usernames(q="zür") == []
+        call_command("rebuild_profile_search")
+        assert self._usernames(q="zür") == ["mmuster"]